@@ -1,17 +1,92 @@
+import argparse
+from startup import startup
 from gesture_processor import GestureProcessor
-from app_ui import Application
-from config_manager import load_config
+from config_manager import load_config, get_config_value, get_config_boolean
+from instrumentation import stats
+from events import events
+from smoothing import smoother_from_config
+from scrolling import scroll_engine_from_config
+from mouse_output import PynputMouse, AsyncMouseOutput, InterpolatingMouseOutput
+
+
+def parse_args():
+    """
+    Parse command-line options.
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(description="Control the mouse with hand gestures")
+    parser.add_argument("--record", metavar="PATH", help="record tracked landmarks to PATH for replay.py")
+    parser.add_argument("--headless", action="store_true",
+                        help="track without a window or preview (overrides the headless setting)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print how long each startup phase took once the hand model is ready")
+    return parser.parse_args()
+
 
 def run_app():
     """
     Main entry point for the NoMouse application.
-    Initializes the config, creates the gesture processor, and launches the UI.
+    Initializes the config, creates the gesture processor, and launches the UI,
+    or runs headless when requested on the command line or in settings.ini.
     """
+    # startup is imported first, so its origin marks the start of module imports
+    startup.stop("imports", startup.origin)
+    args = parse_args()
+    started = startup.start()
     config_data = load_config()
-    processor = GestureProcessor()
-    app = Application(processor)
-    app.protocol("WM_DELETE_WINDOW", app.on_close)
-    app.mainloop()
+    startup.stop("load config", started)
+    stats.enabled = get_config_boolean('instrumentation', 'enabled', True)
+    events.enabled = get_config_boolean('events', 'enabled', True)
+    log_file = get_config_value('events', 'log_file', '')
+    if events.enabled and log_file:
+        events.start_sink(log_file, max_bytes=int(get_config_value('events', 'log_max_kb', '1024')) * 1024,
+                          backups=int(get_config_value('events', 'log_backups', '3')))
+    started = startup.start()
+    mouse = PynputMouse()
+    if get_config_boolean('output', 'async', True):
+        mouse = AsyncMouseOutput(mouse, rate=float(get_config_value('output', 'rate', '250')))
+    interpolation = get_config_value('output', 'interpolation', 'off')
+    if interpolation != 'off':
+        mouse = InterpolatingMouseOutput(mouse, rate=float(get_config_value('output', 'interpolation_rate', '120')),
+                                         mode=interpolation)
+    startup.stop("mouse output", started)
+
+    started = startup.start()
+    processor = GestureProcessor(mouse=mouse, smoother=smoother_from_config(), scroller=scroll_engine_from_config(),
+                                 load_model=False)
+    startup.stop("gesture processor", started)
+    if get_config_boolean('inference', 'process', False):
+        processor.start_inference_process()
+    else:
+        # MediaPipe loads in the background while the window or headless pipeline starts
+        processor.warm_up(on_ready=(lambda: print(startup.report())) if args.profile_startup else None)
+    classifier_path = get_config_value('gestures', 'classifier', '')
+    if classifier_path:
+        try:
+            press_probability = float(get_config_value('gestures', 'classifier_probability', '0.8'))
+            processor.use_classifier(classifier_path, press_probability)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Error loading gesture classifier, using gesture rules: {e}")
+    if args.record:
+        processor.start_recording(args.record)
+
+    try:
+        if args.headless or get_config_boolean('application', 'headless', False):
+            # Imported here so headless runs never load Tk, ttkthemes or PIL.ImageTk
+            from headless import run_headless
+            run_headless(processor)
+            return
+
+        started = startup.start()
+        from app_ui import Application
+        app = Application(processor)
+        app.protocol("WM_DELETE_WINDOW", app.on_close)
+        startup.stop("window", started)
+        app.mainloop()
+    finally:
+        events.stop_sink()
 
 
 if __name__ == "__main__":
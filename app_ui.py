@@ -1,11 +1,14 @@
 import tkinter as tk
-from tkinter import ttk
-import time
-import cv2
-from PIL import Image, ImageTk
+from tkinter import ttk, filedialog
+from PIL import ImageTk
 from ttkthemes import ThemedTk, ThemedStyle
 from config_manager import save_config, get_config_value, set_config_value
-from utils import find_webcams
+from cameras import camera_discovery
+from pipeline import TrackingPipeline
+from preview import PreviewRenderer
+from instrumentation import stats
+from events import events, format_event
+from idle import idle_monitor_from_config
 
 
 class Application(ThemedTk):
@@ -41,6 +44,8 @@ class Application(ThemedTk):
         self.processor.set_camera_orientation(get_config_value('application', 'camera_orientation', 'Front Facing'))
 
         self.config_window = None
+        self.stats_window = None
+        self.events_window = None
 
         # main container frame
         self.main_container = ttk.Frame(self)
@@ -54,27 +59,38 @@ class Application(ThemedTk):
         self.settings_button = ttk.Button(self.top_frame, text="Settings", command=self.open_settings_window)
         self.settings_button.pack(side=tk.LEFT)
 
+        # latency statistics Button
+        self.stats_button = ttk.Button(self.top_frame, text="Latency", command=self.open_stats_window)
+        self.stats_button.pack(side=tk.LEFT, padx=5)
+        if not stats.enabled:
+            self.stats_button.config(state=tk.DISABLED)
+
+        # gesture event log Button
+        self.events_button = ttk.Button(self.top_frame, text="Events", command=self.open_events_window)
+        self.events_button.pack(side=tk.LEFT)
+        if not events.enabled:
+            self.events_button.config(state=tk.DISABLED)
+
         # frame for the video display
         self.video_frame = ttk.LabelFrame(self.main_container, text="Video Feed", padding=10)
         self.video_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
         self.video_label = ttk.Label(self.video_frame)
         self.video_label.pack(fill=tk.BOTH, expand=True)
+        self.preview_photo = None
 
         self.info_frame = ttk.Frame(self.main_container, padding=5)
         self.info_frame.pack(fill=tk.X, pady=5)
 
-        self.fps_label = ttk.Label(self.info_frame, text="FPS: 0", font=("Arial", 14))
-        self.fps_label.pack(side=tk.LEFT, padx=10)
+        self.latency_label = ttk.Label(self.info_frame, text="FPS: 0", font=("Arial", 14))
+        self.latency_label.pack(side=tk.LEFT, padx=10)
 
-        # Start the video capture
+        # Start the capture/inference pipeline off the Tk thread
         video_source = get_config_value('application', 'video_source', '0')
-        self.cap = cv2.VideoCapture(int(video_source))
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-
-        self.last_time = time.time()
-        self.frame_count = 0
+        renderer = PreviewRenderer(fps=float(get_config_value('preview', 'fps', '15')),
+                                   scale=float(get_config_value('preview', 'scale', '1.0')))
+        self.pipeline = TrackingPipeline(self.processor, int(video_source), renderer, idle_monitor_from_config())
+        self.pipeline.start()
 
         self.button_frame = ttk.Frame(self.main_container, padding=5)
         self.button_frame.pack(fill=tk.X, pady=5)
@@ -94,6 +110,8 @@ class Application(ThemedTk):
         self.update_background()
 
         self.update_video_frame()
+        self.update_latency_display()
+        self.update_model_status()
 
     def update_background(self):
         """
@@ -110,36 +128,172 @@ class Application(ThemedTk):
 
     def update_video_frame(self):
         """
-        Capture and process webcam frame to display in the UI.
-        Updates the video display with processed frames and calculates FPS.
+        Display the newest processed frame from the tracking pipeline.
+        Capture, inference and mouse control run on pipeline threads, so this
+        only pastes the latest preview image into a reused PhotoImage.
         Runs continuously using tkinter's after() method.
         """
-        ret, frame = self.cap.read()
-        if ret:
-            # Process the frame and get the result
-            if self.processor.camera_orientation == "Front Facing":
-                frame = cv2.flip(frame, 1)
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            result_image = self.processor.process_image(frame)
-
-            pil_image = Image.fromarray(result_image)
-            photo_image = ImageTk.PhotoImage(pil_image)
-
-            # Update the label with the new image
-            self.video_label.configure(image=photo_image)
-            self.video_label.image = photo_image
-
-            # FPS calculation
-            self.frame_count += 1
-            if time.time() - self.last_time >= 1:
-                fps = self.frame_count
-                self.fps_label.config(text=f"FPS: {fps}")
-                self.frame_count = 0
-                self.last_time = time.time()
+        pil_image = self.pipeline.latest_preview()
+        if pil_image is not None:
+            started = stats.start()
+            if self.preview_photo is None or (self.preview_photo.width(), self.preview_photo.height()) != pil_image.size:
+                # Only allocate a new Tk image when the preview size changes
+                self.preview_photo = ImageTk.PhotoImage(pil_image)
+                self.video_label.configure(image=self.preview_photo)
+            else:
+                self.preview_photo.paste(pil_image)
+            stats.stop("photo", started)
 
         # Update again after 10 ms
         self.after(10, self.update_video_frame)
 
+    def update_model_status(self):
+        """
+        Show "warming up" in the status bar while the hand model loads in the background.
+        Checks every 200 ms until the model is ready or has failed.
+        """
+        state = self.processor.model_state
+        if state == "warming up":
+            self.status_var.set("Warming up - loading hand model...")
+            self.after(200, self.update_model_status)
+        elif state == "failed":
+            self.status_var.set("Hand model failed to load")
+        elif self.status_var.get().startswith("Warming up"):
+            if self.processor.running:
+                self.status_var.set("Active - Tracking enabled")
+            else:
+                self.status_var.set("Ready - Not tracking")
+
+    def update_latency_display(self):
+        """
+        Refresh the tracking rate and cursor latency shown under the video feed.
+        Also refreshes the latency window if it is open.
+        Runs every half second using tkinter's after() method.
+        """
+        text = f"FPS: {self.pipeline.fps}"
+        idle = self.pipeline.idle
+        if idle.idle:
+            text += " (idle)"
+        if idle.idle_periods:
+            text += f"  |  Idle saved {idle.cpu_saved:.0f} s CPU"
+        summary = stats.summary() if stats.enabled else {}
+        if "cursor_age" in summary:
+            cursor_age = summary["cursor_age"]
+            text += f"  |  Cursor latency p50 {cursor_age['p50']:.0f} ms, p95 {cursor_age['p95']:.0f} ms"
+        model_mode = self.processor.model_mode
+        if model_mode is not None:
+            text += f"  |  Model: {model_mode}"
+        self.latency_label.config(text=text)
+
+        if self.stats_window and self.stats_window.winfo_exists():
+            self.stats_tree.delete(*self.stats_tree.get_children())
+            for stage, values in summary.items():
+                self.stats_tree.insert("", tk.END, values=(stage, values['count'], f"{values['p50']:.2f}",
+                                                           f"{values['p95']:.2f}", f"{values['p99']:.2f}"))
+
+        if self.events_window and self.events_window.winfo_exists():
+            self.refresh_events_list()
+
+        self.after(500, self.update_latency_display)
+
+    def open_stats_window(self):
+        """
+        Open a window listing rolling p50/p95/p99 latency for every pipeline stage,
+        with buttons to dump the statistics to CSV or JSON.
+        """
+        if self.stats_window and self.stats_window.winfo_exists():
+            self.stats_window.lift()
+            return
+
+        self.stats_window = tk.Toplevel(self)
+        self.stats_window.title("Latency")
+        self.stats_window.transient(self)
+
+        main_frame = ttk.Frame(self.stats_window, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        columns = ("stage", "count", "p50", "p95", "p99")
+        self.stats_tree = ttk.Treeview(main_frame, columns=columns, show="headings", height=len(stats.summary()) or 10)
+        for column in columns:
+            self.stats_tree.heading(column, text=column if column in ("stage", "count") else f"{column} (ms)")
+            self.stats_tree.column(column, width=90, anchor=tk.E if column != "stage" else tk.W)
+        self.stats_tree.pack(fill=tk.BOTH, expand=True)
+
+        def dump_stats(extension):
+            """
+            Ask for a file name and write the current statistics to it.
+
+            Args:
+                extension (str): 'csv' or 'json'
+            """
+            path = filedialog.asksaveasfilename(parent=self.stats_window, defaultextension=f".{extension}",
+                                                filetypes=[(extension.upper(), f"*.{extension}")])
+            if not path:
+                return
+            if extension == "csv":
+                stats.dump_csv(path)
+            else:
+                stats.dump_json(path)
+            self.status_var.set(f"Latency statistics saved to {path}")
+
+        button_frame = ttk.Frame(self.stats_window, padding=(10, 5))
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=5)
+
+        ttk.Button(button_frame, text="Close", command=self.stats_window.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Save JSON", command=lambda: dump_stats("json")).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Save CSV", command=lambda: dump_stats("csv")).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Reset", command=stats.reset).pack(side=tk.LEFT, padx=5)
+
+    def open_events_window(self):
+        """
+        Open a window listing the most recent gesture events (clicks, releases and scrolling).
+        The list is refreshed with the latency display.
+        """
+        if self.events_window and self.events_window.winfo_exists():
+            self.events_window.lift()
+            return
+
+        self.events_window = tk.Toplevel(self)
+        self.events_window.title("Events")
+        self.events_window.transient(self)
+
+        main_frame = ttk.Frame(self.events_window, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.events_list = tk.Listbox(main_frame, width=48, height=20)
+        scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=self.events_list.yview)
+        self.events_list.config(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.events_list.pack(fill=tk.BOTH, expand=True)
+        self.events_shown = None
+        self.refresh_events_list()
+
+        def clear_events():
+            """
+            Discard recorded events and empty the list.
+            """
+            events.reset()
+            self.refresh_events_list()
+
+        button_frame = ttk.Frame(self.events_window, padding=(10, 5))
+        button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="Close", command=self.events_window.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Clear", command=clear_events).pack(side=tk.LEFT, padx=5)
+
+    def refresh_events_list(self):
+        """
+        Show the latest events in the events window if any were recorded since the last refresh.
+        """
+        recent = events.recent(200)
+        latest = recent[-1] if recent else None
+        if latest == self.events_shown:
+            return
+        self.events_shown = latest
+        self.events_list.delete(0, tk.END)
+        for event in recent:
+            self.events_list.insert(tk.END, format_event(event))
+        self.events_list.see(tk.END)
+
     def open_settings_window(self):
         """
         Open a settings dialog to configure application preferences.
@@ -188,14 +342,57 @@ class Application(ThemedTk):
         notebook.add(camera_tab, text="Camera Settings")
         notebook.add(theme_tab, text="Theme Settings")
 
-        webcam_list = find_webcams()
-
         webcam_label = ttk.Label(camera_tab, text="Choose a webcam:")
         webcam_label.grid(column=0, row=0, sticky=tk.W, padx=5, pady=5)
 
-        webcam_menu = ttk.Combobox(camera_tab, textvariable=webcams, values=webcam_list, state="readonly")
+        webcam_menu = ttk.Combobox(camera_tab, textvariable=webcams, state="readonly")
         webcam_menu.grid(column=1, row=0, sticky=tk.W, padx=5, pady=5)
 
+        # camera list label -> index; the combobox shows labels
+        camera_indexes = {}
+
+        def show_cameras(cameras):
+            """
+            Fill the webcam list, keeping the current selection.
+
+            Args:
+                cameras (list): CameraInfo for each available camera
+            """
+            selected = camera_indexes.get(webcams.get(), webcams.get())
+            camera_indexes.clear()
+            for camera in cameras:
+                camera_indexes[camera.label] = str(camera.index)
+            webcam_menu.config(values=list(camera_indexes))
+            for label, index in camera_indexes.items():
+                if index == selected:
+                    webcams.set(label)
+
+        def poll_discovery(future):
+            """
+            Show discovered cameras once the background probe finishes.
+
+            Args:
+                future (concurrent.futures.Future): Pending camera discovery
+            """
+            if not webcam_menu.winfo_exists():
+                return
+            if not future.done():
+                self.after(100, poll_discovery, future)
+                return
+            try:
+                show_cameras(future.result())
+            except Exception as e:
+                print(f"Error finding webcams: {e}")
+
+        # Show cached cameras at once and probe in the background only when needed
+        in_use = self.pipeline.video_source
+        cameras = camera_discovery.cached(in_use)
+        if cameras is not None:
+            show_cameras(cameras)
+        else:
+            webcam_menu.config(values=[f"{video_source}: searching..."])
+            poll_discovery(camera_discovery.discover_async(in_use))
+
         hand_label = ttk.Label(camera_tab, text="Hand Preference:")
         hand_label.grid(column=0, row=1, sticky=tk.W, padx=5, pady=5)
 
@@ -264,17 +461,14 @@ class Application(ThemedTk):
             Updates the configuration file and closes the settings window.
             Updates status bar to inform the user that settings have been changed.
             """
-            webcam = webcams.get()
+            webcam = camera_indexes.get(webcams.get(), video_source)
             theme = theme_var.get()
             hand = hand_var.get()
             orientation = orientation_var.get()
             need_update = False
 
             if webcam and webcam != video_source:
-                self.cap.release()
-                self.cap = cv2.VideoCapture(int(webcam))
-                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                self.pipeline.set_video_source(int(webcam))
                 set_config_value('application', 'video_source', webcam)
                 need_update = True
 
@@ -297,6 +491,7 @@ class Application(ThemedTk):
                 need_update = True
 
             save_config()
+            self.processor.monitors.invalidate()
 
             self.config_window.destroy()
 
@@ -349,6 +544,6 @@ class Application(ThemedTk):
         Releases resources and ensures clean shutdown.
         """
         self.processor.running = False
-        self.processor.release_all_buttons()
-        self.cap.release()
+        self.pipeline.stop()
+        self.processor.close()
         self.destroy()
\ No newline at end of file
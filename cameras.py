@@ -0,0 +1,234 @@
+import glob
+import os
+import re
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# VIDIOC_QUERYCAP ioctl and the capability bits it reports (linux/videodev2.h)
+VIDIOC_QUERYCAP = 0x80685600
+V4L2_CAPABILITY_SIZE = 104
+V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+
+class CameraInfo:
+    """
+    One camera found by CameraDiscovery.
+
+    Args:
+        index (int): OpenCV device index
+        name (str): Human readable device name
+        path (str): Device node, e.g. /dev/video0, if known
+        in_use (bool): Whether NoMouse is currently capturing from it
+    """
+
+    def __init__(self, index, name, path=None, in_use=False):
+        self.index = index
+        self.name = name
+        self.path = path
+        self.in_use = in_use
+
+    @property
+    def label(self):
+        """
+        Text shown in the camera list.
+
+        Returns:
+            str: e.g. '0: Integrated Camera (in use)'
+        """
+        return f"{self.index}: {self.name}{' (in use)' if self.in_use else ''}"
+
+
+def query_capabilities(path):
+    """
+    Read a V4L2 device's name and whether it can capture video, without starting a stream.
+
+    Args:
+        path (str): Device node, e.g. /dev/video0
+
+    Returns:
+        tuple: (card name, can capture) or None if the device could not be queried
+    """
+    import fcntl
+
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return None
+    try:
+        buffer = bytearray(V4L2_CAPABILITY_SIZE)
+        fcntl.ioctl(fd, VIDIOC_QUERYCAP, buffer)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+    card = bytes(buffer[16:48]).split(b'\0', 1)[0].decode(errors='replace')
+    capabilities, device_caps = struct.unpack_from('<II', buffer, 84)
+    if capabilities & V4L2_CAP_DEVICE_CAPS:
+        capabilities = device_caps
+    return card, bool(capabilities & V4L2_CAP_VIDEO_CAPTURE)
+
+
+def list_video_nodes():
+    """
+    List V4L2 device nodes.
+
+    Returns:
+        list: (index, path) pairs sorted by index; empty where /dev/video* does not exist
+    """
+    nodes = []
+    for path in glob.glob('/dev/video*'):
+        match = re.fullmatch(r'/dev/video(\d+)', path)
+        if match:
+            nodes.append((int(match.group(1)), path))
+    return sorted(nodes)
+
+
+def probe_camera(index):
+    """
+    Check that OpenCV can open a camera.
+
+    Args:
+        index (int): OpenCV device index
+
+    Returns:
+        bool: True if the camera opened
+    """
+    import cv2
+
+    cap = cv2.VideoCapture(index)
+    try:
+        return cap.isOpened()
+    finally:
+        cap.release()
+
+
+class CameraDiscovery:
+    """
+    Finds cameras without blocking the UI.
+    On Linux, /dev/video* nodes are listed and queried for capture capability
+    first, so metadata nodes and other non-camera devices are never opened.
+    The remaining candidates (or indexes 0 to max_cameras - 1 elsewhere) are
+    probed concurrently, each with a timeout. The camera currently in use is
+    reported without reopening it. Results are cached until the set of device
+    nodes changes or invalidate() is called.
+
+    Args:
+        max_cameras (int): Indexes to probe where device nodes cannot be listed
+        timeout (float): Seconds to wait for all probes before giving up on the slow ones
+    """
+
+    def __init__(self, max_cameras=4, timeout=2.0):
+        self.max_cameras = max_cameras
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._cameras = None
+        self._nodes = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nomouse-cameras")
+
+    def invalidate(self):
+        """
+        Forget cached results so the next lookup probes again.
+        """
+        with self._lock:
+            self._cameras = None
+
+    def cached(self, in_use=None):
+        """
+        Cached cameras, if still valid.
+
+        Args:
+            in_use (int): Index of the camera currently capturing
+
+        Returns:
+            list: CameraInfo for each camera, or None if discovery is needed
+        """
+        with self._lock:
+            if self._cameras is None or list_video_nodes() != self._nodes:
+                return None
+            return [CameraInfo(camera.index, camera.name, camera.path, camera.index == in_use)
+                    for camera in self._cameras]
+
+    def discover_async(self, in_use=None):
+        """
+        Discover cameras on a worker thread.
+
+        Args:
+            in_use (int): Index of the camera currently capturing; it is not reopened
+
+        Returns:
+            concurrent.futures.Future: Resolves to a list of CameraInfo
+        """
+        return self._executor.submit(self.discover, in_use)
+
+    def discover(self, in_use=None):
+        """
+        Discover cameras, using the cache when no devices have been plugged or unplugged.
+
+        Args:
+            in_use (int): Index of the camera currently capturing; it is not reopened
+
+        Returns:
+            list: CameraInfo for each available camera, sorted by index
+        """
+        cameras = self.cached(in_use)
+        if cameras is not None:
+            return cameras
+
+        nodes = list_video_nodes()
+        if nodes:
+            candidates = []
+            for index, path in nodes:
+                capabilities = query_capabilities(path)
+                if capabilities is None:
+                    # Unreadable node (e.g. permissions): let OpenCV decide
+                    candidates.append(CameraInfo(index, f"Camera {index}", path))
+                elif capabilities[1]:
+                    candidates.append(CameraInfo(index, capabilities[0] or f"Camera {index}", path))
+        else:
+            candidates = [CameraInfo(index, f"Camera {index}") for index in range(self.max_cameras)]
+
+        cameras = [camera for camera in candidates if camera.index == in_use]
+        to_probe = [camera for camera in candidates if camera.index != in_use]
+        pending = False
+        if to_probe:
+            opened = {}
+
+            def probe(camera):
+                """
+                Probe one camera, recording whether it opened.
+                """
+                try:
+                    opened[camera.index] = probe_camera(camera.index)
+                except Exception as e:
+                    print(f"Error probing camera {camera.index}: {e}")
+
+            # One daemon thread per probe: a hung driver only costs its own thread
+            # and cannot keep the interpreter from exiting
+            threads = [threading.Thread(target=probe, args=(camera,), name=f"nomouse-probe-{camera.index}",
+                                        daemon=True) for camera in to_probe]
+            for thread in threads:
+                thread.start()
+            deadline = time.monotonic() + self.timeout
+            for thread in threads:
+                thread.join(max(0.0, deadline - time.monotonic()))
+            pending = any(thread.is_alive() for thread in threads)
+            cameras.extend(camera for camera in to_probe if opened.get(camera.index))
+
+        for camera in cameras:
+            camera.in_use = camera.index == in_use
+        cameras.sort(key=lambda camera: camera.index)
+
+        # Cameras that timed out may just be slow, so only complete results are cached
+        if not pending:
+            with self._lock:
+                self._cameras = cameras
+                self._nodes = nodes
+        return list(cameras)
+
+
+# Shared discovery so results are cached across settings windows
+camera_discovery = CameraDiscovery()
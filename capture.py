@@ -0,0 +1,173 @@
+import time
+from config_manager import get_config_value
+
+# Driver timestamps further than this from the monotonic clock are not trusted
+MAX_DRIVER_AGE = 1.0
+
+
+def fourcc_to_string(code):
+    """
+    Decode an OpenCV FOURCC property value.
+
+    Args:
+        code (float): Value of CAP_PROP_FOURCC
+
+    Returns:
+        str: e.g. 'MJPG', or '' if the backend does not report it
+    """
+    code = int(code)
+    if code <= 0:
+        return ''
+    return ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip('\0 ')
+
+
+class CameraCapture:
+    """
+    Camera opened for the lowest latency the driver allows.
+    The backend, pixel format, size, frame rate and buffer size come from the
+    [capture] section of settings.ini; a one-frame driver buffer means read()
+    returns the newest frame instead of one queued several frames ago. The
+    pipeline's capture thread reads continuously, so frames never pile up.
+
+    Where the driver reports buffer timestamps on the monotonic clock (V4L2),
+    frames are stamped with them, so latency measurements include the time a
+    frame spent in the driver.
+
+    Args:
+        video_source (int): Index of the camera to open
+        backend (str): 'auto' or an OpenCV backend name such as 'v4l2', 'dshow', 'msmf'
+        fourcc (str): Four character pixel format to request, e.g. 'MJPG', or '' for the default
+        width (int): Requested frame width
+        height (int): Requested frame height
+        fps (float): Requested frame rate, or 0 for the default
+        buffer_size (int): Frames the driver may queue, or 0 for the default
+    """
+
+    def __init__(self, video_source, backend='auto', fourcc='MJPG', width=640, height=480, fps=30.0,
+                 buffer_size=1):
+        import cv2
+
+        self.video_source = video_source
+        api = cv2.CAP_ANY if backend == 'auto' else getattr(cv2, f"CAP_{backend.upper()}", None)
+        if api is None:
+            print(f"Unknown capture backend {backend}, using the default")
+            api = cv2.CAP_ANY
+        self._cap = cv2.VideoCapture(video_source, api)
+
+        # The pixel format has to be set before the size for some V4L2 drivers to accept it
+        if fourcc:
+            self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc[:4].ljust(4)))
+        self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if fps > 0:
+            self._cap.set(cv2.CAP_PROP_FPS, fps)
+        if buffer_size > 0:
+            self._cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+
+        self.format = self._negotiated_format()
+        # None until the first frame shows whether the driver timestamps can be used
+        self.driver_timestamps = None
+        self.driver_age = 0.0
+
+    @classmethod
+    def from_config(cls, video_source):
+        """
+        Open a camera with the settings in the [capture] section of settings.ini.
+
+        Args:
+            video_source (int): Index of the camera to open
+
+        Returns:
+            CameraCapture: The opened camera
+        """
+        return cls(video_source,
+                   backend=get_config_value('capture', 'backend', 'auto'),
+                   fourcc=get_config_value('capture', 'fourcc', 'MJPG'),
+                   width=int(get_config_value('capture', 'width', '640')),
+                   height=int(get_config_value('capture', 'height', '480')),
+                   fps=float(get_config_value('capture', 'fps', '30')),
+                   buffer_size=int(get_config_value('capture', 'buffer_size', '1')))
+
+    def _negotiated_format(self):
+        """
+        Read back what the driver actually agreed to.
+
+        Returns:
+            dict: 'backend', 'fourcc', 'width', 'height', 'fps' and 'buffer_size'
+        """
+        import cv2
+
+        cap = self._cap
+        try:
+            backend = cap.getBackendName()
+        except cv2.error:
+            backend = ''
+        return {
+            'backend': backend,
+            'fourcc': fourcc_to_string(cap.get(cv2.CAP_PROP_FOURCC)),
+            'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            'fps': cap.get(cv2.CAP_PROP_FPS),
+            'buffer_size': int(cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+        }
+
+    def describe(self):
+        """
+        Human readable summary of the negotiated format.
+
+        Returns:
+            str: e.g. 'MJPG 640x480 @ 30 fps (V4L2, buffer 1)'
+        """
+        fmt = self.format
+        return (f"{fmt['fourcc'] or 'default format'} {fmt['width']}x{fmt['height']} @ {fmt['fps']:.0f} fps "
+                f"({fmt['backend'] or 'unknown backend'}, buffer {fmt['buffer_size']})")
+
+    def is_opened(self):
+        """
+        Whether the camera opened.
+
+        Returns:
+            bool: True if frames can be read
+        """
+        return self._cap.isOpened()
+
+    def read(self):
+        """
+        Read the next frame and its capture time.
+
+        Returns:
+            tuple: (frame or None if the read failed, monotonic capture time)
+        """
+        import cv2
+
+        ret, frame = self._cap.read()
+        now = time.monotonic()
+        if not ret:
+            return None, now
+
+        if self.driver_timestamps is not False:
+            driver_time = self._cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+            age = now - driver_time
+            if 0 <= age < MAX_DRIVER_AGE:
+                self.driver_timestamps = True
+                self.driver_age = age
+                return frame, driver_time
+            if self.driver_timestamps is None:
+                # Stream position or another clock: fall back to read time for good
+                self.driver_timestamps = False
+        return frame, now
+
+    def grab(self):
+        """
+        Take the next frame from the driver without decoding it, to skip a frame cheaply.
+
+        Returns:
+            bool: False if the read failed
+        """
+        return self._cap.grab()
+
+    def release(self):
+        """
+        Close the camera.
+        """
+        self._cap.release()
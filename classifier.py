@@ -0,0 +1,390 @@
+import argparse
+import math
+import time
+import numpy as np
+from gesture_table import DEFAULT_ACTIONS
+from landmarks import NUM_LANDMARKS, WRIST, MIDDLE_MCP
+
+# Samples with this label teach the classifier what "no gesture" looks like
+NO_GESTURE = "none"
+
+
+def normalize_landmarks(points, frame_w, frame_h, left_handed):
+    """
+    Make landmark sets comparable regardless of where the hand is, how big it
+    appears and how it is turned.
+    Landmarks are converted to square pixel units, moved so the wrist is at the
+    origin, scaled so the wrist to middle-finger knuckle distance is 1 and
+    rotated so that direction points straight up. Left hands are mirrored so
+    one model serves both hands.
+
+    Args:
+        points (numpy.ndarray): (N, 21, 3) normalized landmark coordinates
+        frame_w (numpy.ndarray): (N,) frame widths in pixels
+        frame_h (numpy.ndarray): (N,) frame heights in pixels
+        left_handed (numpy.ndarray): (N,) True for left hands
+
+    Returns:
+        numpy.ndarray: (N, 60) float32 features; the wrist, always zero, is dropped
+    """
+    frame_w = np.asarray(frame_w, dtype=np.float32)[:, None]
+    frame_h = np.asarray(frame_h, dtype=np.float32)[:, None]
+    x = points[:, :, 0] * frame_w
+    y = points[:, :, 1] * frame_h
+    z = points[:, :, 2] * frame_w
+
+    x = x - x[:, WRIST:WRIST + 1]
+    y = y - y[:, WRIST:WRIST + 1]
+    z = z - z[:, WRIST:WRIST + 1]
+    x = np.where(np.asarray(left_handed)[:, None], -x, x)
+
+    axis_x = x[:, MIDDLE_MCP:MIDDLE_MCP + 1]
+    axis_y = y[:, MIDDLE_MCP:MIDDLE_MCP + 1]
+    size = np.maximum(np.sqrt(axis_x * axis_x + axis_y * axis_y), 1e-6)
+    # Rotation taking the wrist -> middle knuckle direction to (0, -1)
+    cos = -axis_y / size
+    sin = axis_x / size
+    rotated_x = (x * cos - y * sin) / size
+    rotated_y = (x * sin + y * cos) / size
+
+    features = np.stack((rotated_x, rotated_y, z / size), axis=-1)
+    keep = [index for index in range(NUM_LANDMARKS) if index != WRIST]
+    return features[:, keep, :].reshape(len(points), -1).astype(np.float32)
+
+
+def normalize_hand(hand):
+    """
+    Normalize one tracked hand; a per-frame fast path equal to normalize_landmarks.
+
+    Args:
+        hand (LandmarkFrame): Landmarks of the tracked hand
+
+    Returns:
+        numpy.ndarray: (60,) float32 features
+    """
+    mirror = -1.0 if hand.handedness == 'Left' else 1.0
+    points = hand.points * np.array([hand.frame_w * mirror, hand.frame_h, hand.frame_w], dtype=np.float32)
+    points -= points[WRIST]
+
+    axis_x, axis_y = float(points[MIDDLE_MCP, 0]), float(points[MIDDLE_MCP, 1])
+    size = max(math.hypot(axis_x, axis_y), 1e-6)
+    cos, sin = -axis_y / size, axis_x / size
+    # Rotate x, y and scale x, y, z in one product
+    transform = np.array([[cos, sin, 0.0], [-sin, cos, 0.0], [0.0, 0.0, 1.0]], dtype=np.float32) / size
+    # The wrist is landmark 0 and always at the origin after centering
+    return (points[1:] @ transform).ravel()
+
+
+class GestureClassifier:
+    """
+    Multinomial logistic regression over normalized landmarks, in NumPy only.
+    Features are standardized with the training set's mean and spread, and a
+    prediction is one small matrix-vector product and a softmax.
+
+    Args:
+        names (list): Class names; NO_GESTURE for the "no gesture" class
+        weights (numpy.ndarray): (C, F) weights
+        bias (numpy.ndarray): (C,) biases
+        mean (numpy.ndarray): (F,) feature means
+        scale (numpy.ndarray): (F,) feature standard deviations
+    """
+
+    def __init__(self, names, weights, bias, mean, scale):
+        self.names = list(names)
+        self.weights = weights.astype(np.float32)
+        self.bias = bias.astype(np.float32)
+        self.mean = mean.astype(np.float32)
+        self.scale = scale.astype(np.float32)
+        # Standardization folded into the weights, so prediction is one product
+        self._weights = (self.weights / self.scale).T.copy()
+        self._bias = self.bias - self._weights.T @ self.mean
+
+    @classmethod
+    def train(cls, features, labels, names, iterations=500, learning_rate=0.5, l2=1e-3):
+        """
+        Fit the classifier with full-batch gradient descent.
+
+        Args:
+            features (numpy.ndarray): (N, F) normalized features
+            labels (numpy.ndarray): (N,) class index of each sample
+            names (list): Class names, indexed by label
+            iterations (int): Gradient descent steps
+            learning_rate (float): Step size
+            l2 (float): Weight decay
+
+        Returns:
+            GestureClassifier: Trained classifier
+        """
+        mean = features.mean(axis=0)
+        scale = features.std(axis=0) + 1e-6
+        inputs = ((features - mean) / scale).astype(np.float64)
+        count, feature_count = inputs.shape
+        targets = np.zeros((count, len(names)))
+        targets[np.arange(count), labels] = 1.0
+
+        weights = np.zeros((len(names), feature_count))
+        bias = np.zeros(len(names))
+        for _ in range(iterations):
+            probabilities = _softmax(inputs @ weights.T + bias)
+            error = (probabilities - targets) / count
+            weights -= learning_rate * (error.T @ inputs + l2 * weights)
+            bias -= learning_rate * error.sum(axis=0)
+        return cls(names, weights, bias, mean, scale)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a classifier saved with save().
+
+        Args:
+            path (str): Model file
+
+        Returns:
+            GestureClassifier: The saved classifier
+        """
+        with np.load(path) as model:
+            return cls([str(name) for name in model['names']], model['weights'], model['bias'],
+                       model['mean'], model['scale'])
+
+    def save(self, path):
+        """
+        Save the classifier as a compressed .npz file of a few kilobytes.
+
+        Args:
+            path (str): Model file to write
+        """
+        np.savez_compressed(path, names=np.array(self.names), weights=self.weights, bias=self.bias,
+                            mean=self.mean, scale=self.scale)
+
+    def probabilities(self, features):
+        """
+        Class probabilities for normalized features.
+
+        Args:
+            features (numpy.ndarray): (F,) or (N, F) normalized features
+
+        Returns:
+            numpy.ndarray: (C,) or (N, C) probabilities
+        """
+        return _softmax(features @ self._weights + self._bias)
+
+    def predict(self, features):
+        """
+        Most likely class for each sample.
+
+        Args:
+            features (numpy.ndarray): (N, F) normalized features
+
+        Returns:
+            numpy.ndarray: (N,) class indices
+        """
+        return self.probabilities(features).argmax(axis=-1)
+
+
+def _softmax(logits):
+    """
+    Numerically stable softmax over the last axis.
+
+    Args:
+        logits (numpy.ndarray): Unnormalized scores
+
+    Returns:
+        numpy.ndarray: Probabilities summing to 1 along the last axis
+    """
+    exponentials = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return exponentials / exponentials.sum(axis=-1, keepdims=True)
+
+
+class ClassifierEngine:
+    """
+    Gesture engine that uses a trained GestureClassifier instead of the
+    threshold rules, with the same interface as GestureEngine.
+    At most one gesture is active at a time. It activates when its
+    probability reaches `press_probability` and stays active until it drops
+    below `release_probability`, so predictions near a class boundary do not
+    flicker.
+
+    Args:
+        classifier (GestureClassifier): Trained classifier
+        press_probability (float): Probability needed to activate a gesture
+        release_probability (float): Probability below which an active gesture releases
+    """
+
+    def __init__(self, classifier, press_probability=0.8, release_probability=0.5):
+        self.classifier = classifier
+        self.press_probability = press_probability
+        self.release_probability = release_probability
+        self.actions = [DEFAULT_ACTIONS.get(name, "") for name in classifier.names]
+        self.reset()
+
+    def reset(self):
+        """
+        Deactivate every gesture, e.g. when the hand is lost.
+        """
+        self.current = None
+        self.output = np.zeros(len(self.classifier.names), dtype=bool)
+
+    def set_table(self, table):
+        """
+        Ignore a reloaded rule table; the classifier does not use it.
+
+        Args:
+            table (GestureTable): New compiled gesture rules
+        """
+
+    def update(self, hand, timestamp):
+        """
+        Classify one frame.
+
+        Args:
+            hand (LandmarkFrame): Landmarks of the tracked hand
+            timestamp (float): Monotonic capture time of the frame
+
+        Returns:
+            numpy.ndarray: (C,) boolean mask with the active gesture, if any
+        """
+        probabilities = self.classifier.probabilities(normalize_hand(hand))
+        best = int(probabilities.argmax())
+
+        if self.current is not None and probabilities[self.current] >= self.release_probability:
+            active = self.current
+        elif probabilities[best] >= self.press_probability:
+            active = best
+        else:
+            active = None
+        if active is not None and self.classifier.names[active] == NO_GESTURE:
+            active = None
+
+        if active != self.current:
+            self.output[:] = False
+            if active is not None:
+                self.output[active] = True
+            self.current = active
+        return self.output
+
+    def action_active(self, action):
+        """
+        Whether the active gesture is bound to an action.
+
+        Args:
+            action (str): Action from GESTURE_ACTIONS
+
+        Returns:
+            bool: True if the active gesture performs the action
+        """
+        return self.current is not None and self.actions[self.current] == action
+
+
+def load_samples(labeled_paths, holdout=0.0):
+    """
+    Load labeled landmark samples from recordings made with NoMouse.py --record.
+    Each recording holds one label. The last `holdout` fraction of every
+    recording is held out, so test frames never sit between training frames.
+
+    Args:
+        labeled_paths (list): (label, recording path) pairs
+        holdout (float): Fraction of each recording kept for testing (0-1)
+
+    Returns:
+        tuple: (names, train features, train labels, test features, test labels)
+    """
+    from replay import load_recording, HANDEDNESS_CODES
+
+    names = sorted({label for label, _ in labeled_paths})
+    splits = ([], [], [], [])
+    for label, path in labeled_paths:
+        records = load_recording(path)
+        records = records[records['handedness'] >= 0]
+        features = normalize_landmarks(np.asarray(records['landmarks']), records['frame_w'], records['frame_h'],
+                                       records['handedness'] == HANDEDNESS_CODES['Left'])
+        split = len(features) - int(round(len(features) * holdout))
+        labels = np.full(len(features), names.index(label), dtype=np.intp)
+        splits[0].append(features[:split])
+        splits[1].append(labels[:split])
+        splits[2].append(features[split:])
+        splits[3].append(labels[split:])
+
+    train_x, train_y, test_x, test_y = (np.concatenate(part) for part in splits)
+    return names, train_x, train_y, test_x, test_y
+
+
+def evaluate(classifier, features, labels):
+    """
+    Measure accuracy and per-frame inference time on labeled samples.
+
+    Args:
+        classifier (GestureClassifier): Trained classifier
+        features (numpy.ndarray): (N, F) normalized features
+        labels (numpy.ndarray): (N,) true class indices
+
+    Returns:
+        dict: {'accuracy', 'samples', 'per_class', 'inference_us'}
+    """
+    predictions = classifier.predict(features)
+    per_class = {}
+    for index, name in enumerate(classifier.names):
+        mask = labels == index
+        if mask.any():
+            per_class[name] = float((predictions[mask] == index).mean())
+
+    # Time single-frame probabilities, as the processor calls them
+    sample = features[0] if len(features) else np.zeros_like(classifier.mean)
+    repeats = 1000
+    started = time.perf_counter()
+    for _ in range(repeats):
+        classifier.probabilities(sample)
+    inference_us = (time.perf_counter() - started) / repeats * 1e6
+
+    return {'accuracy': float((predictions == labels).mean()) if len(labels) else float('nan'),
+            'samples': len(labels), 'per_class': per_class, 'inference_us': inference_us}
+
+
+def _labeled_path(value):
+    """
+    Parse a LABEL=RECORDING command-line argument.
+
+    Args:
+        value (str): e.g. 'left_click=pinch.nmrec'
+
+    Returns:
+        tuple: (label, path)
+    """
+    label, separator, path = value.partition('=')
+    if not separator or not label or not path:
+        raise argparse.ArgumentTypeError(f"expected LABEL=RECORDING, got '{value}'")
+    return label, path
+
+
+def main():
+    """
+    Command-line entry point: train a classifier from labeled recordings, or evaluate one.
+    """
+    parser = argparse.ArgumentParser(description="Train or evaluate a NoMouse gesture classifier")
+    parser.add_argument("samples", nargs="+", type=_labeled_path, metavar="LABEL=RECORDING",
+                        help=f"recording of one gesture; use the label '{NO_GESTURE}' for an open, idle hand")
+    parser.add_argument("--output", default="gestures.npz", help="model file to write (default gestures.npz)")
+    parser.add_argument("--holdout", type=float, default=0.2,
+                        help="fraction of each recording held out for testing (default 0.2)")
+    parser.add_argument("--evaluate", metavar="MODEL",
+                        help="measure an existing model on the recordings instead of training")
+    args = parser.parse_args()
+
+    if args.evaluate:
+        classifier = GestureClassifier.load(args.evaluate)
+        names, features, labels, _, _ = load_samples(args.samples)
+        labels = np.array([classifier.names.index(names[label]) for label in labels], dtype=np.intp)
+    else:
+        names, train_x, train_y, features, labels = load_samples(args.samples, args.holdout)
+        classifier = GestureClassifier.train(train_x, train_y, names)
+        classifier.save(args.output)
+        print(f"Trained on {len(train_y)} samples, saved to {args.output}")
+
+    result = evaluate(classifier, features, labels)
+    print(f"Accuracy {result['accuracy']:.1%} on {result['samples']} held-out samples, "
+          f"{result['inference_us']:.1f} us per frame")
+    for name, accuracy in result['per_class'].items():
+        print(f"  {name:<16} {accuracy:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,6 +31,147 @@ def load_config():
     if not _config.has_option('application', 'camera_orientation'):
         _config.set('application', 'camera_orientation', 'Front Facing')
 
+    if not _config.has_option('application', 'headless'):
+        _config.set('application', 'headless', 'False')
+
+    if not _config.has_section('capture'):
+        _config.add_section('capture')
+
+    if not _config.has_option('capture', 'backend'):
+        _config.set('capture', 'backend', 'auto')
+
+    if not _config.has_option('capture', 'fourcc'):
+        _config.set('capture', 'fourcc', 'MJPG')
+
+    if not _config.has_option('capture', 'width'):
+        _config.set('capture', 'width', '640')
+
+    if not _config.has_option('capture', 'height'):
+        _config.set('capture', 'height', '480')
+
+    if not _config.has_option('capture', 'fps'):
+        _config.set('capture', 'fps', '30')
+
+    if not _config.has_option('capture', 'buffer_size'):
+        _config.set('capture', 'buffer_size', '1')
+
+    if not _config.has_section('inference'):
+        _config.add_section('inference')
+
+    if not _config.has_option('inference', 'roi'):
+        _config.set('inference', 'roi', 'True')
+
+    if not _config.has_option('inference', 'roi_padding'):
+        _config.set('inference', 'roi_padding', '0.5')
+
+    if not _config.has_option('inference', 'scale'):
+        _config.set('inference', 'scale', '1.0')
+
+    if not _config.has_option('inference', 'frame_skip'):
+        _config.set('inference', 'frame_skip', '1')
+
+    if not _config.has_option('inference', 'min_confidence'):
+        _config.set('inference', 'min_confidence', '0.8')
+
+    if not _config.has_option('inference', 'governor'):
+        _config.set('inference', 'governor', 'True')
+
+    if not _config.has_option('inference', 'frame_budget_ms'):
+        _config.set('inference', 'frame_budget_ms', '33')
+
+    if not _config.has_option('inference', 'process'):
+        _config.set('inference', 'process', 'False')
+
+    if not _config.has_section('power'):
+        _config.add_section('power')
+
+    if not _config.has_option('power', 'idle'):
+        _config.set('power', 'idle', 'True')
+
+    if not _config.has_option('power', 'idle_timeout'):
+        _config.set('power', 'idle_timeout', '30')
+
+    if not _config.has_option('power', 'idle_fps'):
+        _config.set('power', 'idle_fps', '5')
+
+    if not _config.has_option('power', 'idle_scale'):
+        _config.set('power', 'idle_scale', '0.5')
+
+    if not _config.has_option('power', 'idle_motion'):
+        _config.set('power', 'idle_motion', '0.02')
+
+    if not _config.has_section('smoothing'):
+        _config.add_section('smoothing')
+
+    if not _config.has_option('smoothing', 'method'):
+        _config.set('smoothing', 'method', 'average')
+
+    if not _config.has_section('gestures'):
+        _config.add_section('gestures')
+
+    if not _config.has_option('gestures', 'classifier'):
+        _config.set('gestures', 'classifier', '')
+
+    if not _config.has_option('gestures', 'classifier_probability'):
+        _config.set('gestures', 'classifier_probability', '0.8')
+
+    if not _config.has_section('scrolling'):
+        _config.add_section('scrolling')
+
+    if not _config.has_option('scrolling', 'gain'):
+        _config.set('scrolling', 'gain', '0.02')
+
+    if not _config.has_option('scrolling', 'acceleration'):
+        _config.set('scrolling', 'acceleration', '1.5')
+
+    if not _config.has_option('scrolling', 'deadzone'):
+        _config.set('scrolling', 'deadzone', '60')
+
+    if not _config.has_section('output'):
+        _config.add_section('output')
+
+    if not _config.has_option('output', 'async'):
+        _config.set('output', 'async', 'True')
+
+    if not _config.has_option('output', 'rate'):
+        _config.set('output', 'rate', '250')
+
+    if not _config.has_option('output', 'interpolation'):
+        _config.set('output', 'interpolation', 'off')
+
+    if not _config.has_option('output', 'interpolation_rate'):
+        _config.set('output', 'interpolation_rate', '120')
+
+    if not _config.has_section('preview'):
+        _config.add_section('preview')
+
+    if not _config.has_option('preview', 'fps'):
+        _config.set('preview', 'fps', '15')
+
+    if not _config.has_option('preview', 'scale'):
+        _config.set('preview', 'scale', '1.0')
+
+    if not _config.has_section('events'):
+        _config.add_section('events')
+
+    if not _config.has_option('events', 'enabled'):
+        _config.set('events', 'enabled', 'True')
+
+    if not _config.has_option('events', 'log_file'):
+        _config.set('events', 'log_file', '')
+
+    if not _config.has_option('events', 'log_max_kb'):
+        _config.set('events', 'log_max_kb', '1024')
+
+    if not _config.has_option('events', 'log_backups'):
+        _config.set('events', 'log_backups', '3')
+
+    if not _config.has_section('instrumentation'):
+        _config.add_section('instrumentation')
+
+    if not _config.has_option('instrumentation', 'enabled'):
+        _config.set('instrumentation', 'enabled', 'True')
+
     save_config()
 
     return _config
@@ -71,6 +212,29 @@ def get_config_value(section, option, default_value=None):
         return default_value
 
 
+def get_config_boolean(section, option, default_value=False):
+    """
+    Get a boolean value from the configuration.
+    Accepts the spellings configparser understands, such as True/False, yes/no and 1/0.
+
+    Args:
+        section (str): Configuration section
+        option (str): Option name within section
+        default_value (bool): Value to return if option doesn't exist or isn't a boolean
+
+    Returns:
+        bool: The configuration value or default_value if not found
+    """
+    global _config
+    if _config is None:
+        load_config()
+
+    try:
+        return _config.getboolean(section, option)
+    except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+        return default_value
+
+
 def set_config_value(section, option, value):
     """
     Set a value in the configuration.
@@ -0,0 +1,184 @@
+import logging
+import logging.handlers
+import sys
+import threading
+import time
+import numpy as np
+
+# Event kinds recorded by the gesture processor
+EVENT_KINDS = (
+    "press",            # button pressed by a gesture; value is the button
+    "release",          # button released by a gesture; value is the button
+    "hand_lost",        # button released because the hand left the frame; value is the button
+    "stopped",          # button released because tracking was stopped; value is the button
+    "scroll_start",     # scroll gesture began
+    "scroll",           # scroll sent; value is the number of steps, positive is up
+    "scroll_end",       # scroll gesture ended
+)
+
+LEFT_BUTTON = 0
+RIGHT_BUTTON = 1
+BUTTON_NAMES = ("left", "right")
+BUTTON_CODES = {name: code for code, name in enumerate(BUTTON_NAMES)}
+
+
+class EventLog:
+    """
+    In-process recorder of typed gesture events.
+    Events must be recorded from a single thread, the tracking thread.
+    Events are stored in preallocated ring buffers (monotonic timestamp, kind
+    and an integer value), so recording never allocates or does I/O and can be
+    called from the frame loop. When disabled, record() returns after a single
+    attribute check. An optional background sink writes new events to a
+    rotating log file in batches.
+
+    Args:
+        capacity (int): Number of recent events kept
+        enabled (bool): Whether events are recorded
+    """
+
+    def __init__(self, capacity=1024, enabled=True):
+        self.capacity = capacity
+        self.enabled = enabled
+        self._index = {kind: i for i, kind in enumerate(EVENT_KINDS)}
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._kinds = np.zeros(capacity, dtype=np.uint8)
+        self._values = np.zeros(capacity, dtype=np.int32)
+        # total events ever recorded; the next event's sequence number
+        self._count = 0
+        self._sink_thread = None
+        self._sink_stop = threading.Event()
+
+    def record(self, kind, value=0):
+        """
+        Record one event.
+
+        Args:
+            kind (str): Event kind from EVENT_KINDS
+            value (int): Button or scroll steps, depending on the kind
+        """
+        if not self.enabled:
+            return
+        count = self._count
+        slot = count % self.capacity
+        self._times[slot] = time.monotonic()
+        self._kinds[slot] = self._index[kind]
+        self._values[slot] = value
+        self._count = count + 1
+
+    def reset(self):
+        """
+        Discard all recorded events.
+        """
+        self._count = 0
+
+    def events_since(self, sequence):
+        """
+        Read events recorded after a sequence number.
+
+        Args:
+            sequence (int): Sequence number returned by a previous call, or 0
+
+        Returns:
+            tuple: (list of (timestamp, kind, value), next sequence number,
+                number of events overwritten before they could be read)
+        """
+        count = self._count
+        if sequence > count:
+            # The log was reset since the last read
+            sequence = 0
+        first = max(sequence, count - self.capacity)
+        result = []
+        for number in range(first, count):
+            slot = number % self.capacity
+            result.append((float(self._times[slot]), EVENT_KINDS[self._kinds[slot]], int(self._values[slot])))
+        return result, count, first - sequence
+
+    def recent(self, limit=100):
+        """
+        Most recent events, oldest first.
+
+        Args:
+            limit (int): Maximum number of events returned
+
+        Returns:
+            list: (timestamp, kind, value) tuples
+        """
+        return self.events_since(max(0, self._count - limit))[0]
+
+    def start_sink(self, path, max_bytes=1024 * 1024, backups=3, interval=1.0):
+        """
+        Write new events to a rotating log file from a background thread.
+
+        Args:
+            path (str): Log file, or '-' for standard output
+            max_bytes (int): Size at which the file is rotated
+            backups (int): Number of rotated files kept
+            interval (float): Seconds between batches
+        """
+        self.stop_sink()
+        if path == '-':
+            handler = logging.StreamHandler(sys.stdout)
+        else:
+            handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups)
+        logger = logging.getLogger("nomouse.events")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.handlers = [handler]
+
+        self._sink_stop.clear()
+        self._sink_thread = threading.Thread(target=self._sink_loop, args=(logger, interval),
+                                             name="nomouse-events", daemon=True)
+        self._sink_thread.start()
+
+    def stop_sink(self):
+        """
+        Flush the last batch and stop the background sink, if running.
+        """
+        if self._sink_thread is None:
+            return
+        self._sink_stop.set()
+        self._sink_thread.join(timeout=2)
+        self._sink_thread = None
+
+    def _sink_loop(self, logger, interval):
+        """
+        Periodically write events recorded since the last batch.
+
+        Args:
+            logger (logging.Logger): Logger with the sink's handler
+            interval (float): Seconds between batches
+        """
+        sequence = self._count
+        stopping = False
+        while not stopping:
+            stopping = self._sink_stop.wait(interval)
+            batch, sequence, lost = self.events_since(sequence)
+            if lost:
+                logger.info(f"{lost} events dropped")
+            for event in batch:
+                logger.info(format_event(event))
+        for handler in logger.handlers:
+            handler.close()
+
+
+def format_event(event):
+    """
+    Format one event as a line of text.
+
+    Args:
+        event (tuple): (timestamp, kind, value) from EventLog
+
+    Returns:
+        str: e.g. '1234.567890 press left'
+    """
+    timestamp, kind, value = event
+    if kind in ("press", "release", "hand_lost", "stopped"):
+        return f"{timestamp:.6f} {kind} {BUTTON_NAMES[value]}"
+    if kind == "scroll":
+        return f"{timestamp:.6f} {kind} {value:+d}"
+    return f"{timestamp:.6f} {kind}"
+
+
+# Shared event log used by the processor and UI
+events = EventLog()
@@ -1,12 +1,18 @@
-import mediapipe as mp
-import pandas as pd
-from pynput.mouse import Controller, Button
-from utils import distance, scale_position, get_total_screen_dimensions
-
-FINGERTIPS = [4, 8, 12, 16, 20]
-LEFT_CLICK = 0
-RIGHT_CLICK = 1
-SCROLL = 2
+import threading
+import time
+from config_manager import get_config_value, get_config_boolean
+from gesture_table import GestureTable, GestureEngine
+from events import events, BUTTON_CODES
+from instrumentation import stats
+from startup import startup
+from landmarks import INDEX_MCP
+from motion import LandmarkPredictor
+from smoothing import MovingAverageSmoother
+from scrolling import ScrollEngine
+from monitors import MonitorGeometry
+from utils import scale_position
+
+BUTTONS = ("left", "right")
 
 
 class GestureProcessor:
@@ -20,44 +26,195 @@ class GestureProcessor:
     - Scrolling based on hand gestures and movement
     """
 
-    def __init__(self):
+    def __init__(self, mouse=None, monitors=None, smoother=None, scroller=None, load_model=True):
         """
         Initialize the GestureProcessor with MediaPipe hands tracking
         and mouse control capabilities.
+
+        Args:
+            mouse: Mouse output to drive; defaults to a pynput-backed PynputMouse
+            monitors (MonitorGeometry): Monitor layout; defaults to querying the display
+            smoother: Cursor smoother from smoothing.py; defaults to MovingAverageSmoother
+            scroller (ScrollEngine): Turns hand velocity into scrolling; defaults to ScrollEngine()
+            load_model (bool): Whether to load the MediaPipe hands model. Replay and
+                tests feed landmarks directly and can skip it.
         """
         self.running = False
-        self.mp_drawing = mp.solutions.drawing_utils
+        self.mp_hands = None
+        self.inference = None
+        self.governor = None
+        # worker process running inference instead of this process, if enabled
+        self.inference_process = None
+        # "not loaded", "warming up", "ready" or "failed"
+        self.model_state = "not loaded"
+
+        # run hands.process every frame_skip frames and extrapolate in between
+        self.frame_skip = 1
+        self.min_confidence = 0.8
+        self.predictor = LandmarkPredictor()
+        self._skipped_frames = 0
+
+        if load_model:
+            self.load_model()
+
+        if mouse is None:
+            from mouse_output import PynputMouse
+            mouse = PynputMouse()
+        self.mouse = mouse
+
+        self.gesture_table = GestureTable.load('hand_gestures_data.csv')
+        self.gesture_engine = GestureEngine(self.gesture_table)
+        self.gesture_reload_interval = 1.0
+        self._last_gesture_check = time.monotonic()
+
+        # cached layout of all monitors, refreshed in the background
+        if monitors is None:
+            monitors = MonitorGeometry()
+        self.monitors = monitors
+        self.monitors.start()
+
+        self.recorder = None
+
+        # landmarks of the hand driving the cursor in the latest frame, for the preview
+        self.tracked_hand = None
+
+        # names of the buttons currently held down by gestures
+        self.buttons_down = set()
+        # set by start_tracking; the tracking thread resets the smoother on its next frame
+        self._restart_pending = False
+        self.scroll_active = False
+        if scroller is None:
+            scroller = ScrollEngine()
+        self.scroller = scroller
+
+        if smoother is None:
+            smoother = MovingAverageSmoother()
+        self.smoother = smoother
+
+        self.hand_preference = "Right"
+        self.camera_orientation = "Front Facing"
+
+    def load_model(self):
+        """
+        Load the MediaPipe hands model and the governor that sizes it to the frame budget.
+        Frames are passed through untouched until this has finished.
+        """
+        started = startup.start()
+        import mediapipe as mp
+        from inference import HandInference, ModelGovernor, MODEL_LEVELS
+        startup.stop("import mediapipe", started)
+
+        started = startup.start()
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(static_image_mode=False,
-                                         model_complexity=1,
-                                         min_detection_confidence=0.7,
-                                         min_tracking_confidence=0.7,
-                                         max_num_hands=2)
-        self.hands.use_gpu = True
-        self.mouse = Controller()
+        settings = self.inference_settings()
+        inference = HandInference(None, roi=settings['roi'], padding=settings['roi_padding'],
+                                  scale=settings['scale'], idle_scale=settings['idle_scale'])
+        self.governor = ModelGovernor(inference, self.create_hands, budget=settings['frame_budget'],
+                                      enabled=settings['governor'], level=len(MODEL_LEVELS) - 1)
+        self.frame_skip = max(1, int(get_config_value('inference', 'frame_skip', '1')))
+        self.min_confidence = float(get_config_value('inference', 'min_confidence', '0.8'))
+        # Published last: process_image starts using the model once inference is set
+        self.inference = inference
+        self.model_state = "ready"
+        startup.stop("build hand model", started)
+
+    @staticmethod
+    def inference_settings():
+        """
+        Read the [inference] options that configure HandInference and ModelGovernor.
 
-        self.gesture_data = pd.read_csv('hand_gestures_data.csv')
+        Returns:
+            dict: 'roi', 'roi_padding', 'scale', 'idle_scale', 'governor' and 'frame_budget' values
+        """
+        return {
+            'roi': get_config_boolean('inference', 'roi', True),
+            'roi_padding': float(get_config_value('inference', 'roi_padding', '0.5')),
+            'scale': float(get_config_value('inference', 'scale', '1.0')),
+            'idle_scale': float(get_config_value('power', 'idle_scale', '0.5')),
+            'governor': get_config_boolean('inference', 'governor', True),
+            'frame_budget': float(get_config_value('inference', 'frame_budget_ms', '33')) / 1000,
+        }
+
+    @property
+    def model_mode(self):
+        """
+        Human readable description of the hand model the governor has active,
+        whether it runs here or in the inference process.
 
-        # get dimensions with multiple monitors
-        self.total_width, self.total_height, self.min_x, self.min_y = get_total_screen_dimensions()
+        Returns:
+            str: e.g. 'complexity 1, 2 hands', or None until a model has loaded
+        """
+        if self.governor is not None:
+            return self.governor.mode
+        if self.inference_process is not None and self.inference_process.level >= 0:
+            from inference import describe_level
+            return describe_level(self.inference_process.level)
+        return None
+
+    def start_inference_process(self):
+        """
+        Run hand inference in a supervised worker process instead of loading the model here.
+        The pipeline sends frames to it and feeds its detections to process_detections.
+        """
+        from inference_process import InferenceProcess
 
-        self.left_mouse_down = False
-        self.right_mouse_down = False
-        self.scroll_active = False
-        self.prev_y = 0
-        self.scroll_threshold = 5
-        self.scroll_amount = 2
-        self.scroll_cooldown = 0
+        self.min_confidence = float(get_config_value('inference', 'min_confidence', '0.8'))
+        self.model_state = "warming up"
+        # Ring slots sized for the configured capture resolution; larger frames are downscaled to fit
+        width = int(get_config_value('capture', 'width', '640'))
+        height = int(get_config_value('capture', 'height', '480'))
+        self.inference_process = InferenceProcess(self.inference_settings(), capacity=width * height * 3)
+        self.inference_process.start()
 
-        self.smoothing_factor = 0.3
-        self.previous_x = 0
-        self.previous_y = 0
+    def set_idle(self, idle):
+        """
+        Switch hand inference to its cheaper idle pass while no hand is in view.
 
-        self.position_history = []
-        self.history_size = 5
+        Args:
+            idle (bool): Whether the pipeline is idle
+        """
+        if self.inference is not None:
+            self.inference.set_idle(idle)
 
-        self.hand_preference = "Right"
-        self.camera_orientation = "Front Facing"
+    def warm_up(self, on_ready=None):
+        """
+        Load the hands model on a background thread so the window can appear immediately.
+        model_state reports progress.
+
+        Args:
+            on_ready (callable): Called on the background thread once the model has loaded
+        """
+        self.model_state = "warming up"
+
+        def load():
+            """
+            Load the model, reporting failures instead of raising.
+            """
+            try:
+                self.load_model()
+            except Exception as e:
+                print(f"Error loading hand model: {e}")
+                self.model_state = "failed"
+                return
+            if on_ready is not None:
+                on_ready()
+
+        threading.Thread(target=load, name="nomouse-warmup", daemon=True).start()
+
+    def create_hands(self, model_complexity, max_num_hands):
+        """
+        Build a MediaPipe Hands model.
+
+        Args:
+            model_complexity (int): 0 for the lite model, 1 for the full model
+            max_num_hands (int): Maximum number of hands to detect
+
+        Returns:
+            mediapipe.solutions.hands.Hands: The new model
+        """
+        from inference import create_hands
+
+        return create_hands(model_complexity, max_num_hands)
 
     def set_hand_preference(self, preference):
         """
@@ -77,50 +234,189 @@ class GestureProcessor:
         """
         self.camera_orientation = orientation
 
-    def process_image(self, frame):
+    def reload_gestures(self, force=False):
         """
-        Process a video frame to detect hand landmarks and perform gesture tracking.
+        Recompile the gesture table if hand_gestures_data.csv has changed.
+        The new table is swapped in with a single assignment, so the frame
+        loop never sees a partially built table.
 
         Args:
-            frame (numpy.ndarray): Video frame from webcam
+            force (bool): Reload even if the file has not changed
 
         Returns:
-            numpy.ndarray: Processed frame with hand landmarks drawn
+            bool: True if the table was reloaded
         """
-        if not self.running:
-            return frame
+        if not force and not self.gesture_table.is_stale():
+            return False
+
+        try:
+            table = GestureTable.load(self.gesture_table.path)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Error reloading gestures: {e}")
+            return False
+        self.gesture_engine.set_table(table)
+        self.gesture_table = table
+        return True
+
+    def use_classifier(self, path, press_probability=0.8):
+        """
+        Recognize gestures with a trained classifier instead of the threshold rules.
 
-        self.total_width, self.total_height, self.min_x, self.min_y = get_total_screen_dimensions()
+        Args:
+            path (str): Model file written by classifier.py
+            press_probability (float): Probability needed to activate a gesture
+        """
+        from classifier import GestureClassifier, ClassifierEngine
 
-        image = frame
-        image.flags.writeable = False
+        self.gesture_engine = ClassifierEngine(GestureClassifier.load(path), press_probability=press_probability)
 
-        results = self.hands.process(image)
+    def start_recording(self, path):
+        """
+        Record every processed frame of landmarks to a file for later replay.
 
-        image.flags.writeable = True
+        Args:
+            path (str): Recording file to create
+        """
+        from replay import LandmarkRecorder
 
-        if results.multi_hand_landmarks:
-            hands_landmarks = results.multi_hand_landmarks
-            hands_handedness = results.multi_handedness
+        self.stop_recording()
+        self.recorder = LandmarkRecorder(path)
 
+    def stop_recording(self):
+        """
+        Stop recording and close the recording file.
+        """
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def process_image(self, frame, timestamp=None):
+        """
+        Process a video frame to detect hand landmarks and perform gesture tracking.
+
+        Args:
+            frame (numpy.ndarray): RGB video frame from webcam, not mirrored; landmarks
+                are mirrored instead for front facing cameras
+            timestamp (float): Monotonic capture time of the frame; defaults to now
+
+        Returns:
+            numpy.ndarray: The processed frame; the tracked hand is available in tracked_hand
+        """
+        if not self.running:
+            self._finish_stop()
+            return frame
+        if self.inference is None:
+            self.tracked_hand = None
+            return frame
+
+        if timestamp is None:
+            timestamp = time.monotonic()
+        self._check_gesture_file()
+
+        if not self._inference_due():
+            predicted_hand = self.predictor.predict(timestamp)
+            if predicted_hand is not None:
+                self._skipped_frames += 1
+                self.process_landmarks(predicted_hand, timestamp)
+                return frame
+        self._skipped_frames = 0
+
+        started = time.perf_counter()
+        detected_hands = self.inference.detect(frame, timestamp, self.hand_preference,
+                                               self.camera_orientation == "Front Facing")
+        elapsed = time.perf_counter() - started
+        stats.record("inference", elapsed)
+        self.governor.observe(elapsed)
+
+        self.process_detections(detected_hands, timestamp)
+        return frame
+
+    def process_detections(self, detected_hands, timestamp):
+        """
+        Pick the tracked hand from one frame's detections and drive the mouse with it.
+        Used directly when inference runs in a separate process.
+
+        Args:
+            detected_hands (list): LandmarkFrame for each detected hand
+            timestamp (float): Monotonic capture time of the frame
+        """
+        if not self.running:
+            self._finish_stop()
+            return
+        self._check_gesture_file()
+
+        self.tracked_hand = None
+        if detected_hands:
+            tracked = detected_hands[0]
             # If two hands in frame, only track hand preference
-            if len(hands_landmarks) == 2:
-                for hand_landmarks, handedness in zip(hands_landmarks, hands_handedness):
-                    hand_label = handedness.classification[0].label
-                    self.mp_drawing.draw_landmarks(frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-                    if hand_label == self.hand_preference:
-                        self.track_hand(frame, hand_landmarks)
+            if len(detected_hands) == 2:
+                tracked = next((hand for hand in detected_hands if hand.handedness == self.hand_preference), None)
+
+            if tracked is not None:
+                self.predictor.update(tracked)
+                self.process_landmarks(tracked, timestamp)
             else:
-                hand_landmarks = hands_landmarks[0]
-                self.mp_drawing.draw_landmarks(frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-                self.track_hand(frame, hand_landmarks)
+                self.predictor.reset()
         else:
-            # If no hands are detected, release mouse buttons
-            self.release_all_buttons()
+            self.predictor.reset()
+            self.process_landmarks(None, timestamp)
+
+    def _check_gesture_file(self):
+        """
+        Reload the gesture table if its file changed, checking at most once per gesture_reload_interval.
+        """
+        now = time.monotonic()
+        if now - self._last_gesture_check >= self.gesture_reload_interval:
+            self._last_gesture_check = now
+            self.reload_gestures()
 
-        return image
+    def _inference_due(self):
+        """
+        Decide whether this frame needs a real hands.process call.
+        Inference runs every frame_skip frames, and immediately when there is
+        no hand to extrapolate from or the last detection was low confidence.
+
+        Returns:
+            bool: True if inference should run on this frame
+        """
+        if self.frame_skip <= 1 or not self.predictor.ready:
+            return True
+        if self._skipped_frames + 1 >= self.frame_skip:
+            return True
+        confidence = self.predictor.confidence
+        return confidence is not None and confidence < self.min_confidence
+
+    def process_landmarks(self, hand, timestamp):
+        """
+        Drive the mouse from one frame of tracked landmarks.
+        This is everything process_image does after inference, so recordings
+        can be replayed through it without a camera or MediaPipe.
+
+        Args:
+            hand (LandmarkFrame): Landmarks of the tracked hand, or None if no hand was found
+            timestamp (float): Monotonic capture time of the frame
+        """
+        self.tracked_hand = hand
+        # Only real inferences are recorded; replay re-derives everything else
+        if self.recorder is not None and (hand is None or not hand.predicted):
+            self.recorder.write(hand, timestamp)
+
+        if self._restart_pending:
+            self._restart_pending = False
+            center_x, center_y = self.monitors.layout.center
+            self.smoother.reset(center_x, center_y)
+
+        if hand is None:
+            # If no hands are detected, release mouse buttons and forget gesture state
+            self.release_all_buttons("hand_lost")
+            self.gesture_engine.reset()
+        elif not self.running:
+            # Stopped while this frame was in flight: release instead of pressing
+            self._finish_stop()
+        else:
+            self.track_hand(hand)
 
-    def track_hand(self, frame, hand_landmarks):
+    def track_hand(self, hand):
         """
         Track hand position and gestures to control mouse behavior.
 
@@ -130,185 +426,150 @@ class GestureProcessor:
         - Scroll gesture detection and vertical scrolling
 
         Args:
-            frame (numpy.ndarray): The current video frame
-            hand_landmarks (mediapipe.framework.formats.landmark_pb2.NormalizedLandmarkList):
-                Detected hand landmarks
+            hand (LandmarkFrame): Landmark array of the tracked hand
         """
-        frame_h, frame_w = frame.shape[:2]
+        raw_x, raw_y = self.raw_cursor_position(hand)
 
-        raw_x = int(scale_position(hand_landmarks.landmark[5].x) * self.total_width) + self.min_x
-        raw_y = int(scale_position(hand_landmarks.landmark[5].y) * self.total_height) + self.min_y
-
-        smoothed_position = self.smooth_position(raw_x, raw_y)
+        smoothed_position = self.smooth_position(raw_x, raw_y, hand.timestamp)
         x, y = smoothed_position
 
         # Only update mouse position if not in scroll mode
         if not self.scroll_active:
+            started = stats.start()
             self.mouse.position = (x, y)
+            stats.stop("mouse", started)
+            if hand.timestamp is not None:
+                stats.record("cursor_age", time.monotonic() - hand.timestamp)
 
-        scroll_detected = True
-        for index, finger in enumerate(FINGERTIPS):
-            # Skip if the column doesn't exist in the data
-            if index + 11 >= len(self.gesture_data.columns) or not self.gesture_data.iloc[SCROLL, (index + 11)]:
-                continue
-
-            ref_landmark_idx = int(self.gesture_data.iloc[SCROLL, (index + 1)])
-            threshold = self.gesture_data.iloc[SCROLL, (index + 6)]
-
-            if ref_landmark_idx < 0 or ref_landmark_idx >= len(hand_landmarks.landmark):
-                continue
-
-            finger_dist = distance(
-                hand_landmarks.landmark[finger].x * frame_w,
-                hand_landmarks.landmark[finger].y * frame_h,
-                hand_landmarks.landmark[ref_landmark_idx].x * frame_w,
-                hand_landmarks.landmark[ref_landmark_idx].y * frame_h
-            )
+        # Clicks and scrolling are only decided on real inferences
+        if hand.predicted:
+            return
 
-            # If any finger position doesn't match the scroll gesture, don't scroll
-            if finger_dist > threshold:
-                scroll_detected = False
-                break
+        started = stats.start()
+        timestamp = hand.timestamp if hand.timestamp is not None else time.monotonic()
+        self.gesture_engine.update(hand, timestamp)
+        scroll_detected = self.gesture_engine.action_active("scroll")
 
         # Handle scrolling if the scroll gesture is detected
         if scroll_detected:
             if not self.scroll_active:
                 self.scroll_active = True
-                self.prev_y = y
+                self.scroller.reset(raw_y, hand.timestamp)
+                events.record("scroll_start")
+                # Freeze any cursor glide so the page scrolls where the hand stopped
+                self.mouse.hold()
             else:
-                # Already in scroll mode, check for vertical movement
-                if self.scroll_cooldown <= 0:
-                    if y < self.prev_y - self.scroll_threshold:
-                        # Scroll up
-                        self.mouse.scroll(0, self.scroll_amount)
-                        self.prev_y = y
-                        self.scroll_cooldown = 3  # Add cooldown to prevent too rapid scrolling
-                        print("Scrolling up")
-                    elif y > self.prev_y + self.scroll_threshold:
-                        # Scroll down
-                        self.mouse.scroll(0, -self.scroll_amount)
-                        self.prev_y = y
-                        self.scroll_cooldown = 3  # Add cooldown to prevent too rapid scrolling
-                        print("Scrolling down")
-                else:
-                    self.scroll_cooldown -= 1
+                # Already in scroll mode, scroll with the hand's vertical velocity. The raw
+                # position keeps it frame rate independent; ScrollEngine filters the jitter
+                steps = self.scroller.update(raw_y, hand.timestamp)
+                if steps:
+                    self.mouse.scroll(0, steps)
+                    events.record("scroll", steps)
         else:
             # Scroll gesture not detected
             if self.scroll_active:
-                print("Scroll mode deactivated")
+                events.record("scroll_end")
             self.scroll_active = False
 
             # Process mouse clicks only if not scrolling
-            for index, finger in enumerate(FINGERTIPS):
-                # Left click gesture processing
-                if self.gesture_data.iloc[LEFT_CLICK, (index + 11)]:
-                    ref_landmark_idx = int(self.gesture_data.iloc[LEFT_CLICK, (index + 1)])
-                    threshold = self.gesture_data.iloc[LEFT_CLICK, (index + 6)]
-
-                    if ref_landmark_idx < 0 or ref_landmark_idx >= len(hand_landmarks.landmark):
-                        continue
-
-                    finger_dist = distance(
-                        hand_landmarks.landmark[finger].x * frame_w,
-                        hand_landmarks.landmark[finger].y * frame_h,
-                        hand_landmarks.landmark[ref_landmark_idx].x * frame_w,
-                        hand_landmarks.landmark[ref_landmark_idx].y * frame_h
-                    )
-
-                    if finger_dist < threshold:
-                        if not self.left_mouse_down:
-                            self.mouse.press(Button.left)
-                            self.left_mouse_down = True
-                            print("Left mouse down")
-                    else:
-                        if self.left_mouse_down:
-                            self.mouse.release(Button.left)
-                            self.left_mouse_down = False
-                            print("Left mouse up")
-
-                # Right click gesture processing
-                if self.gesture_data.iloc[RIGHT_CLICK, (index + 11)]:
-                    ref_landmark_idx = int(self.gesture_data.iloc[RIGHT_CLICK, (index + 1)])
-                    threshold = self.gesture_data.iloc[RIGHT_CLICK, (index + 6)]
-
-                    if ref_landmark_idx < 0 or ref_landmark_idx >= len(hand_landmarks.landmark):
-                        continue
-
-                    finger_dist = distance(
-                        hand_landmarks.landmark[finger].x * frame_w,
-                        hand_landmarks.landmark[finger].y * frame_h,
-                        hand_landmarks.landmark[ref_landmark_idx].x * frame_w,
-                        hand_landmarks.landmark[ref_landmark_idx].y * frame_h
-                    )
-
-                    if finger_dist < threshold:
-                        if not self.right_mouse_down:
-                            self.mouse.press(Button.right)
-                            self.right_mouse_down = True
-                            print("Right mouse down")
-                    else:
-                        if self.right_mouse_down:
-                            self.mouse.release(Button.right)
-                            self.right_mouse_down = False
-                            print("Right mouse up")
-
-    def smooth_position(self, x, y):
+            for button in BUTTONS:
+                pressed = self.gesture_engine.action_active(button)
+                if pressed and button not in self.buttons_down:
+                    self.mouse.press(button)
+                    self.buttons_down.add(button)
+                    events.record("press", BUTTON_CODES[button])
+                elif not pressed and button in self.buttons_down:
+                    self.mouse.release(button)
+                    self.buttons_down.discard(button)
+                    events.record("release", BUTTON_CODES[button])
+
+        stats.stop("gestures", started)
+
+    def raw_cursor_position(self, hand):
+        """
+        Map the hand's anchor landmark to an unsmoothed desktop position.
+
+        Args:
+            hand (LandmarkFrame): Landmark array of the tracked hand
+
+        Returns:
+            tuple: Raw (x, y) desktop coordinates
+        """
+        anchor_x, anchor_y = hand.points[INDEX_MCP, :2]
+        return self.monitors.layout.map_normalized(scale_position(anchor_x), scale_position(anchor_y))
+
+    def smooth_position(self, x, y, timestamp=None):
         """
         Apply smoothing to cursor movement to reduce jitter.
 
-        Uses a combination of averaging and momentum for smoother tracking.
+        Delegates to the configured smoother (moving average, One Euro or predictive).
 
         Args:
             x (int): Raw x-coordinate
             y (int): Raw y-coordinate
+            timestamp (float): Monotonic capture time of the position; defaults to now
 
         Returns:
             tuple: Smoothed (x, y) coordinates
         """
-        self.position_history.append((x, y))
-
-        if len(self.position_history) > self.history_size:
-            self.position_history.pop(0)
-
-        avg_x = sum(pos[0] for pos in self.position_history) / len(self.position_history)
-        avg_y = sum(pos[1] for pos in self.position_history) / len(self.position_history)
+        if timestamp is None:
+            timestamp = time.monotonic()
+        return self.smoother.filter(x, y, timestamp)
 
-        smoothed_x = int(self.previous_x * self.smoothing_factor + avg_x * (1 - self.smoothing_factor))
-        smoothed_y = int(self.previous_y * self.smoothing_factor + avg_y * (1 - self.smoothing_factor))
-
-        self.previous_x = smoothed_x
-        self.previous_y = smoothed_y
-
-        return smoothed_x, smoothed_y
-
-    def release_all_buttons(self):
+    def release_all_buttons(self, reason="hand_lost"):
         """
         Release any currently pressed mouse buttons.
-        Called when hand tracking is lost or stopped.
-        """
-        if self.left_mouse_down:
-            self.mouse.release(Button.left)
-            self.left_mouse_down = False
-            print("left mouse released (no hand)")
+        Called from the tracking thread when hand tracking is lost or stopped.
 
-        if self.right_mouse_down:
-            self.mouse.release(Button.right)
-            self.right_mouse_down = False
-            print("right mouse released (no hand)")
+        Args:
+            reason (str): Event recorded for each release, 'hand_lost' or 'stopped'
+        """
+        for button in BUTTONS:
+            if button in self.buttons_down:
+                self.mouse.release(button)
+                self.buttons_down.discard(button)
+                events.record(reason, BUTTON_CODES[button])
 
     def start_tracking(self):
         """
         Begin hand tracking and mouse control.
-        Initializes tracking state variables.
+        Safe to call from the UI thread: tracking state is reset by the
+        tracking thread on its next frame.
         """
+        self._restart_pending = True
         self.running = True
-        self.previous_x, self.previous_y = self.total_width // 2 + self.min_x, self.total_height // 2 + self.min_y
-        self.position_history = [(self.previous_x, self.previous_y)] * self.history_size
 
     def stop_tracking(self):
         """
         Stop hand tracking and mouse control.
-        Ensures all mouse buttons are released.
+        Safe to call from the UI thread: the tracking thread sees running
+        turn False before its next gesture update and releases any held
+        buttons itself, so a press racing with the stop is never left held.
         """
         self.running = False
-        self.release_all_buttons()
\ No newline at end of file
+
+    def _finish_stop(self):
+        """
+        Release buttons and forget gesture state after tracking stopped.
+        Runs on the tracking thread, or from close() once the pipeline has stopped.
+        """
+        self.tracked_hand = None
+        if self.buttons_down or self.scroll_active:
+            self.release_all_buttons("stopped")
+            self.scroll_active = False
+            self.gesture_engine.reset()
+
+    def close(self):
+        """
+        Release the processor's resources.
+        Stops tracking, the background monitor refresh, the mouse output and any inference process.
+        Call once the pipeline has stopped, so no tracking thread is still running.
+        """
+        self.stop_tracking()
+        self._finish_stop()
+        self.stop_recording()
+        self.monitors.stop()
+        self.mouse.close()
+        if self.inference_process is not None:
+            self.inference_process.stop()
+            self.inference_process = None
\ No newline at end of file
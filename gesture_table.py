@@ -0,0 +1,296 @@
+import csv
+import os
+import numpy as np
+from landmarks import NUM_LANDMARKS
+
+FINGERTIPS = [4, 8, 12, 16, 20]
+FINGER_NAMES = ["thumb", "index", "middle", "ring", "pinky"]
+
+
+def _parse_bool(value):
+    """
+    Parse a boolean cell from the gesture CSV.
+
+    Args:
+        value (str): Cell text such as 'True' or 'False'
+
+    Returns:
+        bool: Parsed value
+    """
+    return value.strip().lower() in ("true", "1", "yes")
+
+
+# Actions a gesture can drive; gestures named after an action default to it
+GESTURE_ACTIONS = ("left", "right", "scroll")
+DEFAULT_ACTIONS = {"left_click": "left", "right_click": "right", "scroll": "scroll"}
+
+# Threshold units: fractions of the hand size (wrist to middle MCP), or legacy pixels
+THRESHOLD_UNITS = ("hand", "px")
+# Hand size in pixels at the 640x480 capture size pixel thresholds were tuned for
+REFERENCE_HAND_SIZE = 100.0
+# Tables whose pixel thresholds have already been reported, so hot reloads stay quiet
+_migration_reported = set()
+
+
+class GestureTable:
+    """
+    Gesture rules from hand_gestures_data.csv compiled into dense NumPy arrays.
+    Each row is a gesture and each column one of the five fingers, so every
+    gesture's distance test can be evaluated in a single vectorized pass.
+
+    Besides the original columns, rows may set `release_<finger>` thresholds
+    (defaulting to the press thresholds), `min_hold_ms`, `priority`, `action`
+    and `units`, so older CSV files load unchanged.
+
+    Thresholds are compared against distances divided by the hand size, so
+    they do not depend on the capture resolution. Rows in `px` units, which
+    includes every file without a `units` column, are converted on load as if
+    measured on a REFERENCE_HAND_SIZE hand.
+
+    Args:
+        names (list): Gesture names, one per row
+        refs (numpy.ndarray): (G, 5) reference landmark index for each fingertip
+        thresholds (numpy.ndarray): (G, 5) distance in hand sizes below which each fingertip presses
+        enabled (numpy.ndarray): (G, 5) mask of fingertips that take part in each gesture
+        path (str): CSV file the table was compiled from
+        mtime (float): Modification time of the CSV when it was loaded
+        release_thresholds (numpy.ndarray): (G, 5) distance in hand sizes above which an
+            active gesture releases; defaults to thresholds
+        min_hold (numpy.ndarray): (G,) seconds the press condition must hold before activating
+        priority (numpy.ndarray): (G,) an active gesture suppresses gestures of lower priority
+        actions (list): Action from GESTURE_ACTIONS for each gesture, or '' for none
+    """
+
+    def __init__(self, names, refs, thresholds, enabled, path=None, mtime=None,
+                 release_thresholds=None, min_hold=None, priority=None, actions=None):
+        self.names = list(names)
+        count = len(self.names)
+        self.tips = np.tile(np.array(FINGERTIPS, dtype=np.intp), (count, 1))
+        self.refs = refs
+        self.thresholds = thresholds
+        self.enabled = enabled
+        self.path = path
+        self.mtime = mtime
+        self.release_thresholds = thresholds if release_thresholds is None else release_thresholds
+        self.min_hold = np.zeros(count) if min_hold is None else min_hold
+        self.priority = np.zeros(count, dtype=np.int32) if priority is None else priority
+        if actions is None:
+            actions = [DEFAULT_ACTIONS.get(name, "") for name in self.names]
+        self.actions = list(actions)
+        # Per-fingertip limits with disabled fingertips always passing and
+        # gestures without any enabled fingertip never matching, so matching
+        # needs a single comparison and reduction
+        never = ~enabled.any(axis=1)
+        self.press_limits = np.where(enabled, self.thresholds, np.inf).astype(np.float32)
+        self.release_limits = np.where(enabled, self.release_thresholds, np.inf).astype(np.float32)
+        self.press_limits[never] = -np.inf
+        self.release_limits[never] = -np.inf
+
+    @classmethod
+    def load(cls, path='hand_gestures_data.csv'):
+        """
+        Compile a gesture CSV into a GestureTable.
+
+        Args:
+            path (str): Path of the gesture CSV
+
+        Returns:
+            GestureTable: Compiled rule table
+        """
+        mtime = os.path.getmtime(path)
+        with open(path, newline='') as csv_file:
+            rows = list(csv.DictReader(csv_file))
+
+        count = len(rows)
+        names = []
+        actions = []
+        refs = np.zeros((count, len(FINGERTIPS)), dtype=np.intp)
+        thresholds = np.zeros((count, len(FINGERTIPS)), dtype=np.float32)
+        release_thresholds = np.zeros((count, len(FINGERTIPS)), dtype=np.float32)
+        enabled = np.zeros((count, len(FINGERTIPS)), dtype=bool)
+        min_hold = np.zeros(count, dtype=np.float64)
+        priority = np.zeros(count, dtype=np.int32)
+        migrated = []
+
+        for row_index, row in enumerate(rows):
+            name = row['name']
+            names.append(name)
+            units = (row.get('units') or 'px').strip().lower()
+            if units not in THRESHOLD_UNITS:
+                raise ValueError(f"Unknown units '{units}' for gesture '{name}'")
+            for finger_index, finger in enumerate(FINGER_NAMES):
+                ref = int(float(row[f'landmark_{finger}']))
+                valid_ref = 0 <= ref < NUM_LANDMARKS
+                refs[row_index, finger_index] = ref if valid_ref else 0
+                threshold = float(row[f'distance_{finger}'])
+                thresholds[row_index, finger_index] = threshold
+                release_thresholds[row_index, finger_index] = float(row.get(f'release_{finger}') or threshold)
+                enabled[row_index, finger_index] = valid_ref and _parse_bool(row.get(f'tf{finger_index}', 'False'))
+            if units == 'px':
+                thresholds[row_index] /= REFERENCE_HAND_SIZE
+                release_thresholds[row_index] /= REFERENCE_HAND_SIZE
+                migrated.append(name)
+            min_hold[row_index] = float(row.get('min_hold_ms') or 0) / 1000
+            priority[row_index] = int(float(row.get('priority') or 0))
+
+            action = (row.get('action') or DEFAULT_ACTIONS.get(name, '')).strip().lower()
+            if action and action not in GESTURE_ACTIONS:
+                raise ValueError(f"Unknown action '{action}' for gesture '{name}'")
+            actions.append(action)
+
+        if migrated and os.path.abspath(path) not in _migration_reported:
+            _migration_reported.add(os.path.abspath(path))
+            print(f"Gesture thresholds for {', '.join(migrated)} are in pixels; converted to hand sizes "
+                  f"assuming a {REFERENCE_HAND_SIZE:.0f} px hand. Set units to 'hand' in {path} to tune them directly.")
+        return cls(names, refs, thresholds, enabled, path=path, mtime=mtime,
+                   release_thresholds=release_thresholds, min_hold=min_hold, priority=priority,
+                   actions=actions)
+
+    def is_stale(self):
+        """
+        Check whether the CSV has changed since the table was compiled.
+
+        Returns:
+            bool: True if the file on disk is newer than this table
+        """
+        if self.path is None:
+            return False
+        try:
+            return os.path.getmtime(self.path) != self.mtime
+        except OSError:
+            return False
+
+    def index(self, name):
+        """
+        Get the row index of a named gesture.
+
+        Args:
+            name (str): Gesture name from the CSV
+
+        Returns:
+            int: Row index of the gesture
+        """
+        return self.names.index(name)
+
+    def used_landmarks(self):
+        """
+        Get every landmark that takes part in at least one enabled gesture.
+
+        Returns:
+            numpy.ndarray: Sorted landmark indices
+        """
+        return np.union1d(self.tips[self.enabled], self.refs[self.enabled])
+
+    def finger_distances(self, hand):
+        """
+        Gather every fingertip-to-reference distance for all gestures, in hand sizes.
+
+        Args:
+            hand (LandmarkFrame): Landmarks of the tracked hand
+
+        Returns:
+            numpy.ndarray: (G, 5) distances
+        """
+        return hand.distances[self.tips, self.refs] / np.float32(hand.hand_size)
+
+    def evaluate(self, hand):
+        """
+        Evaluate every gesture's press condition against one frame of landmarks.
+        A gesture matches when all of its enabled fingertips are within their
+        threshold distance of their reference landmark. This is stateless;
+        GestureEngine adds hysteresis, hold times and priority.
+
+        Args:
+            hand (LandmarkFrame): Landmarks of the tracked hand
+
+        Returns:
+            numpy.ndarray: (G,) boolean mask of matching gestures
+        """
+        return (self.finger_distances(hand) < self.press_limits).all(axis=1)
+
+
+class GestureEngine:
+    """
+    Stateful gesture recognizer driven by a GestureTable.
+    All gestures are updated in one batched pass per frame:
+
+    - an inactive gesture activates once every enabled fingertip is within its
+      press threshold and has stayed there for the gesture's minimum hold time
+    - an active gesture stays active until a fingertip moves past its release
+      threshold, so a hand resting near the boundary does not flicker
+    - an active gesture suppresses every gesture with a lower priority
+
+    Args:
+        table (GestureTable): Compiled gesture rules
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.reset()
+
+    def reset(self):
+        """
+        Deactivate every gesture, e.g. when the hand is lost.
+        """
+        count = len(self.table.names)
+        self.active = np.zeros(count, dtype=bool)
+        # when each gesture's press condition was first met, NaN if it is not met
+        self._since = np.full(count, np.nan)
+        self.output = np.zeros(count, dtype=bool)
+
+    def set_table(self, table):
+        """
+        Switch to a reloaded table, keeping the state of gestures that still exist.
+
+        Args:
+            table (GestureTable): New compiled gesture rules
+        """
+        old_table, active, since = self.table, self.active, self._since
+        self.table = table
+        self.reset()
+        for index, name in enumerate(table.names):
+            if name in old_table.names:
+                old_index = old_table.index(name)
+                self.active[index] = active[old_index]
+                self._since[index] = since[old_index]
+
+    def update(self, hand, timestamp):
+        """
+        Advance every gesture by one frame.
+
+        Args:
+            hand (LandmarkFrame): Landmarks of the tracked hand
+            timestamp (float): Monotonic capture time of the frame
+
+        Returns:
+            numpy.ndarray: (G,) boolean mask of gestures that are active after priority
+        """
+        table = self.table
+        # Active gestures are held by the release thresholds, inactive ones need the press thresholds
+        limits = np.where(self.active[:, None], table.release_limits, table.press_limits)
+        matched = (table.finger_distances(hand) < limits).all(axis=1)
+
+        # fmin keeps the time a still-matching gesture was first matched
+        self._since = np.where(matched, np.fmin(self._since, timestamp), np.nan)
+        self.active = matched & (self.active | (timestamp - self._since >= table.min_hold))
+
+        output = self.active
+        if output.any():
+            output = output & (table.priority >= table.priority[output].max())
+        self.output = output
+        return output
+
+    def action_active(self, action):
+        """
+        Whether any gesture bound to an action is active after the last update.
+
+        Args:
+            action (str): Action from GESTURE_ACTIONS
+
+        Returns:
+            bool: True if a gesture for the action is active
+        """
+        for index, gesture_action in enumerate(self.table.actions):
+            if gesture_action == action and self.output[index]:
+                return True
+        return False
@@ -0,0 +1,51 @@
+import signal
+import threading
+from config_manager import get_config_value
+from idle import idle_monitor_from_config
+from pipeline import TrackingPipeline
+
+
+def run_headless(processor):
+    """
+    Run hand tracking against the camera with no window and no preview.
+    No Tk, landmark drawing or image conversion happens, so each frame costs
+    only capture, inference and mouse output. Runs until SIGINT or SIGTERM.
+
+    Args:
+        processor (GestureProcessor): Processor that runs hand tracking and mouse control
+    """
+    processor.set_hand_preference(get_config_value('application', 'hand_preference', 'Right'))
+    processor.set_camera_orientation(get_config_value('application', 'camera_orientation', 'Front Facing'))
+
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        """
+        Signal handler that asks the main loop to shut down.
+
+        Args:
+            signum (int): Signal number received
+            frame: Current stack frame (unused)
+        """
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    video_source = get_config_value('application', 'video_source', '0')
+    pipeline = TrackingPipeline(processor, int(video_source), idle=idle_monitor_from_config())
+    pipeline.start()
+    processor.start_tracking()
+    print("NoMouse running headless - press Ctrl+C to stop")
+
+    try:
+        # Wake periodically so signals are handled promptly on every platform
+        while not stop_event.wait(0.5):
+            pass
+    finally:
+        processor.running = False
+        pipeline.stop()
+        processor.close()
+        if pipeline.idle.idle_periods:
+            print(f"Idle mode: {pipeline.idle.summary()}")
+        print("NoMouse stopped")
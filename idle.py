@@ -0,0 +1,175 @@
+import time
+import numpy as np
+from config_manager import get_config_value, get_config_boolean
+
+# Change in a sampled pixel's level, out of 255, that counts as motion rather than sensor noise
+MOTION_LEVEL = 24
+
+
+class IdleMonitor:
+    """
+    Switches tracking into a low power state while no hand is in view.
+    After timeout seconds without a hand the pipeline drops to idle: frames are
+    passed to inference at only fps per second, inference runs on a downscaled
+    image and the preview stops rendering. The first frame with a hand switches
+    straight back, so full tracking resumes on the next frame.
+
+    On its own that means a hand can wait up to 1 / fps seconds to be seen. With
+    a motion threshold, frames between the idle ones are compared on a coarse
+    grid of pixels, and one where enough of the image changed is passed to
+    inference straight away, so a hand entering the view wakes tracking within
+    a frame or two.
+
+    Process CPU time is sampled on every update, so the CPU time idle mode
+    saves can be estimated from the active and idle usage rates.
+
+    Args:
+        timeout (float): Seconds without a hand before going idle
+        fps (float): Frames per second passed to inference while idle
+        enabled (bool): Whether idle mode is used at all
+        motion (float): Fraction of the sampled pixels that must change to wake early, or 0 to only wake at fps
+    """
+
+    def __init__(self, timeout=30.0, fps=5.0, enabled=True, motion=0.02):
+        self.timeout = timeout
+        self.interval = 1.0 / fps if fps > 0 else 0.0
+        self.enabled = enabled
+        self.motion = motion
+        self.idle = False
+        self.idle_periods = 0
+        self._last_hand = time.monotonic()
+        self._last_frame = 0.0
+        # wall and CPU seconds spent in each state, indexed by self.idle
+        self._wall = [0.0, 0.0]
+        self._cpu = [0.0, 0.0]
+        self._last_sample = None
+        # Coarse green channel of the previous frame read while idle
+        self._thumbnail = None
+
+    def frame_due(self, now):
+        """
+        Whether a captured frame should be passed on for inference.
+        Always true while active; limited to fps per second while idle.
+
+        Args:
+            now (float): Monotonic time of the frame
+
+        Returns:
+            bool: True if the frame should be processed
+        """
+        if not self.idle:
+            return True
+        if now - self._last_frame < self.interval:
+            return False
+        self._last_frame = now
+        return True
+
+    def moved(self, frame):
+        """
+        Whether the image changed noticeably since the previous call.
+        Only a pixel in every 16 in each direction is compared, so this costs far
+        less than the frame decode it follows.
+
+        Args:
+            frame (numpy.ndarray): (H, W, 3) BGR frame
+
+        Returns:
+            bool: True if more than the motion fraction of the sampled pixels changed
+        """
+        thumbnail = frame[::16, ::16, 1].astype(np.int16)
+        previous, self._thumbnail = self._thumbnail, thumbnail
+        if previous is None or previous.shape != thumbnail.shape:
+            return False
+        changed = np.count_nonzero(np.abs(thumbnail - previous) > MOTION_LEVEL)
+        return changed > self.motion * thumbnail.size
+
+    def update(self, hand_present, now):
+        """
+        Advance the state machine after a frame has been processed.
+
+        Args:
+            hand_present (bool): Whether the frame had a tracked hand
+            now (float): Monotonic time of the frame
+
+        Returns:
+            bool: True if the state changed
+        """
+        self._sample(now)
+        if hand_present:
+            self._last_hand = now
+            if self.idle:
+                self.idle = False
+                return True
+            return False
+
+        if self.enabled and not self.idle and now - self._last_hand >= self.timeout:
+            self.idle = True
+            self.idle_periods += 1
+            self._last_frame = now
+            self._thumbnail = None
+            return True
+        return False
+
+    def reset(self):
+        """
+        Return to the active state, e.g. when tracking stops, and restart the timeout.
+        """
+        now = time.monotonic()
+        if self._last_sample is not None:
+            self._sample(now)
+            # Usage while tracking is stopped says nothing about either state
+            self._last_sample = None
+        self.idle = False
+        self._last_hand = now
+
+    def _sample(self, now):
+        """
+        Charge the wall and CPU time since the last sample to the current state.
+
+        Args:
+            now (float): Monotonic time of the sample
+        """
+        cpu = time.process_time()
+        if self._last_sample is not None:
+            last_now, last_cpu = self._last_sample
+            self._wall[self.idle] += now - last_now
+            self._cpu[self.idle] += cpu - last_cpu
+        self._last_sample = (now, cpu)
+
+    @property
+    def cpu_saved(self):
+        """
+        Estimated CPU time idle mode has saved.
+
+        Returns:
+            float: Seconds of CPU time, 0 until both states have been measured
+        """
+        active_wall, idle_wall = self._wall
+        if active_wall <= 0 or idle_wall <= 0:
+            return 0.0
+        active_rate = self._cpu[0] / active_wall
+        idle_rate = self._cpu[1] / idle_wall
+        return max(0.0, (active_rate - idle_rate) * idle_wall)
+
+    def summary(self):
+        """
+        Describe the time spent idle and the CPU time it saved.
+
+        Returns:
+            str: e.g. 'idle 3 times for 412 s, saved 95.2 s of CPU time'
+        """
+        return (f"idle {self.idle_periods} time{'s' if self.idle_periods != 1 else ''} for "
+                f"{self._wall[1]:.0f} s, saved {self.cpu_saved:.1f} s of CPU time")
+
+
+def idle_monitor_from_config():
+    """
+    Build an IdleMonitor from the [power] section of settings.ini.
+
+    Returns:
+        IdleMonitor: Configured monitor
+    """
+    return IdleMonitor(timeout=float(get_config_value('power', 'idle_timeout', '30')),
+                       fps=float(get_config_value('power', 'idle_fps', '5')),
+                       enabled=get_config_boolean('power', 'idle', True),
+                       motion=float(get_config_value('power', 'idle_motion', '0.02')))
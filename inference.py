@@ -0,0 +1,406 @@
+import threading
+import time
+import cv2
+import numpy as np
+from landmarks import LandmarkFrame, landmarks_to_array
+
+# (model_complexity, max_num_hands) from cheapest to most capable
+MODEL_LEVELS = ((0, 1), (1, 1), (1, 2))
+
+# MediaPipe handedness label seen in a mirrored frame for each label in the original
+MIRRORED_HANDEDNESS = {"Left": "Right", "Right": "Left"}
+
+
+def convert_to_rgb(frame, buffer=None):
+    """
+    Convert a BGR camera frame to RGB without allocating once warmed up.
+
+    Args:
+        frame (numpy.ndarray): (H, W, 3) BGR frame
+        buffer (numpy.ndarray): RGB buffer returned by the previous call, or None
+
+    Returns:
+        numpy.ndarray: The RGB frame, in buffer if it has the right shape
+    """
+    if buffer is None or buffer.shape != frame.shape:
+        buffer = np.empty_like(frame)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buffer)
+
+
+def describe_level(level):
+    """
+    Human readable description of a model level.
+
+    Args:
+        level (int): Index into MODEL_LEVELS
+
+    Returns:
+        str: e.g. 'complexity 1, 2 hands'
+    """
+    complexity, max_hands = MODEL_LEVELS[level]
+    return f"complexity {complexity}, {max_hands} hand{'s' if max_hands > 1 else ''}"
+
+
+def create_hands(model_complexity, max_num_hands):
+    """
+    Build a MediaPipe Hands model.
+
+    Args:
+        model_complexity (int): 0 for the lite model, 1 for the full model
+        max_num_hands (int): Maximum number of hands to detect
+
+    Returns:
+        mediapipe.solutions.hands.Hands: The new model
+    """
+    import mediapipe as mp
+
+    return mp.solutions.hands.Hands(static_image_mode=False,
+                                    model_complexity=model_complexity,
+                                    min_detection_confidence=0.7,
+                                    min_tracking_confidence=0.7,
+                                    max_num_hands=max_num_hands)
+
+
+class HandInference:
+    """
+    Inference front end around MediaPipe Hands.
+    Once a hand has been found, only a padded region of interest around it is
+    passed to hands.process, optionally downscaled. Landmarks are mapped back
+    to full-frame normalized coordinates, and detection falls back to the full
+    frame as soon as the hand is lost.
+
+    The ROI only moves when the hand nears its edge or changes size, so
+    MediaPipe's own frame-to-frame tracking sees a stable image. Crops and
+    downscaled images are written into reused buffers, and front facing
+    frames are never flipped: the landmarks are mirrored instead.
+
+    Args:
+        hands (mediapipe.solutions.hands.Hands): Hands model to run
+        roi (bool): Whether to crop to the previous hand's region of interest
+        padding (float): ROI padding on each side, as a fraction of the hand's size
+        scale (float): Factor applied to the inference image size (0-1]
+        idle_scale (float): Factor used instead of scale in idle mode, while no hand is in view
+    """
+
+    def __init__(self, hands, roi=True, padding=0.5, scale=1.0, idle_scale=0.5):
+        self.hands = hands
+        self.roi_enabled = roi
+        self.padding = padding
+        self.scale = min(max(scale, 0.1), 1.0)
+        self.idle_scale = min(max(idle_scale, 0.1), self.scale)
+        self.idle = False
+        self.roi = None
+        self.full_frame_detections = 0
+        self.roi_detections = 0
+        # flat scratch memory for ROI crops and downscaled images, grown as needed
+        self._crop_buffer = np.empty(0, dtype=np.uint8)
+        self._scaled_buffer = np.empty(0, dtype=np.uint8)
+
+    def reset(self):
+        """
+        Forget the current ROI so the next frame uses full-frame detection.
+        """
+        self.roi = None
+
+    def set_idle(self, idle):
+        """
+        Switch between the normal and the cheaper idle inference scale.
+
+        Args:
+            idle (bool): Whether no hand has been in view for a while
+        """
+        self.idle = idle
+        self.roi = None
+
+    def detect(self, image, timestamp=None, preferred=None, mirror=False):
+        """
+        Detect hands in an RGB frame.
+
+        Args:
+            image (numpy.ndarray): RGB frame as captured
+            timestamp (float): Monotonic capture time of the frame
+            preferred (str): Handedness label of the hand the ROI should follow
+            mirror (bool): Report landmarks and handedness as if the frame had been
+                flipped horizontally, for front facing cameras
+
+        Returns:
+            list: LandmarkFrame for each detected hand, in full-frame coordinates
+        """
+        frame_h, frame_w = image.shape[:2]
+        if mirror:
+            # The ROI lives in image coordinates, where left and right are swapped
+            preferred = MIRRORED_HANDEDNESS.get(preferred, preferred)
+
+        if self.roi_enabled and self.roi is not None:
+            hands = self._run(image, self.roi, frame_w, frame_h, timestamp)
+            roi_hand = self._roi_hand(hands, preferred)
+            if roi_hand is not None:
+                self.roi_detections += 1
+                self._update_roi(roi_hand.points, frame_w, frame_h)
+                return self._mirror(hands) if mirror else hands
+            # Preferred hand lost inside the ROI: retry on the whole frame right away
+            self.roi = None
+
+        hands = self._run(image, None, frame_w, frame_h, timestamp)
+        self.full_frame_detections += 1
+        roi_hand = self._roi_hand(hands, preferred)
+        if roi_hand is not None and self.roi_enabled:
+            self._update_roi(roi_hand.points, frame_w, frame_h)
+        return self._mirror(hands) if mirror else hands
+
+    @staticmethod
+    def _mirror(hands):
+        """
+        Flip detections horizontally in place.
+        MediaPipe labels handedness assuming a mirrored image, so labels are
+        swapped along with the x coordinates.
+
+        Args:
+            hands (list): LandmarkFrames in image coordinates
+
+        Returns:
+            list: The same LandmarkFrames, mirrored
+        """
+        for hand in hands:
+            points = hand.points
+            np.subtract(1.0, points[:, 0], out=points[:, 0])
+            hand.handedness = MIRRORED_HANDEDNESS.get(hand.handedness, hand.handedness)
+        return hands
+
+    @staticmethod
+    def _roi_hand(hands, preferred):
+        """
+        Pick the hand the ROI should follow.
+        The ROI never follows another hand: it would hide the preferred hand
+        from detection for as long as the other hand stays in view.
+
+        Args:
+            hands (list): Detected LandmarkFrames
+            preferred (str): Preferred handedness label, or None to follow any hand
+
+        Returns:
+            LandmarkFrame: The preferred hand, or None if it was not detected
+        """
+        for hand in hands:
+            if preferred is None or hand.handedness == preferred:
+                return hand
+        return None
+
+    def _run(self, image, roi, frame_w, frame_h, timestamp):
+        """
+        Run the model on the whole frame or an ROI and map results to full-frame coordinates.
+
+        Args:
+            image (numpy.ndarray): RGB frame
+            roi (tuple): (x0, y0, x1, y1) crop in pixels, or None for the whole frame
+            frame_w (int): Frame width in pixels
+            frame_h (int): Frame height in pixels
+            timestamp (float): Monotonic capture time of the frame
+
+        Returns:
+            list: LandmarkFrame for each detected hand
+        """
+        if roi is None:
+            x0, y0, x1, y1 = 0, 0, frame_w, frame_h
+            crop = image
+        else:
+            x0, y0, x1, y1 = roi
+            crop = image[y0:y1, x0:x1]
+
+        crop_w, crop_h = x1 - x0, y1 - y0
+        scale = self.idle_scale if self.idle else self.scale
+        if scale < 1.0:
+            size = (max(1, int(crop_w * scale)), max(1, int(crop_h * scale)))
+            self._scaled_buffer, scaled = self._view(self._scaled_buffer, (size[1], size[0], 3))
+            crop = cv2.resize(crop, size, dst=scaled, interpolation=cv2.INTER_AREA)
+        elif roi is not None:
+            self._crop_buffer, contiguous = self._view(self._crop_buffer, crop.shape)
+            np.copyto(contiguous, crop)
+            crop = contiguous
+
+        crop.flags.writeable = False
+        results = self.hands.process(crop)
+        crop.flags.writeable = True
+
+        if not results.multi_hand_landmarks:
+            return []
+
+        offset = np.array([x0 / frame_w, y0 / frame_h, 0.0], dtype=np.float32)
+        factor = np.array([crop_w / frame_w, crop_h / frame_h, crop_w / frame_w], dtype=np.float32)
+
+        hands = []
+        for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
+            points = landmarks_to_array(hand_landmarks)
+            if roi is not None:
+                points = points * factor + offset
+            classification = handedness.classification[0]
+            hands.append(LandmarkFrame(points, frame_w, frame_h, classification.label, timestamp,
+                                       confidence=classification.score))
+        return hands
+
+    @staticmethod
+    def _view(buffer, shape):
+        """
+        Get a contiguous image of the given shape backed by a reused buffer.
+
+        Args:
+            buffer (numpy.ndarray): Flat uint8 scratch buffer
+            shape (tuple): (height, width, channels) of the image needed
+
+        Returns:
+            tuple: (buffer, grown if it was too small; image view into it)
+        """
+        size = shape[0] * shape[1] * shape[2]
+        if buffer.size < size:
+            buffer = np.empty(size, dtype=np.uint8)
+        return buffer, buffer[:size].reshape(shape)
+
+    def _update_roi(self, points, frame_w, frame_h):
+        """
+        Move the ROI to cover the hand, keeping it in place while the hand stays well inside.
+
+        Args:
+            points (numpy.ndarray): (21, 3) full-frame normalized landmarks of the tracked hand
+            frame_w (int): Frame width in pixels
+            frame_h (int): Frame height in pixels
+        """
+        xs = points[:, 0] * frame_w
+        ys = points[:, 1] * frame_h
+        hand_x0, hand_x1 = float(xs.min()), float(xs.max())
+        hand_y0, hand_y1 = float(ys.min()), float(ys.max())
+        size = max(hand_x1 - hand_x0, hand_y1 - hand_y0)
+
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            margin = size * self.padding * 0.5
+            inside = (hand_x0 - margin >= x0 and hand_x1 + margin <= x1 and
+                      hand_y0 - margin >= y0 and hand_y1 + margin <= y1)
+            # Keep the ROI unless the hand nears its edge or has shrunk a lot
+            if inside and (x1 - x0) < 3 * size * (1 + 2 * self.padding):
+                return
+
+        half = size * (0.5 + self.padding)
+        center_x = (hand_x0 + hand_x1) / 2
+        center_y = (hand_y0 + hand_y1) / 2
+        x0 = int(max(0, center_x - half))
+        y0 = int(max(0, center_y - half))
+        x1 = int(min(frame_w, center_x + half))
+        y1 = int(min(frame_h, center_y + half))
+
+        if x1 - x0 < 16 or y1 - y0 < 16:
+            self.roi = None
+        else:
+            self.roi = (x0, y0, x1, y1)
+
+
+class ModelGovernor:
+    """
+    Adjusts MediaPipe model complexity and hand count to fit a frame budget.
+    Inference latency is tracked with an exponential moving average. The
+    governor steps down a level when latency stays over budget and steps back
+    up when there is plenty of headroom, with a cooldown between changes to
+    avoid flapping. New models are built on a background thread and swapped in
+    on the inference thread, so tracking never stalls and smoothing, button and
+    ROI state are kept across switches.
+
+    Args:
+        inference (HandInference): Front end whose model is managed
+        create_hands (callable): Builds a Hands model from (model_complexity, max_num_hands)
+        budget (float): Target inference time per frame in seconds
+        enabled (bool): Whether the level may change automatically
+        level (int): Initial index into MODEL_LEVELS
+    """
+
+    def __init__(self, inference, create_hands, budget=1 / 30, enabled=True, level=len(MODEL_LEVELS) - 1):
+        self.inference = inference
+        self.create_hands = create_hands
+        self.budget = budget
+        self.enabled = enabled
+        self.level = level
+        self.average = None
+        self.smoothing = 0.1
+        self.cooldown = 5.0
+        self._last_change = time.monotonic()
+        self._pending = None
+        self._building = False
+
+        self.inference.hands = self.create_hands(*MODEL_LEVELS[level])
+
+    @property
+    def mode(self):
+        """
+        Human readable description of the active model.
+
+        Returns:
+            str: e.g. 'complexity 1, 2 hands'
+        """
+        return describe_level(self.level)
+
+    def observe(self, seconds):
+        """
+        Record one inference time and adjust the level if needed.
+        Must be called from the thread that runs inference.
+
+        Args:
+            seconds (float): Time hands.process took for the latest frame
+        """
+        if self._pending is not None:
+            self._swap_in()
+
+        if self.average is None:
+            self.average = seconds
+        else:
+            self.average += self.smoothing * (seconds - self.average)
+
+        if not self.enabled or self._building:
+            return
+        if time.monotonic() - self._last_change < self.cooldown:
+            return
+
+        if self.average > self.budget * 0.9 and self.level > 0:
+            self.set_level(self.level - 1)
+        elif self.average < self.budget * 0.4 and self.level < len(MODEL_LEVELS) - 1:
+            self.set_level(self.level + 1)
+
+    def set_level(self, level):
+        """
+        Switch to another model level in the background.
+
+        Args:
+            level (int): Index into MODEL_LEVELS
+        """
+        if level == self.level or self._building:
+            return
+
+        self._building = True
+
+        def build():
+            """
+            Build the new model off the inference thread.
+            """
+            try:
+                self._pending = (level, self.create_hands(*MODEL_LEVELS[level]))
+            except Exception as e:
+                print(f"Error switching hand model: {e}")
+                # Wait out the cooldown before trying again instead of retrying every frame
+                self._last_change = time.monotonic()
+                self._building = False
+
+        threading.Thread(target=build, name="nomouse-model-build", daemon=True).start()
+
+    def _swap_in(self):
+        """
+        Replace the running model with the one built in the background.
+        """
+        level, hands = self._pending
+        self._pending = None
+        old_hands = self.inference.hands
+        self.inference.hands = hands
+        old_hands.close()
+
+        self.level = level
+        # Latency of the new model has not been measured yet
+        self.average = None
+        self._last_change = time.monotonic()
+        self._building = False
+        print(f"Hand model switched to {self.mode}")
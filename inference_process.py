@@ -0,0 +1,516 @@
+import multiprocessing
+import threading
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from landmarks import LandmarkFrame, NUM_LANDMARKS
+
+MAX_HANDS = 2
+HANDEDNESS_LABELS = ("Left", "Right")
+
+# Worker states reported in the result block
+STATE_LOADING = 0
+STATE_READY = 1
+
+RESULT_DTYPE = np.dtype([
+    ('sequence', '<i8'),        # odd while the worker is writing
+    ('timestamp', '<f8'),       # capture time of the frame the result is for
+    ('state', '<i4'),
+    ('count', '<i4'),
+    ('frame_w', '<i4'),
+    ('frame_h', '<i4'),
+    ('inference_ms', '<f4'),
+    ('level', '<i4'),           # governor's model level, -1 if unknown
+    ('handedness', '<i4', (MAX_HANDS,)),
+    ('confidence', '<f4', (MAX_HANDS,)),
+    ('landmarks', '<f4', (MAX_HANDS, NUM_LANDMARKS, 3)),
+])
+
+
+class SharedFrameRing:
+    """
+    Ring of camera frames in shared memory, written by the capture thread and
+    read by the inference process without pickling.
+    The writer never touches the newest slot or the slot being read, so with
+    three slots it never waits and the reader never sees a torn frame. Each
+    slot records its frame's sequence number, size, capture time, whether its
+    detections should be mirrored and whether the pipeline is idle.
+
+    Args:
+        name (str): Name of an existing ring to attach to, or None to create one
+        slots (int): Number of frame slots when creating
+        capacity (int): Bytes per slot when creating, enough for the largest frame
+    """
+
+    # control words: newest slot, slot being read, preferred hand, frames written
+    LATEST, READING, PREFERRED, WRITTEN = range(4)
+
+    def __init__(self, name=None, slots=3, capacity=1920 * 1080 * 3):
+        if name is None:
+            size = 8 * 4 + 8 * 5 * slots + 8 * slots + slots * capacity + 16
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            # slot count and capacity lead the block so readers can attach by name alone
+            np.ndarray(2, dtype=np.int64, buffer=self.shm.buf)[:] = (slots, capacity)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        slots, capacity = (int(value) for value in np.ndarray(2, dtype=np.int64, buffer=self.shm.buf))
+        self.slots = slots
+        self.capacity = capacity
+
+        offset = 16
+        self.control = np.ndarray(4, dtype=np.int64, buffer=self.shm.buf, offset=offset)
+        offset += self.control.nbytes
+        # per slot: sequence, height, width, mirror, idle
+        self.slot_info = np.ndarray((slots, 5), dtype=np.int64, buffer=self.shm.buf, offset=offset)
+        offset += self.slot_info.nbytes
+        self.timestamps = np.ndarray(slots, dtype=np.float64, buffer=self.shm.buf, offset=offset)
+        offset += self.timestamps.nbytes
+        self.frames = np.ndarray((slots, capacity), dtype=np.uint8, buffer=self.shm.buf, offset=offset)
+
+        if name is None:
+            self.control[:] = (-1, -1, 1, 0)
+
+    @property
+    def name(self):
+        """
+        Name other processes attach with.
+
+        Returns:
+            str: Shared memory block name
+        """
+        return self.shm.name
+
+    def write(self, frame, timestamp, mirror, idle=False):
+        """
+        Copy a BGR frame into a free slot and publish it as the newest.
+
+        Args:
+            frame (numpy.ndarray): (H, W, 3) uint8 frame
+            timestamp (float): Monotonic capture time
+            mirror (bool): Whether detections should be mirrored, for front facing cameras
+            idle (bool): Whether to use the cheaper idle inference pass
+
+        Returns:
+            bool: False if the frame is too large for the ring
+        """
+        if frame.nbytes > self.capacity:
+            return False
+        control = self.control
+        latest, reading = control[self.LATEST], control[self.READING]
+        slot = next(index for index in range(self.slots) if index != latest and index != reading)
+
+        height, width = frame.shape[:2]
+        np.copyto(self.frames[slot, :frame.nbytes].reshape(frame.shape), frame)
+        written = int(control[self.WRITTEN]) + 1
+        self.timestamps[slot] = timestamp
+        self.slot_info[slot] = (written, height, width, mirror, idle)
+        control[self.WRITTEN] = written
+        control[self.LATEST] = slot
+        return True
+
+    def acquire_latest(self, after):
+        """
+        Reserve the newest frame for reading.
+
+        Args:
+            after (int): Sequence number of the last frame read
+
+        Returns:
+            tuple: (slot, sequence, timestamp, frame view, mirror, idle), or None if no newer frame
+        """
+        control = self.control
+        while True:
+            slot = int(control[self.LATEST])
+            if slot < 0 or self.slot_info[slot, 0] <= after:
+                return None
+            control[self.READING] = slot
+            # The writer may have reused the slot before it saw our reservation
+            if int(control[self.LATEST]) == slot:
+                break
+        sequence, height, width, mirror, idle = (int(value) for value in self.slot_info[slot])
+        frame = self.frames[slot, :height * width * 3].reshape(height, width, 3)
+        return slot, sequence, float(self.timestamps[slot]), frame, bool(mirror), bool(idle)
+
+    def release(self):
+        """
+        End the current read so the writer may reuse its slot.
+        """
+        self.control[self.READING] = -1
+
+    def close(self, unlink=False):
+        """
+        Detach from the ring.
+
+        Args:
+            unlink (bool): Also free the shared memory; only the creator should do this
+        """
+        del self.control, self.slot_info, self.timestamps, self.frames
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+class SharedResults:
+    """
+    Single result record in shared memory, written by the inference process.
+    A sequence number that is odd during writes lets the reader detect and
+    retry a read that overlapped a write, without locks.
+
+    Args:
+        name (str): Name of an existing block to attach to, or None to create one
+    """
+
+    # Attempts before read() gives up, so a writer killed mid-write cannot hang the reader
+    READ_RETRIES = 10000
+
+    def __init__(self, name=None):
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=RESULT_DTYPE.itemsize)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.record = np.ndarray(1, dtype=RESULT_DTYPE, buffer=self.shm.buf)
+        if name is None:
+            self.record[0] = np.zeros((), dtype=RESULT_DTYPE)
+
+    @property
+    def name(self):
+        """
+        Name other processes attach with.
+
+        Returns:
+            str: Shared memory block name
+        """
+        return self.shm.name
+
+    def write(self, state, timestamp=0.0, hands=(), frame_w=0, frame_h=0, inference_ms=0.0, level=-1):
+        """
+        Publish one frame's detections.
+
+        Args:
+            state (int): STATE_LOADING or STATE_READY
+            timestamp (float): Capture time of the frame
+            hands (list): LandmarkFrame for each detected hand
+            frame_w (int): Frame width in pixels
+            frame_h (int): Frame height in pixels
+            inference_ms (float): Time hands.process took
+            level (int): Model level the governor has active, -1 if unknown
+        """
+        record = self.record[0]
+        # Start from an even number even if a previous writer died mid-write
+        sequence = int(record['sequence']) & ~1
+        record['sequence'] = sequence + 1
+        record['timestamp'] = timestamp
+        record['state'] = state
+        record['frame_w'] = frame_w
+        record['frame_h'] = frame_h
+        record['inference_ms'] = inference_ms
+        record['level'] = level
+        count = min(len(hands), MAX_HANDS)
+        record['count'] = count
+        for index in range(count):
+            hand = hands[index]
+            record['handedness'][index] = HANDEDNESS_LABELS.index(hand.handedness) \
+                if hand.handedness in HANDEDNESS_LABELS else -1
+            record['confidence'][index] = hand.confidence if hand.confidence is not None else np.nan
+            record['landmarks'][index] = hand.points
+        record['sequence'] = sequence + 2
+
+    def read(self):
+        """
+        Take a consistent copy of the current record.
+
+        Returns:
+            numpy.void: Copy of the record, or None if it stayed mid-write for READ_RETRIES attempts
+        """
+        record = self.record
+        for _ in range(self.READ_RETRIES):
+            before = int(record[0]['sequence'])
+            if before % 2:
+                continue
+            copy = record[0].copy()
+            if int(record[0]['sequence']) == before:
+                return copy
+        return None
+
+    def recover(self):
+        """
+        Mark the record as loading after its writer died, possibly mid-write.
+        Rounds the sequence up to even so readers stop waiting for the write to finish.
+        """
+        record = self.record[0]
+        sequence = int(record['sequence'])
+        record['sequence'] = sequence + sequence % 2
+        record['state'] = STATE_LOADING
+
+    def close(self, unlink=False):
+        """
+        Detach from the block.
+
+        Args:
+            unlink (bool): Also free the shared memory; only the creator should do this
+        """
+        del self.record
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def hands_from_record(record):
+    """
+    Rebuild LandmarkFrames from a result record.
+
+    Args:
+        record (numpy.void): Record from SharedResults.read
+
+    Returns:
+        list: LandmarkFrame for each detected hand
+    """
+    hands = []
+    for index in range(int(record['count'])):
+        code = int(record['handedness'][index])
+        confidence = float(record['confidence'][index])
+        hands.append(LandmarkFrame(np.array(record['landmarks'][index]), int(record['frame_w']),
+                                   int(record['frame_h']), HANDEDNESS_LABELS[code] if code >= 0 else None,
+                                   float(record['timestamp']), None if np.isnan(confidence) else confidence))
+    return hands
+
+
+def create_hand_inference(settings):
+    """
+    Build the MediaPipe front end and governor inside the worker process.
+
+    Args:
+        settings (dict): 'roi', 'roi_padding', 'scale', 'idle_scale', 'governor' and 'frame_budget' values
+
+    Returns:
+        tuple: (HandInference, ModelGovernor)
+    """
+    from inference import HandInference, ModelGovernor, MODEL_LEVELS, create_hands
+
+    inference = HandInference(None, roi=settings['roi'], padding=settings['roi_padding'], scale=settings['scale'],
+                              idle_scale=settings['idle_scale'])
+    governor = ModelGovernor(inference, create_hands, budget=settings['frame_budget'],
+                             enabled=settings['governor'], level=len(MODEL_LEVELS) - 1)
+    return inference, governor
+
+
+def run_worker(ring_name, results_name, frame_ready, result_ready, stop_event, settings,
+               factory=create_hand_inference):
+    """
+    Inference process main loop: convert the newest frame, run MediaPipe on
+    it and publish the detections.
+
+    Args:
+        ring_name (str): SharedFrameRing to read frames from
+        results_name (str): SharedResults to publish detections to
+        frame_ready (multiprocessing.Event): Set by the capture thread after each frame
+        result_ready (multiprocessing.Event): Set after each published result
+        stop_event (multiprocessing.Event): Set to ask the worker to exit
+        settings (dict): Inference settings passed to factory
+        factory (callable): Builds (HandInference, ModelGovernor) from settings
+    """
+    from inference import convert_to_rgb
+
+    ring = SharedFrameRing(ring_name)
+    results = SharedResults(results_name)
+    inference, governor = factory(settings)
+    results.write(STATE_READY, level=governor.level)
+    result_ready.set()
+
+    rgb = None
+    last_sequence = 0
+    try:
+        while not stop_event.is_set():
+            if not frame_ready.wait(0.1):
+                continue
+            frame_ready.clear()
+            acquired = ring.acquire_latest(last_sequence)
+            if acquired is None:
+                continue
+
+            _, last_sequence, timestamp, frame, mirror, idle = acquired
+            try:
+                rgb = convert_to_rgb(frame, rgb)
+            finally:
+                ring.release()
+            del frame
+
+            preferred = HANDEDNESS_LABELS[int(ring.control[SharedFrameRing.PREFERRED])]
+            if idle != inference.idle:
+                inference.set_idle(idle)
+            started = time.perf_counter()
+            hands = inference.detect(rgb, timestamp, preferred, mirror)
+            elapsed = time.perf_counter() - started
+            governor.observe(elapsed)
+
+            results.write(STATE_READY, timestamp, hands, rgb.shape[1], rgb.shape[0], elapsed * 1000, governor.level)
+            result_ready.set()
+    finally:
+        ring.close()
+        results.close()
+
+
+class InferenceProcess:
+    """
+    Runs hand inference in a supervised worker process.
+    Frames go to the worker through a SharedFrameRing and detections come
+    back through SharedResults, so nothing is pickled per frame and MediaPipe
+    never competes with Tk or mouse output for the GIL. A supervisor thread
+    restarts the worker if it dies, backing off if it keeps crashing.
+
+    Args:
+        settings (dict): Inference settings for the worker, see create_hand_inference
+        factory (callable): Module-level function building (HandInference, ModelGovernor) in the worker
+        capacity (int): Largest frame in bytes the ring holds; larger frames are downscaled to fit
+    """
+
+    def __init__(self, settings, factory=create_hand_inference, capacity=1920 * 1080 * 3):
+        self.settings = settings
+        self.factory = factory
+        self._context = multiprocessing.get_context("spawn")
+        self.ring = SharedFrameRing(capacity=capacity)
+        self.results = SharedResults()
+        self.frame_ready = self._context.Event()
+        self.result_ready = self._context.Event()
+        self._stop_event = self._context.Event()
+        self._process = None
+        self._supervisor = None
+        self._running = False
+        self.restarts = 0
+        self._last_sequence = 0
+        self._oversize_reported = False
+        # Model level the worker's governor last reported, -1 until it has loaded
+        self.level = -1
+
+    @property
+    def ready(self):
+        """
+        Whether the worker has loaded its model.
+
+        Returns:
+            bool: True once the worker is processing frames
+        """
+        return int(self.results.record[0]['state']) == STATE_READY
+
+    def start(self):
+        """
+        Start the worker process and its supervisor.
+        """
+        self._running = True
+        self._spawn()
+        self._supervisor = threading.Thread(target=self._supervise, name="nomouse-inference-supervisor",
+                                            daemon=True)
+        self._supervisor.start()
+
+    def stop(self):
+        """
+        Stop the worker and free the shared memory.
+        """
+        self._running = False
+        self._stop_event.set()
+        if self._supervisor is not None:
+            self._supervisor.join(timeout=2)
+        if self._process is not None:
+            self._process.join(timeout=2)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1)
+        self.ring.close(unlink=True)
+        self.results.close(unlink=True)
+
+    def submit(self, frame, timestamp, mirror, preferred, idle=False):
+        """
+        Hand a captured BGR frame to the worker.
+
+        Args:
+            frame (numpy.ndarray): (H, W, 3) uint8 frame
+            timestamp (float): Monotonic capture time
+            mirror (bool): Whether detections should be mirrored, for front facing cameras
+            preferred (str): 'Left' or 'Right', the hand the ROI should follow
+            idle (bool): Whether to use the cheaper idle inference pass
+        """
+        self.ring.control[SharedFrameRing.PREFERRED] = HANDEDNESS_LABELS.index(preferred)
+        if frame.nbytes > self.ring.capacity:
+            frame = self._fit(frame)
+        if self.ring.write(frame, timestamp, mirror, idle):
+            self.frame_ready.set()
+
+    def _fit(self, frame):
+        """
+        Downscale a frame that is too large for the ring, keeping its aspect ratio.
+        Landmarks are normalized and gesture thresholds are in hand sizes, so
+        tracking works the same on the smaller frame.
+
+        Args:
+            frame (numpy.ndarray): (H, W, 3) uint8 frame larger than the ring capacity
+
+        Returns:
+            numpy.ndarray: Frame that fits in a ring slot
+        """
+        import cv2
+
+        height, width = frame.shape[:2]
+        scale = (self.ring.capacity / frame.nbytes) ** 0.5
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        if not self._oversize_reported:
+            self._oversize_reported = True
+            print(f"Camera frames of {width}x{height} do not fit the inference frame buffer, "
+                  f"downscaling them to {size[0]}x{size[1]}")
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    def next_result(self, timeout):
+        """
+        Wait for a result newer than the last one returned.
+
+        Args:
+            timeout (float): Seconds to wait
+
+        Returns:
+            numpy.void: Result record, or None if none arrived in time
+        """
+        if not self.result_ready.wait(timeout):
+            return None
+        self.result_ready.clear()
+        record = self.results.read()
+        if record is None:
+            return None
+        if int(record['sequence']) == self._last_sequence or int(record['state']) != STATE_READY:
+            return None
+        self._last_sequence = int(record['sequence'])
+        self.level = int(record['level'])
+        if record['frame_w'] == 0:
+            # The worker's "ready" announcement carries no frame
+            return None
+        return record
+
+    def _spawn(self):
+        """
+        Start a new worker process.
+        """
+        self._process = self._context.Process(
+            target=run_worker, name="nomouse-inference", daemon=True,
+            args=(self.ring.name, self.results.name, self.frame_ready, self.result_ready, self._stop_event,
+                  self.settings, self.factory))
+        self._process.start()
+
+    def _supervise(self):
+        """
+        Restart the worker whenever it exits unexpectedly.
+        """
+        failures = 0
+        while self._running:
+            self._process.join(timeout=0.5)
+            if not self._running or self._process.is_alive():
+                if self.ready:
+                    failures = 0
+                continue
+
+            print(f"Inference process exited with code {self._process.exitcode}, restarting")
+            self.results.recover()
+            self.ring.release()
+            failures += 1
+            self.restarts += 1
+            # Back off so a worker that crashes on startup does not spin
+            if self._stop_event.wait(min(0.5 * 2 ** (failures - 1), 10.0)):
+                return
+            self._spawn()
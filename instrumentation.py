@@ -0,0 +1,128 @@
+import csv
+import json
+import time
+import numpy as np
+
+# Stages timed by the pipeline, in the order a frame passes through them
+STAGES = (
+    "capture_age",  # driver buffer timestamp -> cap.read() returned, where the driver reports it
+    "read",         # cap.read() on the capture thread
+    "convert",      # cv2.cvtColor BGR -> RGB
+    "inference",    # hands.process
+    "draw",         # landmark overlay drawn by PreviewRenderer
+    "gestures",     # gesture evaluation and button/scroll handling
+    "mouse",        # cursor move on the mouse output
+    "photo",        # PhotoImage conversion on the Tk thread
+    "frame",        # whole inference-thread iteration
+    "cursor_age",   # capture timestamp -> cursor move handed to the mouse output; with async output
+                    # this is when the move is queued, not when it is sent
+)
+
+
+class LatencyStats:
+    """
+    Low-overhead per-stage latency recorder.
+    Samples are kept in a preallocated (stages x capacity) ring buffer in
+    milliseconds, so recording never allocates. When disabled, start() and
+    stop() return after a single attribute check.
+
+    Args:
+        capacity (int): Number of recent samples kept per stage
+        enabled (bool): Whether samples are recorded
+    """
+
+    def __init__(self, capacity=512, enabled=True):
+        self.capacity = capacity
+        self.enabled = enabled
+        self._index = {stage: i for i, stage in enumerate(STAGES)}
+        self._samples = np.zeros((len(STAGES), capacity), dtype=np.float32)
+        self._counts = [0] * len(STAGES)
+
+    def start(self):
+        """
+        Take a start timestamp for a stage.
+
+        Returns:
+            float: perf_counter() value, or 0.0 when disabled
+        """
+        if not self.enabled:
+            return 0.0
+        return time.perf_counter()
+
+    def stop(self, stage, start):
+        """
+        Record the time elapsed since start() for a stage.
+
+        Args:
+            stage (str): Stage name from STAGES
+            start (float): Value returned by start()
+        """
+        if not self.enabled:
+            return
+        self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage, seconds):
+        """
+        Record a duration measured elsewhere.
+
+        Args:
+            stage (str): Stage name from STAGES
+            seconds (float): Duration in seconds
+        """
+        if not self.enabled:
+            return
+        row = self._index[stage]
+        count = self._counts[row]
+        self._samples[row, count % self.capacity] = seconds * 1000.0
+        self._counts[row] = count + 1
+
+    def reset(self):
+        """
+        Discard all recorded samples.
+        """
+        self._counts = [0] * len(STAGES)
+
+    def summary(self):
+        """
+        Compute rolling percentiles for every stage that has samples.
+
+        Returns:
+            dict: Stage name -> {'count', 'p50', 'p95', 'p99'} with times in milliseconds
+        """
+        result = {}
+        for stage, row in self._index.items():
+            filled = min(self._counts[row], self.capacity)
+            if filled == 0:
+                continue
+            p50, p95, p99 = np.percentile(self._samples[row, :filled], (50, 95, 99))
+            result[stage] = {'count': self._counts[row], 'p50': float(p50),
+                             'p95': float(p95), 'p99': float(p99)}
+        return result
+
+    def dump_csv(self, path):
+        """
+        Write the current summary to a CSV file.
+
+        Args:
+            path (str): File to write
+        """
+        with open(path, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['stage', 'count', 'p50_ms', 'p95_ms', 'p99_ms'])
+            for stage, values in self.summary().items():
+                writer.writerow([stage, values['count'], f"{values['p50']:.3f}",
+                                 f"{values['p95']:.3f}", f"{values['p99']:.3f}"])
+
+    def dump_json(self, path):
+        """
+        Write the current summary to a JSON file.
+
+        Args:
+            path (str): File to write
+        """
+        with open(path, 'w') as json_file:
+            json.dump(self.summary(), json_file, indent=2)
+
+
+# Shared recorder used by the pipeline, processor and UI
+stats = LatencyStats()
@@ -0,0 +1,107 @@
+import numpy as np
+
+NUM_LANDMARKS = 21
+WRIST = 0
+INDEX_MCP = 5
+MIDDLE_MCP = 9
+
+
+def landmarks_to_array(hand_landmarks):
+    """
+    Convert a MediaPipe landmark list into a compact array.
+    Each protobuf landmark is read exactly once per frame.
+
+    Args:
+        hand_landmarks (mediapipe.framework.formats.landmark_pb2.NormalizedLandmarkList):
+            Detected hand landmarks
+
+    Returns:
+        numpy.ndarray: (21, 3) float32 array of normalized x, y, z coordinates
+    """
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+
+
+class LandmarkFrame:
+    """
+    One frame of hand landmarks as a (21, 3) float32 array.
+    This is the single representation used by cursor mapping, gesture tests,
+    recording/replay and benchmarks. Pixel positions and the pairwise distance
+    matrix are computed lazily in one NumPy operation and cached.
+
+    Args:
+        points (numpy.ndarray): (21, 3) normalized landmark coordinates
+        frame_w (int): Width of the frame the landmarks were detected in
+        frame_h (int): Height of the frame the landmarks were detected in
+        handedness (str): 'Left' or 'Right' as classified by MediaPipe
+        timestamp (float): Monotonic capture time of the frame in seconds
+        confidence (float): MediaPipe's handedness score for the detection
+        predicted (bool): True if the landmarks were extrapolated rather than inferred
+    """
+
+    def __init__(self, points, frame_w, frame_h, handedness=None, timestamp=None, confidence=None,
+                 predicted=False):
+        self.points = points
+        self.frame_w = frame_w
+        self.frame_h = frame_h
+        self.handedness = handedness
+        self.timestamp = timestamp
+        self.confidence = confidence
+        self.predicted = predicted
+        self._pixels = None
+        self._distances = None
+
+    @classmethod
+    def from_mediapipe(cls, hand_landmarks, frame_w, frame_h, handedness=None, timestamp=None):
+        """
+        Build a LandmarkFrame from MediaPipe output.
+
+        Args:
+            hand_landmarks (mediapipe.framework.formats.landmark_pb2.NormalizedLandmarkList):
+                Detected hand landmarks
+            frame_w (int): Frame width in pixels
+            frame_h (int): Frame height in pixels
+            handedness (str): 'Left' or 'Right' as classified by MediaPipe
+            timestamp (float): Monotonic capture time of the frame in seconds
+
+        Returns:
+            LandmarkFrame: Landmark array for the frame
+        """
+        return cls(landmarks_to_array(hand_landmarks), frame_w, frame_h, handedness, timestamp)
+
+    @property
+    def pixels(self):
+        """
+        Landmark x, y positions scaled to frame pixels.
+
+        Returns:
+            numpy.ndarray: (21, 2) float32 pixel coordinates
+        """
+        if self._pixels is None:
+            self._pixels = self.points[:, :2] * np.array([self.frame_w, self.frame_h], dtype=np.float32)
+        return self._pixels
+
+    @property
+    def distances(self):
+        """
+        Pairwise pixel distances between all landmarks.
+
+        Returns:
+            numpy.ndarray: (21, 21) float32 distance matrix
+        """
+        if self._distances is None:
+            pixels = self.pixels
+            deltas = pixels[:, None, :] - pixels[None, :, :]
+            self._distances = np.sqrt((deltas * deltas).sum(axis=-1))
+        return self._distances
+
+    @property
+    def hand_size(self):
+        """
+        Wrist to middle finger MCP length in pixels, the scale gesture thresholds are measured in.
+        Distances divided by it stay the same when the capture resolution or
+        inference scale changes.
+
+        Returns:
+            float: Hand size in pixels, at least 1
+        """
+        return max(float(self.distances[WRIST, MIDDLE_MCP]), 1.0)
@@ -0,0 +1,148 @@
+import threading
+import numpy as np
+import screeninfo
+
+
+class DesktopLayout:
+    """
+    Immutable snapshot of the virtual desktop.
+    Monitor rectangles are stored as an (N, 4) array of x0, y0, x1, y1 so that
+    mapping and clamping a point to the desktop is a handful of array operations.
+
+    Args:
+        rects (list): (x, y, width, height) tuple for each monitor
+    """
+
+    def __init__(self, rects):
+        if not rects:
+            raise ValueError("At least one monitor is required")
+
+        self.rects = np.array([(x, y, x + w, y + h) for x, y, w, h in rects], dtype=np.int64)
+        self.min_x = int(self.rects[:, 0].min())
+        self.min_y = int(self.rects[:, 1].min())
+        self.width = int(self.rects[:, 2].max()) - self.min_x
+        self.height = int(self.rects[:, 3].max()) - self.min_y
+
+    @property
+    def center(self):
+        """
+        Center point of the virtual desktop.
+
+        Returns:
+            tuple: (x, y) desktop coordinates
+        """
+        return self.min_x + self.width // 2, self.min_y + self.height // 2
+
+    def clamp(self, x, y):
+        """
+        Clamp a desktop point onto the nearest monitor.
+        Points in gaps between monitors of different sizes are moved to the
+        closest visible pixel.
+
+        Args:
+            x (float): Desktop x-coordinate
+            y (float): Desktop y-coordinate
+
+        Returns:
+            tuple: Clamped (x, y) integer coordinates
+        """
+        clamped_x = np.clip(x, self.rects[:, 0], self.rects[:, 2] - 1)
+        clamped_y = np.clip(y, self.rects[:, 1], self.rects[:, 3] - 1)
+        nearest = np.argmin((clamped_x - x) ** 2 + (clamped_y - y) ** 2)
+        return int(clamped_x[nearest]), int(clamped_y[nearest])
+
+    def map_normalized(self, nx, ny):
+        """
+        Map a normalized (0-1) position onto the desktop and clamp it to a monitor.
+
+        Args:
+            nx (float): Normalized x-coordinate
+            ny (float): Normalized y-coordinate
+
+        Returns:
+            tuple: Desktop (x, y) integer coordinates
+        """
+        return self.clamp(self.min_x + nx * self.width, self.min_y + ny * self.height)
+
+
+def query_monitor_rects():
+    """
+    Query the current monitor rectangles from the display server.
+
+    Returns:
+        list: (x, y, width, height) tuple for each monitor
+    """
+    return [(m.x, m.y, m.width, m.height) for m in screeninfo.get_monitors()]
+
+
+class MonitorGeometry:
+    """
+    Cached view of the monitor layout.
+    Querying screeninfo costs display-server round trips, so the layout is
+    refreshed on a slow background timer or when invalidate() is called,
+    and the frame loop only ever reads the cached DesktopLayout.
+
+    Args:
+        refresh_interval (float): Seconds between background refreshes
+        rects (list): Fixed (x, y, width, height) monitors; disables querying when given
+    """
+
+    def __init__(self, refresh_interval=5.0, rects=None):
+        self.refresh_interval = refresh_interval
+        self._static = rects is not None
+        self.layout = DesktopLayout(rects if self._static else query_monitor_rects())
+
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Start refreshing the layout in the background.
+        """
+        if self._static or self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, name="nomouse-monitors", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the background refresh thread.
+        """
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def invalidate(self):
+        """
+        Request an immediate refresh, e.g. after a display change or settings save.
+        Refreshes synchronously when the background thread is not running.
+        """
+        if self._thread is not None:
+            self._wake_event.set()
+        else:
+            self.refresh()
+
+    def refresh(self):
+        """
+        Query the monitors and swap in a new layout.
+        """
+        if self._static:
+            return
+        try:
+            self.layout = DesktopLayout(query_monitor_rects())
+        except Exception as e:
+            print(f"Error querying monitors: {e}")
+
+    def _refresh_loop(self):
+        """
+        Refresh the layout every refresh_interval seconds or when woken.
+        """
+        while not self._stop_event.is_set():
+            self._wake_event.wait(self.refresh_interval)
+            self._wake_event.clear()
+            if not self._stop_event.is_set():
+                self.refresh()
@@ -0,0 +1,85 @@
+import numpy as np
+from landmarks import LandmarkFrame
+
+
+class LandmarkPredictor:
+    """
+    Constant-velocity motion model for the tracked hand's landmarks.
+    Each real inference corrects the state and updates a per-landmark velocity
+    estimate (an alpha-beta filter, the steady-state form of a constant-velocity
+    Kalman filter). Between inferences, landmarks are extrapolated from the last
+    observation so the cursor can keep moving every frame.
+
+    Args:
+        beta (float): Velocity correction gain (0-1]; lower values smooth more
+        max_horizon (float): Longest extrapolation in seconds before prediction stops
+    """
+
+    def __init__(self, beta=0.5, max_horizon=0.2):
+        self.beta = beta
+        self.max_horizon = max_horizon
+        self.reset()
+
+    def reset(self):
+        """
+        Forget the current hand, e.g. when it leaves the frame.
+        """
+        self._hand = None
+        self._velocity = None
+
+    @property
+    def ready(self):
+        """
+        Whether there is a hand to extrapolate from.
+
+        Returns:
+            bool: True once a real observation has been made
+        """
+        return self._hand is not None
+
+    @property
+    def confidence(self):
+        """
+        Confidence of the last real observation.
+
+        Returns:
+            float: Detection score, or None if unknown
+        """
+        return self._hand.confidence if self._hand is not None else None
+
+    def update(self, hand):
+        """
+        Correct the model with a real inference.
+
+        Args:
+            hand (LandmarkFrame): Landmarks from hands.process
+        """
+        if self._hand is not None and hand.timestamp is not None and self._hand.timestamp is not None:
+            dt = hand.timestamp - self._hand.timestamp
+            if dt > 0:
+                predicted = self._hand.points + self._velocity * dt
+                self._velocity += self.beta * (hand.points - predicted) / dt
+        if self._velocity is None:
+            self._velocity = np.zeros_like(hand.points)
+        self._hand = hand
+
+    def predict(self, timestamp):
+        """
+        Extrapolate the landmarks to a later frame.
+
+        Args:
+            timestamp (float): Monotonic capture time of the frame to predict
+
+        Returns:
+            LandmarkFrame: Predicted landmarks marked predicted=True, or None if
+                there is no hand or the last observation is too old
+        """
+        if self._hand is None:
+            return None
+        dt = timestamp - self._hand.timestamp
+        if dt > self.max_horizon:
+            return None
+
+        hand = self._hand
+        return LandmarkFrame(hand.points + self._velocity * dt, hand.frame_w, hand.frame_h,
+                             hand.handedness, timestamp, hand.confidence, predicted=True)
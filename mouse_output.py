@@ -0,0 +1,390 @@
+import threading
+import time
+from collections import deque
+
+
+class PynputMouse:
+    """
+    Mouse output backed by pynput's Controller.
+    Buttons are addressed by name ('left' or 'right') so that the gesture code
+    does not depend on pynput, which needs a display server to import.
+    """
+
+    def __init__(self):
+        from pynput.mouse import Controller, Button
+
+        self._controller = Controller()
+        self._buttons = {'left': Button.left, 'right': Button.right}
+
+    @property
+    def position(self):
+        """
+        Current cursor position.
+
+        Returns:
+            tuple: (x, y) desktop coordinates
+        """
+        return self._controller.position
+
+    @position.setter
+    def position(self, value):
+        self._controller.position = value
+
+    def press(self, button):
+        """
+        Press a mouse button.
+
+        Args:
+            button (str): 'left' or 'right'
+        """
+        self._controller.press(self._buttons[button])
+
+    def release(self, button):
+        """
+        Release a mouse button.
+
+        Args:
+            button (str): 'left' or 'right'
+        """
+        self._controller.release(self._buttons[button])
+
+    def scroll(self, dx, dy):
+        """
+        Scroll the mouse wheel.
+
+        Args:
+            dx (int): Horizontal scroll steps
+            dy (int): Vertical scroll steps
+        """
+        self._controller.scroll(dx, dy)
+
+    def hold(self):
+        """
+        Stop any cursor motion in progress. Moves are immediate, so there is none.
+        """
+
+    def close(self):
+        """
+        Release the output. pynput needs no cleanup.
+        """
+
+
+class AsyncMouseOutput:
+    """
+    Mouse output that runs OS calls on its own thread.
+    The frame-processing thread only records intents, so inference never waits
+    on a display-server round trip. Consecutive moves are merged into the newest
+    one and issued at most `rate` times per second, while presses, releases and
+    scrolls are sent immediately and in the order they were requested, each at
+    the cursor position requested before it.
+
+    Args:
+        backend: Synchronous output to drive, e.g. PynputMouse
+        rate (float): Maximum cursor moves per second
+    """
+
+    def __init__(self, backend, rate=250.0):
+        self.backend = backend
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._intents = deque()
+        self._condition = threading.Condition()
+        self._position = backend.position
+        self._running = True
+        self._thread = threading.Thread(target=self._output_loop, name="nomouse-mouse", daemon=True)
+        self._thread.start()
+
+    @property
+    def position(self):
+        """
+        Most recently requested cursor position.
+
+        Returns:
+            tuple: (x, y) desktop coordinates
+        """
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        with self._condition:
+            self._position = value
+            if self._intents and self._intents[-1][0] == 'move':
+                # Coalesce: only the newest target of a run of moves matters
+                self._intents[-1] = ('move', value)
+            else:
+                self._intents.append(('move', value))
+                self._condition.notify()
+
+    def press(self, button):
+        """
+        Queue a button press.
+
+        Args:
+            button (str): 'left' or 'right'
+        """
+        self._queue(('press', button))
+
+    def release(self, button):
+        """
+        Queue a button release.
+
+        Args:
+            button (str): 'left' or 'right'
+        """
+        self._queue(('release', button))
+
+    def scroll(self, dx, dy):
+        """
+        Queue a scroll.
+
+        Args:
+            dx (int): Horizontal scroll steps
+            dy (int): Vertical scroll steps
+        """
+        self._queue(('scroll', (dx, dy)))
+
+    def hold(self):
+        """
+        Stop any cursor motion in progress. Queued moves are sent as requested.
+        """
+
+    def close(self):
+        """
+        Send any queued events and stop the output thread.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join(timeout=2)
+        self.backend.close()
+
+    def _queue(self, intent):
+        """
+        Append a button or scroll intent and wake the output thread.
+
+        Args:
+            intent (tuple): (kind, argument)
+        """
+        with self._condition:
+            self._intents.append(intent)
+            self._condition.notify()
+
+    def _output_loop(self):
+        """
+        Issue queued intents in order, rate limiting cursor moves.
+        """
+        next_move = 0.0
+        while True:
+            with self._condition:
+                while self._running and not self._intents:
+                    self._condition.wait()
+                if not self._intents and not self._running:
+                    return
+                intent = self._intents[0]
+                # Hold a lone move until the next move slot so later moves can merge into it
+                if intent[0] == 'move' and len(self._intents) == 1 and self._running:
+                    delay = next_move - time.monotonic()
+                    if delay > 0:
+                        self._condition.wait(delay)
+                        continue
+                self._intents.popleft()
+
+            kind, argument = intent
+            try:
+                if kind == 'move':
+                    self.backend.position = argument
+                    next_move = time.monotonic() + self.interval
+                elif kind == 'press':
+                    self.backend.press(argument)
+                elif kind == 'release':
+                    self.backend.release(argument)
+                else:
+                    self.backend.scroll(*argument)
+            except Exception as e:
+                print(f"Error sending mouse event: {e}")
+
+
+class InterpolatingMouseOutput:
+    """
+    Mouse output that moves the cursor at a higher rate than the camera.
+    Each new target from the tracking thread starts a short glide from the
+    current cursor position, and a scheduler thread on the monotonic clock
+    moves the cursor along it up to `rate` times per second.
+
+    In 'interpolate' mode the glide reaches the target after one measured
+    frame interval. In 'extrapolate' mode the cursor jumps to the target and
+    keeps moving along the last frame-to-frame velocity until the next target
+    arrives, for at most `max_extrapolation` seconds.
+
+    Button presses, releases, scrolls and hold() stop the glide at once and
+    put the cursor on the latest target, so clicks land where they were aimed.
+
+    Args:
+        backend: Output to drive, e.g. PynputMouse or AsyncMouseOutput
+        rate (float): Cursor updates per second, up to the display refresh rate
+        mode (str): 'interpolate' or 'extrapolate'
+        max_extrapolation (float): Longest extrapolation past a target in seconds
+    """
+
+    def __init__(self, backend, rate=120.0, mode='interpolate', max_extrapolation=0.05):
+        if mode not in ('interpolate', 'extrapolate'):
+            raise ValueError(f"Unknown interpolation mode: {mode}")
+        self.backend = backend
+        self.interval = 1.0 / rate
+        self.mode = mode
+        self.max_extrapolation = max_extrapolation
+        self._condition = threading.Condition()
+        self._position = backend.position
+        # glide from _start to _target, starting at _target_time
+        self._start = self._target = self._current = tuple(float(v) for v in self._position)
+        self._target_time = None
+        self._velocity = (0.0, 0.0)
+        self._frame_interval = 1 / 30
+        self._gliding = False
+        self._running = True
+        self._thread = threading.Thread(target=self._output_loop, name="nomouse-interpolate", daemon=True)
+        self._thread.start()
+
+    @property
+    def position(self):
+        """
+        Most recently requested cursor position.
+
+        Returns:
+            tuple: (x, y) desktop coordinates
+        """
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        now = time.monotonic()
+        target = (float(value[0]), float(value[1]))
+        with self._condition:
+            self._position = value
+            if self._target_time is not None:
+                dt = now - self._target_time
+                if 0 < dt < 0.5:
+                    self._frame_interval += 0.2 * (dt - self._frame_interval)
+                    self._velocity = ((target[0] - self._target[0]) / dt, (target[1] - self._target[1]) / dt)
+                else:
+                    self._velocity = (0.0, 0.0)
+            self._start = self._current
+            self._target = target
+            self._target_time = now
+            self._gliding = True
+            self._condition.notify()
+
+    def hold(self):
+        """
+        Stop gliding and leave the cursor on the latest target, e.g. in scroll mode.
+        """
+        with self._condition:
+            self._snap()
+
+    def press(self, button):
+        """
+        Press a mouse button at the latest target.
+
+        Args:
+            button (str): 'left' or 'right'
+        """
+        with self._condition:
+            self._snap()
+            self.backend.press(button)
+
+    def release(self, button):
+        """
+        Release a mouse button at the latest target.
+
+        Args:
+            button (str): 'left' or 'right'
+        """
+        with self._condition:
+            self._snap()
+            self.backend.release(button)
+
+    def scroll(self, dx, dy):
+        """
+        Scroll at the latest target.
+
+        Args:
+            dx (int): Horizontal scroll steps
+            dy (int): Vertical scroll steps
+        """
+        with self._condition:
+            self._snap()
+            self.backend.scroll(dx, dy)
+
+    def close(self):
+        """
+        Stop the scheduler thread and close the backend.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join(timeout=2)
+        self.backend.close()
+
+    def _snap(self):
+        """
+        End the glide on the latest target. Caller holds the condition lock.
+        """
+        if self._gliding or self._current != self._target:
+            self._gliding = False
+            self._current = self._start = self._target
+            self.backend.position = (int(self._target[0]), int(self._target[1]))
+
+    def _glide_position(self, now):
+        """
+        Cursor position along the current glide.
+
+        Args:
+            now (float): Monotonic time
+
+        Returns:
+            tuple: ((x, y) position, whether the glide has finished)
+        """
+        elapsed = now - self._target_time
+        target_x, target_y = self._target
+        if self.mode == 'interpolate':
+            progress = elapsed / self._frame_interval if self._frame_interval > 0 else 1.0
+            if progress >= 1.0:
+                return self._target, True
+            start_x, start_y = self._start
+            return (start_x + (target_x - start_x) * progress, start_y + (target_y - start_y) * progress), False
+
+        horizon = min(elapsed, self.max_extrapolation)
+        velocity_x, velocity_y = self._velocity
+        return (target_x + velocity_x * horizon, target_y + velocity_y * horizon), elapsed >= self.max_extrapolation
+
+    def _output_loop(self):
+        """
+        Move the cursor along the glide on a fixed monotonic schedule, sleeping while idle.
+        """
+        next_tick = time.monotonic()
+        while True:
+            with self._condition:
+                while self._running and not self._gliding:
+                    self._condition.wait()
+                    next_tick = time.monotonic()
+                if not self._running:
+                    return
+
+                now = time.monotonic()
+                position, finished = self._glide_position(now)
+                if finished:
+                    self._gliding = False
+                rounded = (int(position[0]), int(position[1]))
+                if rounded != (int(self._current[0]), int(self._current[1])):
+                    try:
+                        self.backend.position = rounded
+                    except Exception as e:
+                        print(f"Error moving mouse: {e}")
+                self._current = position
+
+                next_tick += self.interval
+                # After a stall, resume from now instead of catching up in a burst
+                if next_tick < now:
+                    next_tick = now + self.interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
@@ -0,0 +1,363 @@
+import threading
+import time
+from collections import deque
+from idle import IdleMonitor
+from instrumentation import stats
+
+
+class LatestFrameQueue:
+    """
+    Bounded queue that keeps only the newest items.
+    Producers never block: when the queue is full the oldest item is dropped,
+    so consumers always see the most recent frame available.
+
+    Args:
+        maxsize (int): Maximum number of items held before old ones are dropped
+    """
+
+    def __init__(self, maxsize=1):
+        self._items = deque(maxlen=maxsize)
+        self._condition = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item):
+        """
+        Add an item, discarding the oldest one if the queue is full.
+
+        Args:
+            item: Item to enqueue
+        """
+        with self._condition:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+            self._items.append(item)
+            self._condition.notify()
+
+    def get(self, timeout=None):
+        """
+        Wait for and return the newest item, discarding any older ones.
+
+        Args:
+            timeout (float): Seconds to wait, or None to wait forever
+
+        Returns:
+            The newest item, or None if the timeout expired
+        """
+        with self._condition:
+            if not self._items:
+                self._condition.wait(timeout)
+            if not self._items:
+                return None
+            item = self._items.pop()
+            self._items.clear()
+            return item
+
+    def get_nowait(self):
+        """
+        Return the newest item without waiting.
+
+        Returns:
+            The newest item, or None if the queue is empty
+        """
+        return self.get(timeout=0)
+
+    def clear(self):
+        """
+        Remove all queued items.
+        """
+        with self._condition:
+            self._items.clear()
+
+
+class TrackingPipeline:
+    """
+    Threaded capture -> inference -> preview pipeline.
+    Each stage runs on its own thread and hands work to the next one through a
+    LatestFrameQueue, so a slow stage drops stale frames instead of delaying
+    the cursor. The Tk main thread only consumes the newest preview image.
+    When the processor has an inference process, captured frames go to it
+    through shared memory and the inference stage only applies its results.
+    While no hand is in view, the idle monitor thins out frames, switches
+    inference to its cheaper pass and pauses the preview.
+
+    Args:
+        processor (GestureProcessor): Processor that runs hand tracking and mouse control
+        video_source (int): Index of the camera to open
+        renderer (PreviewRenderer): Renderer for UI preview images, or None for no preview
+        idle (IdleMonitor): Idle power mode state machine, or None to never go idle
+    """
+
+    def __init__(self, processor, video_source=0, renderer=None, idle=None):
+        self.processor = processor
+        self.video_source = int(video_source)
+        self.renderer = renderer
+        self.preview_enabled = renderer is not None
+        self.idle = idle if idle is not None else IdleMonitor(enabled=False)
+        self._gesture_table = None
+        self._preview_landmarks = None
+
+        self.capture_queue = LatestFrameQueue()
+        self.result_queue = LatestFrameQueue()
+        self.preview_queue = LatestFrameQueue()
+        # Recently submitted (timestamp, frame) pairs, so process mode previews each result on its own frame
+        self._submitted = deque(maxlen=8)
+        self._submitted_lock = threading.Lock()
+
+        self.fps = 0
+        self._frame_count = 0
+        self._last_fps_time = time.monotonic()
+
+        self._cap = None
+        self._pending_source = None
+        self._source_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """
+        Open the camera and start all pipeline stages.
+        """
+        self._stop_event.clear()
+        stages = [("capture", self._capture_loop), ("inference", self._inference_loop)]
+        if self.preview_enabled:
+            stages.append(("preview", self._preview_loop))
+
+        for name, target in stages:
+            thread = threading.Thread(target=target, name=f"nomouse-{name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """
+        Stop all pipeline stages and release the camera.
+        """
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=2)
+        self._threads = []
+
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+    def set_video_source(self, video_source):
+        """
+        Switch to a different camera.
+        The capture thread reopens the device, so the caller never blocks on it.
+
+        Args:
+            video_source (int): Index of the camera to open
+        """
+        with self._source_lock:
+            self._pending_source = int(video_source)
+
+    def latest_preview(self):
+        """
+        Get the newest preview image produced by the pipeline.
+
+        Returns:
+            PIL.Image.Image: Newest preview image, or None if there is no new one
+        """
+        return self.preview_queue.get_nowait()
+
+    def _open_capture(self, video_source):
+        """
+        Open the given camera, releasing the current one first.
+
+        Args:
+            video_source (int): Index of the camera to open
+        """
+        from capture import CameraCapture
+
+        if self._cap is not None:
+            self._cap.release()
+        self.video_source = video_source
+        self._cap = CameraCapture.from_config(video_source)
+        if self._cap.is_opened():
+            print(f"Camera {video_source}: {self._cap.describe()}")
+        else:
+            print(f"Camera {video_source} could not be opened")
+
+    def _capture_loop(self):
+        """
+        Read frames from the camera as fast as it delivers them.
+        Reading continuously keeps the driver's queue empty, so each frame is the newest one.
+        """
+        self._open_capture(self.video_source)
+
+        while not self._stop_event.is_set():
+            with self._source_lock:
+                pending_source, self._pending_source = self._pending_source, None
+            if pending_source is not None:
+                self._open_capture(pending_source)
+
+            due = not self.idle.idle or self.idle.frame_due(time.monotonic())
+            if not due and not self.idle.motion:
+                # Frames skipped while idle are grabbed without decoding, keeping the driver queue empty
+                if not self._cap.grab():
+                    time.sleep(0.05)
+                continue
+
+            started = stats.start()
+            frame, timestamp = self._cap.read()
+            stats.stop("read", started)
+            if frame is None:
+                # Avoid spinning when the camera is unplugged or busy
+                time.sleep(0.05)
+                continue
+            if self.idle.idle:
+                # Every idle frame updates the motion reference; a moving one is not skipped
+                moved = self.idle.motion and self.idle.moved(frame)
+                if not due and not moved:
+                    continue
+            if self._cap.driver_timestamps:
+                stats.record("capture_age", self._cap.driver_age)
+            inference_process = self.processor.inference_process
+            if inference_process is None:
+                self.capture_queue.put((timestamp, frame))
+                continue
+
+            # The worker process converts the frame itself
+            if self.processor.running:
+                inference_process.submit(frame, timestamp, self.processor.camera_orientation == "Front Facing",
+                                         self.processor.hand_preference, self.idle.idle)
+                if self.preview_enabled:
+                    with self._submitted_lock:
+                        self._submitted.append((timestamp, frame))
+
+    def _inference_loop(self):
+        """
+        Run hand tracking and mouse control on the newest captured frame.
+        """
+        if self.processor.inference_process is not None:
+            self._process_result_loop(self.processor.inference_process)
+            return
+
+        # Imported on the worker thread so the window appears before OpenCV has loaded
+        from inference import convert_to_rgb
+
+        rgb = None
+        while not self._stop_event.is_set():
+            item = self.capture_queue.get(timeout=0.1)
+            if item is None:
+                continue
+
+            timestamp, frame = item
+            frame_started = stats.start()
+            started = stats.start()
+            # Reused every frame; the unflipped camera frame is mirrored in the landmarks instead
+            rgb = convert_to_rgb(frame, rgb)
+            stats.stop("convert", started)
+            self.processor.process_image(rgb, timestamp)
+            self._update_idle()
+
+            if self.preview_enabled:
+                # The camera frame, not the reused RGB buffer, so the preview never sees it change
+                self.result_queue.put((timestamp, frame, self.processor.tracked_hand))
+
+            stats.stop("frame", frame_started)
+            self._count_frame()
+
+    def _process_result_loop(self, inference_process):
+        """
+        Drive mouse control from detections published by the inference process.
+
+        Args:
+            inference_process (InferenceProcess): Worker running hand inference
+        """
+        from inference_process import hands_from_record
+
+        while not self._stop_event.is_set():
+            self.processor.model_state = "ready" if inference_process.ready else "warming up"
+            record = inference_process.next_result(timeout=0.1)
+            if record is None:
+                if not self.processor.running:
+                    # No frames reach the worker while stopped; release held buttons here
+                    self.processor.process_detections((), time.monotonic())
+                    self._update_idle()
+                continue
+
+            timestamp = float(record['timestamp'])
+            stats.record("inference", float(record['inference_ms']) / 1000)
+            self.processor.process_detections(hands_from_record(record), timestamp)
+            self._update_idle()
+
+            if self.preview_enabled:
+                frame = self._submitted_frame(timestamp)
+                if frame is not None:
+                    self.result_queue.put((timestamp, frame, self.processor.tracked_hand))
+
+            self._count_frame()
+
+    def _submitted_frame(self, timestamp):
+        """
+        Find the frame an inference process result was computed from.
+
+        Args:
+            timestamp (float): Capture time carried by the result
+
+        Returns:
+            numpy.ndarray: The submitted frame, or None if it is no longer held
+        """
+        with self._submitted_lock:
+            for submitted_time, frame in self._submitted:
+                if submitted_time == timestamp:
+                    return frame
+        return None
+
+    def _preview_loop(self):
+        """
+        Render the newest processed frame for the UI at the renderer's own rate.
+        Frames that arrive between preview slots are dropped.
+        """
+        while not self._stop_event.is_set():
+            self.renderer.wait_for_slot(self._stop_event)
+            item = self.result_queue.get(timeout=0.1)
+            if item is None:
+                continue
+
+            if self.idle.idle:
+                # Nothing to show while idle; the window keeps the last image
+                continue
+
+            _, frame, hand = item
+            mirror = self.processor.camera_orientation == "Front Facing"
+            self.preview_queue.put(self.renderer.render(frame, hand, self._landmarks_to_draw(), mirror))
+
+    def _update_idle(self):
+        """
+        Advance the idle state machine after a frame and apply any change to inference.
+        Idle mode only applies while tracking; stopping tracking returns to the active state.
+        """
+        processor = self.processor
+        if not processor.running:
+            if self.idle.idle:
+                processor.set_idle(False)
+            self.idle.reset()
+            return
+        if self.idle.update(processor.tracked_hand is not None, time.monotonic()):
+            processor.set_idle(self.idle.idle)
+
+    def _landmarks_to_draw(self):
+        """
+        Get the landmarks used by the current gesture table, recomputed only when it is reloaded.
+
+        Returns:
+            numpy.ndarray: Landmark indices to draw on the preview
+        """
+        gesture_table = self.processor.gesture_table
+        if gesture_table is not self._gesture_table:
+            self._gesture_table = gesture_table
+            self._preview_landmarks = gesture_table.used_landmarks()
+        return self._preview_landmarks
+
+    def _count_frame(self):
+        """
+        Update the tracking frames-per-second counter.
+        """
+        self._frame_count += 1
+        now = time.monotonic()
+        if now - self._last_fps_time >= 1:
+            self.fps = self._frame_count
+            self._frame_count = 0
+            self._last_fps_time = now
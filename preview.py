@@ -0,0 +1,94 @@
+import time
+import numpy as np
+from PIL import Image
+from instrumentation import stats
+from landmarks import INDEX_MCP
+
+ANCHOR_COLOR = (255, 80, 80)
+LANDMARK_COLOR = (80, 220, 80)
+
+
+class PreviewRenderer:
+    """
+    Renders preview images for the UI at its own rate, independent of tracking.
+    Frames are downscaled, mirrored and converted to RGB in a reused buffer
+    before the tracked landmarks are drawn, and only the landmarks the gesture
+    table and cursor actually use are drawn.
+
+    Args:
+        fps (float): Target preview frame rate
+        scale (float): Factor applied to the frame size before conversion (0-1]
+    """
+
+    def __init__(self, fps=15.0, scale=1.0):
+        self.interval = 1.0 / fps if fps > 0 else 0.0
+        self.scale = min(max(scale, 0.1), 1.0)
+        self._buffer = None
+        self._next_render = 0.0
+
+    def wait_for_slot(self, stop_event):
+        """
+        Sleep until the next preview frame is due.
+
+        Args:
+            stop_event (threading.Event): Event that ends the wait early when set
+        """
+        delay = self._next_render - time.monotonic()
+        if delay > 0:
+            stop_event.wait(delay)
+        self._next_render = max(self._next_render + self.interval, time.monotonic())
+
+    def render(self, frame, hand, landmark_indices, mirror=False):
+        """
+        Produce one preview image.
+
+        Args:
+            frame (numpy.ndarray): BGR camera frame
+            hand (LandmarkFrame): Tracked hand, or None
+            landmark_indices (numpy.ndarray): Landmarks to draw
+            mirror (bool): Flip the image horizontally, for front facing cameras
+
+        Returns:
+            PIL.Image.Image: Preview image ready to paste into a PhotoImage
+        """
+        # Imported here so creating the renderer does not load OpenCV on the Tk thread
+        import cv2
+
+        frame_h, frame_w = frame.shape[:2]
+        out_w, out_h = int(frame_w * self.scale), int(frame_h * self.scale)
+        if self._buffer is None or self._buffer.shape[:2] != (out_h, out_w):
+            self._buffer = np.empty((out_h, out_w, 3), dtype=np.uint8)
+
+        if self.scale < 1.0:
+            cv2.resize(frame, (out_w, out_h), dst=self._buffer, interpolation=cv2.INTER_AREA)
+        else:
+            np.copyto(self._buffer, frame)
+        # Flipped and converted in place, at preview rate rather than tracking rate
+        if mirror:
+            cv2.flip(self._buffer, 1, dst=self._buffer)
+        cv2.cvtColor(self._buffer, cv2.COLOR_BGR2RGB, dst=self._buffer)
+
+        if hand is not None:
+            started = stats.start()
+            self._draw_landmarks(hand, landmark_indices, out_w, out_h)
+            stats.stop("draw", started)
+
+        return Image.fromarray(self._buffer)
+
+    def _draw_landmarks(self, hand, landmark_indices, out_w, out_h):
+        """
+        Draw the tracking anchor and gesture landmarks onto the preview buffer.
+
+        Args:
+            hand (LandmarkFrame): Tracked hand
+            landmark_indices (numpy.ndarray): Gesture landmarks to draw
+            out_w (int): Preview width in pixels
+            out_h (int): Preview height in pixels
+        """
+        import cv2
+
+        positions = (hand.points[:, :2] * (out_w, out_h)).astype(np.int32).tolist()
+        radius = max(2, int(4 * self.scale))
+        for index in landmark_indices:
+            cv2.circle(self._buffer, tuple(positions[index]), radius, LANDMARK_COLOR, -1)
+        cv2.circle(self._buffer, tuple(positions[INDEX_MCP]), radius + 2, ANCHOR_COLOR, -1)
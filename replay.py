@@ -0,0 +1,303 @@
+import argparse
+import time
+import numpy as np
+from landmarks import LandmarkFrame, NUM_LANDMARKS
+
+RECORDING_MAGIC = b'NOMOUSELM1\x00\x00\x00\x00\x00\x00'
+HANDEDNESS_CODES = {None: -1, 'Left': 0, 'Right': 1}
+HANDEDNESS_LABELS = {code: label for label, code in HANDEDNESS_CODES.items()}
+
+RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('handedness', 'i1'),
+    ('frame_w', '<u2'),
+    ('frame_h', '<u2'),
+    ('landmarks', '<f4', (NUM_LANDMARKS, 3)),
+])
+
+
+class LandmarkRecorder:
+    """
+    Writes per-frame landmarks to a compact binary recording.
+    The file is a fixed header followed by fixed-size RECORD_DTYPE records, so
+    it can be memory-mapped for replay without parsing. Frames with no hand are
+    recorded too, with handedness -1 and NaN landmarks.
+
+    Args:
+        path (str): Recording file to create
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._file.write(RECORDING_MAGIC)
+        self._record = np.zeros(1, dtype=RECORD_DTYPE)
+        self.frames = 0
+
+    def write(self, hand, timestamp):
+        """
+        Append one frame to the recording.
+
+        Args:
+            hand (LandmarkFrame): Tracked hand, or None if no hand was found
+            timestamp (float): Monotonic capture time of the frame
+        """
+        record = self._record[0]
+        record['timestamp'] = timestamp
+        if hand is None:
+            record['handedness'] = -1
+            record['frame_w'] = 0
+            record['frame_h'] = 0
+            record['landmarks'] = np.nan
+        else:
+            record['handedness'] = HANDEDNESS_CODES.get(hand.handedness, -1)
+            record['frame_w'] = hand.frame_w
+            record['frame_h'] = hand.frame_h
+            record['landmarks'] = hand.points
+        self._file.write(self._record.tobytes())
+        self.frames += 1
+
+    def close(self):
+        """
+        Flush and close the recording file.
+        """
+        self._file.close()
+
+
+def load_recording(path):
+    """
+    Memory-map a landmark recording.
+
+    Args:
+        path (str): Recording file written by LandmarkRecorder
+
+    Returns:
+        numpy.ndarray: Read-only array of RECORD_DTYPE records
+    """
+    with open(path, 'rb') as recording:
+        if recording.read(len(RECORDING_MAGIC)) != RECORDING_MAGIC:
+            raise ValueError(f"{path} is not a NoMouse landmark recording")
+    return np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=len(RECORDING_MAGIC))
+
+
+def iter_frames(records):
+    """
+    Turn recording records back into LandmarkFrames.
+
+    Args:
+        records (numpy.ndarray): Records from load_recording
+
+    Yields:
+        tuple: (timestamp, LandmarkFrame or None)
+    """
+    for record in records:
+        timestamp = float(record['timestamp'])
+        if record['handedness'] < 0:
+            yield timestamp, None
+        else:
+            yield timestamp, LandmarkFrame(np.array(record['landmarks']), int(record['frame_w']),
+                                           int(record['frame_h']),
+                                           HANDEDNESS_LABELS[int(record['handedness'])], timestamp)
+
+
+class FakeMouse:
+    """
+    Stand-in for the pynput mouse that logs every event instead of sending it.
+    Events are stamped with the replay clock so logs are deterministic and can
+    be diffed between versions.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.clock = 0.0
+        self._position = (0, 0)
+
+    @property
+    def position(self):
+        """
+        Last position the cursor was moved to.
+
+        Returns:
+            tuple: (x, y) desktop coordinates
+        """
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._position = (int(value[0]), int(value[1]))
+        self.events.append((self.clock, 'move', self._position[0], self._position[1]))
+
+    def press(self, button):
+        """
+        Log a button press.
+
+        Args:
+            button (str): 'left' or 'right'
+        """
+        self.events.append((self.clock, 'press', button))
+
+    def release(self, button):
+        """
+        Log a button release.
+
+        Args:
+            button (str): 'left' or 'right'
+        """
+        self.events.append((self.clock, 'release', button))
+
+    def scroll(self, dx, dy):
+        """
+        Log a scroll.
+
+        Args:
+            dx (int): Horizontal scroll steps
+            dy (int): Vertical scroll steps
+        """
+        self.events.append((self.clock, 'scroll', dx, dy))
+
+    def hold(self):
+        """
+        Nothing to stop; moves are logged as they are requested.
+        """
+
+    def close(self):
+        """
+        Nothing to release for the fake mouse.
+        """
+
+
+def create_replay_processor(rects=((0, 0, 1920, 1080),)):
+    """
+    Build a GestureProcessor for replay with a FakeMouse and a fixed monitor layout.
+
+    Args:
+        rects (tuple): (x, y, width, height) of each simulated monitor
+
+    Returns:
+        GestureProcessor: Processor that runs without a camera, model or display
+    """
+    from gesture_processor import GestureProcessor
+    from monitors import MonitorGeometry
+
+    return GestureProcessor(mouse=FakeMouse(), monitors=MonitorGeometry(rects=list(rects)), load_model=False)
+
+
+def replay(records, processor=None, realtime=False):
+    """
+    Feed a recording through GestureProcessor.process_landmarks.
+
+    Args:
+        records (numpy.ndarray): Records from load_recording
+        processor (GestureProcessor): Processor to drive; defaults to create_replay_processor()
+        realtime (bool): Sleep between frames to reproduce the original timing
+
+    Returns:
+        list: Mouse events logged by the processor's FakeMouse
+    """
+    if processor is None:
+        processor = create_replay_processor()
+    processor.start_tracking()
+
+    start_time = None
+    wall_start = time.monotonic()
+    for timestamp, hand in iter_frames(records):
+        if start_time is None:
+            start_time = timestamp
+        elapsed = timestamp - start_time
+
+        if realtime:
+            delay = elapsed - (time.monotonic() - wall_start)
+            if delay > 0:
+                time.sleep(delay)
+
+        processor.mouse.clock = elapsed
+        processor.process_landmarks(hand, timestamp)
+
+    return processor.mouse.events
+
+
+def compare_smoothers(records, smoothers=None):
+    """
+    Benchmark cursor smoothers on the raw cursor path of a recording.
+
+    Args:
+        records (numpy.ndarray): Records from load_recording
+        smoothers (dict): Name -> smoother; defaults to one of each SMOOTHING_METHODS
+
+    Returns:
+        dict: Name -> {'lag_px', 'jitter_px', 'cost_us'}. Lag is the mean distance
+            from the raw position, jitter the mean frame-to-frame change in velocity.
+    """
+    from smoothing import SMOOTHING_METHODS, create_smoother
+
+    if smoothers is None:
+        smoothers = {name: create_smoother(name) for name in SMOOTHING_METHODS}
+
+    processor = create_replay_processor()
+    path = [(timestamp, *processor.raw_cursor_position(hand))
+            for timestamp, hand in iter_frames(records) if hand is not None]
+    if len(path) < 3:
+        raise ValueError("Recording needs at least three frames with a hand")
+    raw = np.array([(x, y) for _, x, y in path], dtype=np.float64)
+
+    results = {}
+    for name, smoother in smoothers.items():
+        first_timestamp, first_x, first_y = path[0]
+        smoother.reset(first_x, first_y, first_timestamp)
+        output = np.empty_like(raw)
+
+        started = time.perf_counter()
+        for i, (timestamp, x, y) in enumerate(path):
+            output[i] = smoother.filter(x, y, timestamp)
+        elapsed = time.perf_counter() - started
+
+        results[name] = {
+            'lag_px': float(np.linalg.norm(output - raw, axis=1).mean()),
+            'jitter_px': float(np.linalg.norm(np.diff(output, n=2, axis=0), axis=1).mean()),
+            'cost_us': elapsed / len(path) * 1e6,
+        }
+    return results
+
+
+def format_event_log(events):
+    """
+    Format mouse events as one line of text per event.
+
+    Args:
+        events (list): Events logged by FakeMouse
+
+    Returns:
+        str: Event log suitable for diffing
+    """
+    return "\n".join(f"{event[0]:.6f} " + " ".join(str(value) for value in event[1:]) for event in events)
+
+
+def main():
+    """
+    Command-line entry point: replay a recording and print or save its event log.
+    """
+    parser = argparse.ArgumentParser(description="Replay a NoMouse landmark recording")
+    parser.add_argument("recording", help="recording file written with --record")
+    parser.add_argument("--realtime", action="store_true", help="replay at the original frame rate")
+    parser.add_argument("--output", help="write the event log to this file instead of stdout")
+    parser.add_argument("--compare-smoothers", action="store_true",
+                        help="benchmark every smoothing method on the recording instead of replaying it")
+    args = parser.parse_args()
+
+    if args.compare_smoothers:
+        print(f"{'method':<12} {'lag px':>8} {'jitter px':>10} {'cost us':>8}")
+        for name, result in compare_smoothers(load_recording(args.recording)).items():
+            print(f"{name:<12} {result['lag_px']:>8.1f} {result['jitter_px']:>10.2f} {result['cost_us']:>8.2f}")
+        return
+
+    events = replay(load_recording(args.recording), realtime=args.realtime)
+    log = format_event_log(events)
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(log + "\n")
+    else:
+        print(log)
+
+
+if __name__ == "__main__":
+    main()
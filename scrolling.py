@@ -0,0 +1,97 @@
+import math
+from config_manager import get_config_value
+
+
+class ScrollEngine:
+    """
+    Turns vertical hand velocity into scroll wheel steps.
+    Velocity is measured from frame timestamps, so scrolling feels the same at
+    any camera frame rate. Scroll speed grows faster than hand speed
+    (acceleration), and fractional steps are carried over between frames so
+    slow movements still scroll smoothly instead of being rounded away.
+
+    The engine is fed the raw, unsmoothed hand position on purpose: cursor
+    smoothers lag by a number of frames rather than a time, which would make
+    scrolling depend on the frame rate again. Tracking jitter is absorbed
+    here instead: a step takes about 1 / gain pixels of movement, and the
+    fractions jitter adds alternate in sign and cancel in the remainder.
+
+    Args:
+        gain (float): Scroll steps per pixel of hand movement at reference_speed
+        acceleration (float): Exponent applied to speed; 1 scrolls in proportion to movement
+        deadzone (float): Hand speed in pixels/second below which nothing scrolls
+        reference_speed (float): Hand speed in pixels/second at which gain applies exactly
+        smoothing (float): Time constant of the velocity low-pass filter in seconds
+        max_rate (float): Cap on scroll speed in steps per second
+    """
+
+    def __init__(self, gain=0.02, acceleration=1.5, deadzone=60.0, reference_speed=500.0,
+                 smoothing=0.02, max_rate=60.0):
+        self.gain = gain
+        self.acceleration = acceleration
+        self.deadzone = deadzone
+        self.reference_speed = reference_speed
+        self.smoothing = smoothing
+        self.max_rate = max_rate
+        self.reset(None, None)
+
+    def reset(self, y, timestamp):
+        """
+        Start measuring from a position, e.g. when scroll mode is entered.
+
+        Args:
+            y (float): Vertical hand position in desktop pixels
+            timestamp (float): Monotonic capture time of the position
+        """
+        self._y = y
+        self._timestamp = timestamp
+        self.velocity = 0.0
+        self._remainder = 0.0
+
+    def update(self, y, timestamp):
+        """
+        Advance to a new hand position.
+
+        Args:
+            y (float): Vertical hand position in desktop pixels
+            timestamp (float): Monotonic capture time of the position
+
+        Returns:
+            int: Whole scroll steps to send now; positive scrolls up
+        """
+        if self._timestamp is None or timestamp is None or timestamp <= self._timestamp:
+            self._y, self._timestamp = y, timestamp
+            return 0
+
+        dt = timestamp - self._timestamp
+        # Screen y grows downwards; moving the hand up scrolls up
+        measured = (self._y - y) / dt
+        self._y, self._timestamp = y, timestamp
+
+        alpha = dt / (self.smoothing + dt)
+        self.velocity += alpha * (measured - self.velocity)
+
+        speed = abs(self.velocity)
+        if speed <= self.deadzone:
+            self._remainder = 0.0
+            return 0
+
+        rate = self.gain * speed * (speed / self.reference_speed) ** (self.acceleration - 1)
+        rate = min(rate, self.max_rate)
+        self._remainder += math.copysign(rate * dt, self.velocity)
+
+        steps = int(self._remainder)
+        self._remainder -= steps
+        return steps
+
+
+def scroll_engine_from_config():
+    """
+    Build the scroll engine configured in the [scrolling] section of settings.ini.
+
+    Returns:
+        ScrollEngine: The configured engine
+    """
+    return ScrollEngine(gain=float(get_config_value('scrolling', 'gain', '0.02')),
+                        acceleration=float(get_config_value('scrolling', 'acceleration', '1.5')),
+                        deadzone=float(get_config_value('scrolling', 'deadzone', '60')))
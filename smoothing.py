@@ -0,0 +1,265 @@
+import math
+import numpy as np
+from config_manager import get_config_value
+
+SMOOTHING_METHODS = ("average", "one_euro", "predictive")
+
+
+class MovingAverageSmoother:
+    """
+    The original NoMouse smoothing: the average of the last few positions
+    blended with the previous output by a fixed factor.
+    History lives in a preallocated ring buffer with running sums, so each
+    update is O(1) and never allocates.
+
+    Args:
+        history_size (int): Number of positions averaged
+        smoothing_factor (float): Weight of the previous output (0-1)
+    """
+
+    def __init__(self, history_size=5, smoothing_factor=0.3):
+        self.history_size = history_size
+        self.smoothing_factor = smoothing_factor
+        self._history = np.zeros((history_size, 2), dtype=np.float64)
+        self._index = 0
+        self._count = 0
+        self._sum_x = self._sum_y = 0.0
+        self.previous_x = self.previous_y = 0
+
+    def reset(self, x, y, timestamp=None):
+        """
+        Fill the history with one position, e.g. the screen center when tracking starts.
+
+        Args:
+            x (int): Initial x-coordinate
+            y (int): Initial y-coordinate
+            timestamp (float): Unused; accepted for a uniform interface
+        """
+        self._history[:] = (x, y)
+        self._index = 0
+        self._count = self.history_size
+        self._sum_x = float(x) * self.history_size
+        self._sum_y = float(y) * self.history_size
+        self.previous_x = x
+        self.previous_y = y
+
+    def filter(self, x, y, timestamp=None):
+        """
+        Smooth one raw position.
+
+        Args:
+            x (int): Raw x-coordinate
+            y (int): Raw y-coordinate
+            timestamp (float): Unused; accepted for a uniform interface
+
+        Returns:
+            tuple: Smoothed (x, y) coordinates
+        """
+        if self._count == self.history_size:
+            old_x, old_y = self._history[self._index]
+            self._sum_x -= old_x
+            self._sum_y -= old_y
+        else:
+            self._count += 1
+        self._history[self._index] = (x, y)
+        self._sum_x += x
+        self._sum_y += y
+        self._index = (self._index + 1) % self.history_size
+
+        avg_x = self._sum_x / self._count
+        avg_y = self._sum_y / self._count
+
+        smoothed_x = int(self.previous_x * self.smoothing_factor + avg_x * (1 - self.smoothing_factor))
+        smoothed_y = int(self.previous_y * self.smoothing_factor + avg_y * (1 - self.smoothing_factor))
+
+        self.previous_x = smoothed_x
+        self.previous_y = smoothed_y
+
+        return smoothed_x, smoothed_y
+
+
+def _alpha(cutoff, dt):
+    """
+    Exponential smoothing factor for a low-pass filter.
+
+    Args:
+        cutoff (float): Cutoff frequency in Hz
+        dt (float): Time since the previous sample in seconds
+
+    Returns:
+        float: Smoothing factor (0-1]
+    """
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroSmoother:
+    """
+    One Euro filter (Casiez et al.): a low-pass filter whose cutoff rises with
+    hand speed, so a still hand is heavily smoothed while fast movements follow
+    with little lag. Uses real frame timestamps, so behavior does not depend on
+    the camera frame rate.
+
+    Args:
+        min_cutoff (float): Cutoff frequency in Hz when the hand is still
+        beta (float): How much the cutoff rises per pixel/second of speed
+        d_cutoff (float): Cutoff frequency in Hz for the speed estimate
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.007, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        # filtered x, y and filtered velocity dx, dy
+        self._state = np.zeros(4, dtype=np.float64)
+        self._timestamp = None
+
+    def reset(self, x, y, timestamp=None):
+        """
+        Restart the filter at a position.
+
+        Args:
+            x (int): Initial x-coordinate
+            y (int): Initial y-coordinate
+            timestamp (float): Monotonic time of the position, if known
+        """
+        self._state[:] = (x, y, 0.0, 0.0)
+        self._timestamp = timestamp
+
+    @property
+    def velocity(self):
+        """
+        Filtered cursor velocity.
+
+        Returns:
+            tuple: (dx, dy) in pixels per second
+        """
+        return self._state[2], self._state[3]
+
+    def filter(self, x, y, timestamp):
+        """
+        Smooth one raw position.
+
+        Args:
+            x (int): Raw x-coordinate
+            y (int): Raw y-coordinate
+            timestamp (float): Monotonic capture time of the position
+
+        Returns:
+            tuple: Smoothed (x, y) coordinates
+        """
+        state = self._state
+        if self._timestamp is None or timestamp <= self._timestamp:
+            if self._timestamp is None:
+                state[:] = (x, y, 0.0, 0.0)
+            self._timestamp = timestamp
+            return int(state[0]), int(state[1])
+
+        dt = timestamp - self._timestamp
+        self._timestamp = timestamp
+
+        prev_x, prev_y, prev_dx, prev_dy = state
+        alpha_d = _alpha(self.d_cutoff, dt)
+        dx = prev_dx + alpha_d * ((x - prev_x) / dt - prev_dx)
+        dy = prev_dy + alpha_d * ((y - prev_y) / dt - prev_dy)
+
+        alpha_x = _alpha(self.min_cutoff + self.beta * abs(dx), dt)
+        alpha_y = _alpha(self.min_cutoff + self.beta * abs(dy), dt)
+        new_x = prev_x + alpha_x * (x - prev_x)
+        new_y = prev_y + alpha_y * (y - prev_y)
+
+        state[0], state[1], state[2], state[3] = new_x, new_y, dx, dy
+        return int(new_x), int(new_y)
+
+
+class PredictiveSmoother:
+    """
+    One Euro filter followed by a short-horizon linear prediction.
+    The smoothed position is pushed forward along the filtered velocity by
+    the expected pipeline latency, so the cursor lands where the hand is now
+    rather than where it was when the frame was captured.
+
+    Args:
+        lead (float): Prediction horizon in seconds, typically the capture-to-cursor latency
+        max_lead_distance (float): Cap on the prediction offset in pixels
+        min_cutoff (float): One Euro cutoff frequency in Hz when the hand is still
+        beta (float): One Euro speed coefficient
+    """
+
+    def __init__(self, lead=0.04, max_lead_distance=150.0, min_cutoff=1.0, beta=0.007):
+        self.lead = lead
+        self.max_lead_distance = max_lead_distance
+        self.base = OneEuroSmoother(min_cutoff=min_cutoff, beta=beta)
+
+    def reset(self, x, y, timestamp=None):
+        """
+        Restart the filter at a position.
+
+        Args:
+            x (int): Initial x-coordinate
+            y (int): Initial y-coordinate
+            timestamp (float): Monotonic time of the position, if known
+        """
+        self.base.reset(x, y, timestamp)
+
+    def filter(self, x, y, timestamp):
+        """
+        Smooth and extrapolate one raw position.
+
+        Args:
+            x (int): Raw x-coordinate
+            y (int): Raw y-coordinate
+            timestamp (float): Monotonic capture time of the position
+
+        Returns:
+            tuple: Predicted (x, y) coordinates
+        """
+        smoothed_x, smoothed_y = self.base.filter(x, y, timestamp)
+        dx, dy = self.base.velocity
+        offset_x, offset_y = dx * self.lead, dy * self.lead
+        distance = math.hypot(offset_x, offset_y)
+        if distance > self.max_lead_distance:
+            offset_x *= self.max_lead_distance / distance
+            offset_y *= self.max_lead_distance / distance
+        return int(smoothed_x + offset_x), int(smoothed_y + offset_y)
+
+
+def create_smoother(method, **options):
+    """
+    Build a smoother by name.
+
+    Args:
+        method (str): One of SMOOTHING_METHODS
+        **options: Keyword arguments for the smoother class
+
+    Returns:
+        A smoother with reset() and filter() methods
+    """
+    if method == "average":
+        return MovingAverageSmoother(**options)
+    if method == "one_euro":
+        return OneEuroSmoother(**options)
+    if method == "predictive":
+        return PredictiveSmoother(**options)
+    raise ValueError(f"Unknown smoothing method: {method}")
+
+
+def smoother_from_config():
+    """
+    Build the smoother selected in the [smoothing] section of settings.ini.
+
+    Returns:
+        A smoother with reset() and filter() methods
+    """
+    method = get_config_value('smoothing', 'method', 'average')
+    min_cutoff = float(get_config_value('smoothing', 'min_cutoff', '1.0'))
+    beta = float(get_config_value('smoothing', 'beta', '0.007'))
+
+    if method == "one_euro":
+        return OneEuroSmoother(min_cutoff=min_cutoff, beta=beta)
+    if method == "predictive":
+        lead = float(get_config_value('smoothing', 'lead_ms', '40')) / 1000
+        return PredictiveSmoother(lead=lead, min_cutoff=min_cutoff, beta=beta)
+    if method != "average":
+        print(f"Unknown smoothing method '{method}', using average")
+    return MovingAverageSmoother()
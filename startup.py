@@ -0,0 +1,138 @@
+import argparse
+import importlib
+import subprocess
+import sys
+import time
+
+# Heavy third-party modules, in the order NoMouse needs them
+HEAVY_MODULES = ("numpy", "screeninfo", "pynput", "ttkthemes", "PIL.ImageTk", "cv2", "mediapipe")
+
+
+class StartupTimeline:
+    """
+    Records how long each startup phase takes, relative to when this module
+    was first imported (the start of NoMouse.py).
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.phases = []
+
+    def start(self):
+        """
+        Take a start timestamp for a phase.
+
+        Returns:
+            float: perf_counter() value
+        """
+        return time.perf_counter()
+
+    def stop(self, phase, start):
+        """
+        Record a phase that began at start() and ends now.
+
+        Args:
+            phase (str): Name of the phase
+            start (float): Value returned by start()
+        """
+        end = time.perf_counter()
+        self.phases.append((phase, start - self.origin, end - start))
+
+    def report(self):
+        """
+        Format the recorded phases as a table.
+
+        Returns:
+            str: One line per phase with its start offset and duration in milliseconds
+        """
+        lines = [f"{'phase':<24} {'at ms':>8} {'took ms':>8}"]
+        for phase, offset, duration in self.phases:
+            lines.append(f"{phase:<24} {offset * 1000:>8.0f} {duration * 1000:>8.0f}")
+        return "\n".join(lines)
+
+
+def time_cold_import(module):
+    """
+    Measure how long a module takes to import in a fresh interpreter.
+
+    Args:
+        module (str): Module name, e.g. 'cv2'
+
+    Returns:
+        float: Import time in seconds, or None if the module is not installed
+    """
+    code = ("import time; started = time.perf_counter(); "
+            f"import {module}; print(time.perf_counter() - started)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark_initialization():
+    """
+    Time NoMouse's own initialization steps in this process.
+
+    Returns:
+        list: (step, seconds or None if it failed) pairs
+    """
+    results = []
+
+    def measure(step, function):
+        """
+        Time one step, recording None if it raises.
+
+        Args:
+            step (str): Name of the step
+            function (callable): Step to run
+
+        Returns:
+            The step's return value, or None if it failed
+        """
+        started = time.perf_counter()
+        try:
+            value = function()
+        except Exception as e:
+            print(f"{step} failed: {e}")
+            results.append((step, None))
+            return None
+        results.append((step, time.perf_counter() - started))
+        return value
+
+    from config_manager import load_config
+    measure("load_config", load_config)
+    module = measure("import gesture_processor", lambda: importlib.import_module("gesture_processor"))
+    processor = None
+    if module is not None:
+        processor = measure("GestureProcessor", lambda: module.GestureProcessor(load_model=False))
+    if processor is not None:
+        measure("load_model (MediaPipe)", processor.load_model)
+        processor.close()
+    return results
+
+
+def main():
+    """
+    Command-line entry point: report cold import and initialization cost by module.
+    """
+    parser = argparse.ArgumentParser(description="Measure NoMouse startup cost")
+    parser.add_argument("--imports-only", action="store_true", help="skip the initialization benchmark")
+    args = parser.parse_args()
+
+    print(f"{'cold import':<24} {'ms':>8}")
+    for module in HEAVY_MODULES:
+        seconds = time_cold_import(module)
+        print(f"{module:<24} {'missing' if seconds is None else f'{seconds * 1000:.0f}':>8}")
+
+    if not args.imports_only:
+        print(f"\n{'initialization':<24} {'ms':>8}")
+        for step, seconds in benchmark_initialization():
+            print(f"{step:<24} {'failed' if seconds is None else f'{seconds * 1000:.0f}':>8}")
+
+
+# Shared timeline filled in by NoMouse.py and the model warm-up
+startup = StartupTimeline()
+
+
+if __name__ == "__main__":
+    main()
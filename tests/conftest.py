@@ -0,0 +1,24 @@
+import os
+import shutil
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    """
+    Run each test in a scratch directory holding a copy of the gesture table,
+    so nothing a test loads or saves touches the checked-in settings.
+
+    Returns:
+        pathlib.Path: The scratch directory
+    """
+    shutil.copy(os.path.join(ROOT, "hand_gestures_data.csv"), tmp_path)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,152 @@
+import itertools
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from landmarks import LandmarkFrame
+from replay import LandmarkRecorder, create_replay_processor, load_recording, replay
+
+FRAME_W = 640
+FRAME_H = 480
+
+_replay_count = itertools.count()
+
+# Landmark offsets from the wrist in pixels for an open right hand 100 px in size (wrist to middle MCP)
+OPEN_HAND = np.array([
+    (0, 0),
+    (-30, -20), (-50, -40), (-65, -55), (-80, -70),
+    (-25, -95), (-28, -135), (-30, -160), (-32, -185),
+    (0, -100), (0, -145), (0, -172), (0, -198),
+    (22, -95), (25, -135), (27, -158), (28, -180),
+    (42, -85), (48, -115), (52, -135), (55, -152),
+], dtype=np.float64)
+
+# Thumb tip positions that make each gesture in hand_gestures_data.csv
+THUMB_TIPS = {
+    "open": (-80, -70),
+    "left": (-34, -186),    # on the index fingertip
+    "right": (0, -190),     # on the middle fingertip
+    "scroll": (-28, -135),  # on the index PIP joint
+}
+
+
+def make_hand(pose="open", x=320, y=380, timestamp=0.0, size=100.0, frame_w=FRAME_W, frame_h=FRAME_H,
+              overrides=None):
+    """
+    Build a synthetic right hand.
+
+    Args:
+        pose (str): Key of THUMB_TIPS
+        x (float): Wrist x in pixels
+        y (float): Wrist y in pixels
+        timestamp (float): Capture time
+        size (float): Hand size in pixels
+        frame_w (int): Frame width in pixels
+        frame_h (int): Frame height in pixels
+        overrides (dict): Landmark index -> offset at 100 px hand size, applied after the pose
+
+    Returns:
+        LandmarkFrame: The hand
+    """
+    offsets = OPEN_HAND.copy()
+    offsets[4] = THUMB_TIPS[pose]
+    for index, offset in (overrides or {}).items():
+        offsets[index] = offset
+    pixels = offsets * (size / 100.0) + (x, y)
+    points = np.zeros((len(offsets), 3), dtype=np.float32)
+    points[:, 0] = pixels[:, 0] / frame_w
+    points[:, 1] = pixels[:, 1] / frame_h
+    return LandmarkFrame(points, frame_w, frame_h, "Right", timestamp)
+
+
+def gesture_session(start=100.0, fps=30.0, scale=1):
+    """
+    Frames of a short session: move, left click, scroll up, hand lost, right
+    click and hand lost again.
+
+    Args:
+        start (float): Timestamp of the first frame
+        fps (float): Frame rate
+        scale (int): Capture resolution as a multiple of 640x480; landmarks stay the same
+
+    Returns:
+        list: (timestamp, LandmarkFrame or None) for each frame
+    """
+    steps = []
+    steps += [("open", 300 + 5 * i, 380) for i in range(10)]
+    steps += [("left", 345, 380)] * 5
+    steps += [("open", 345, 380)] * 5
+    steps += [("scroll", 345, 380 - 8 * i) for i in range(20)]
+    steps += [None] * 5
+    steps += [("right", 330, 380)] * 3
+    steps += [None] * 2
+
+    frames = []
+    for index, step in enumerate(steps):
+        timestamp = start + index / fps
+        if step is None:
+            frames.append((timestamp, None))
+        else:
+            pose, x, y = step
+            frames.append((timestamp, make_hand(pose, x * scale, y * scale, timestamp, size=100.0 * scale,
+                                                frame_w=FRAME_W * scale, frame_h=FRAME_H * scale)))
+    return frames
+
+
+def scroll_session(fps, duration=1.0, speed=240.0, start=100.0):
+    """
+    Frames of the scroll gesture moving up at a constant speed.
+
+    Args:
+        fps (float): Frame rate
+        duration (float): Seconds of scrolling
+        speed (float): Hand speed in camera pixels per second
+        start (float): Timestamp of the first frame
+
+    Returns:
+        list: (timestamp, LandmarkFrame) for each frame
+    """
+    frames = []
+    for index in range(int(round(duration * fps)) + 1):
+        elapsed = index / fps
+        frames.append((start + elapsed, make_hand("scroll", 345, 380 - speed * elapsed, start + elapsed)))
+    return frames
+
+
+def write_recording(path, frames):
+    """
+    Record frames with LandmarkRecorder.
+
+    Args:
+        path (str): Recording file to create
+        frames (list): (timestamp, LandmarkFrame or None) pairs
+    """
+    recorder = LandmarkRecorder(path)
+    for timestamp, hand in frames:
+        recorder.write(hand, timestamp)
+    recorder.close()
+
+
+def replay_frames(frames, processor=None):
+    """
+    Record frames in the working directory and replay them through a processor.
+
+    Args:
+        frames (list): (timestamp, LandmarkFrame or None) pairs
+        processor (GestureProcessor): Processor to drive; defaults to create_replay_processor()
+
+    Returns:
+        list: FakeMouse events
+    """
+    # A new file each time, as an earlier replay's memory map may still be open
+    path = f"frames{next(_replay_count)}.nmrec"
+    write_recording(path, frames)
+    return replay(load_recording(path), processor if processor is not None else create_replay_processor())
+
+
+if __name__ == "__main__":
+    # Regenerates the checked-in recording: python tests/hands.py
+    write_recording(os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "gestures.nmrec"),
+                    gesture_session())
@@ -0,0 +1,118 @@
+import csv
+from gesture_table import GestureEngine, GestureTable, REFERENCE_HAND_SIZE
+from hands import gesture_session, make_hand, replay_frames
+from replay import create_replay_processor
+
+# Index fingertip of the synthetic hand; the thumb is placed above it for left click distances
+INDEX_TIP = (-32, -185)
+
+
+def pinch(distance, timestamp):
+    """
+    Hand with the thumb tip the given number of hand sizes from the index fingertip.
+    """
+    thumb = (INDEX_TIP[0], INDEX_TIP[1] + distance * 100)
+    return make_hand(x=345, timestamp=timestamp, overrides={4: thumb})
+
+
+def clicks(events):
+    """
+    Press and release events of a FakeMouse log, without times.
+    """
+    return [event[1:] for event in events if event[1] in ('press', 'release')]
+
+
+def pinch_frames(distances, fps=30.0, start=100.0):
+    """
+    One frame per thumb to index distance.
+    """
+    return [(start + index / fps, pinch(distance, start + index / fps)) for index, distance in enumerate(distances)]
+
+
+def test_hysteresis_holds_between_press_and_release_thresholds():
+    # left_click presses below 0.15 hand sizes and releases above 0.18
+    events = replay_frames(pinch_frames([1.0, 0.14, 0.16, 0.17, 0.16, 0.19, 0.16, 0.17, 0.14]))
+    assert clicks(events) == [('press', 'left'), ('release', 'left'), ('press', 'left')]
+
+
+def test_min_hold_ignores_short_pinches():
+    processor = create_replay_processor()
+    processor.gesture_table.min_hold[processor.gesture_table.index("left_click")] = 0.09
+
+    distances = [1.0, 0.1, 0.1, 1.0, 1.0, 0.1, 0.1, 0.1, 0.1, 0.1]
+    events = replay_frames(pinch_frames(distances), processor)
+
+    presses = [event for event in events if event[1] == 'press']
+    assert len(presses) == 1
+    # The long pinch starts on frame 5 and has held for 0.09 s by frame 8
+    assert abs(presses[0][0] - 8 / 30) < 1e-6
+
+
+def test_priority_scroll_suppresses_click():
+    # Index finger curled onto its PIP with the thumb on both: left_click and scroll both match
+    curled = {8: (-28, -140), 4: (-28, -137)}
+    frames = [(100.0 + index / 30, make_hand(x=345, timestamp=100.0 + index / 30, overrides=curled))
+              for index in range(5)]
+    processor = create_replay_processor()
+    events = replay_frames(frames, processor)
+
+    table = processor.gesture_table
+    assert processor.gesture_engine.active[table.index("left_click")]
+    assert processor.gesture_engine.action_active("scroll")
+    assert not processor.gesture_engine.action_active("left")
+    assert clicks(events) == []
+
+
+def test_engine_release_thresholds_default_to_press_thresholds(workdir):
+    with open("hand_gestures_data.csv", newline='') as source:
+        rows = list(csv.DictReader(source))
+    with open("plain.csv", 'w', newline='') as target:
+        fields = [field for field in rows[0] if not field.startswith('release_')]
+        writer = csv.DictWriter(target, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+    engine = GestureEngine(GestureTable.load("plain.csv"))
+    left = engine.table.index("left_click")
+    assert engine.update(pinch(0.14, 0.0), 0.0)[left]
+    assert not engine.update(pinch(0.16, 0.1), 0.1)[left]
+
+
+def write_pixel_table(path):
+    """
+    Rewrite the shipped gesture table in legacy pixel units.
+    """
+    with open("hand_gestures_data.csv", newline='') as source:
+        rows = list(csv.DictReader(source))
+    for row in rows:
+        row['units'] = 'px'
+        for key, value in row.items():
+            if key.startswith(('distance_', 'release_')) and float(value) > 0:
+                row[key] = f"{float(value) * REFERENCE_HAND_SIZE:g}"
+    with open(path, 'w', newline='') as target:
+        writer = csv.DictWriter(target, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_pixel_table_migrates_to_hand_sizes(workdir, capsys):
+    write_pixel_table("pixels.csv")
+    hand_table = GestureTable.load("hand_gestures_data.csv")
+    pixel_table = GestureTable.load("pixels.csv")
+    GestureTable.load("pixels.csv")
+
+    enabled = hand_table.enabled
+    assert (pixel_table.enabled == enabled).all()
+    assert (abs(pixel_table.thresholds - hand_table.thresholds)[enabled] < 1e-6).all()
+    assert (abs(pixel_table.release_thresholds - hand_table.release_thresholds)[enabled] < 1e-6).all()
+    # Reported once, not on every reload
+    assert capsys.readouterr().out.count("are in pixels") == 1
+
+
+def test_pixel_table_replays_the_same_at_any_resolution(workdir):
+    expected = replay_frames(gesture_session())
+
+    write_pixel_table("hand_gestures_data.csv")
+    assert replay_frames(gesture_session()) == expected
+    # The same hand filmed at twice the resolution is twice as many pixels across
+    assert replay_frames(gesture_session(scale=2)) == expected
@@ -0,0 +1,48 @@
+import time
+from hands import make_hand
+from inference_process import InferenceProcess, SharedResults, STATE_LOADING, STATE_READY
+
+
+def die_mid_write(results):
+    """
+    Leave the result record as a worker killed between its two sequence stores would.
+    """
+    record = results.record[0]
+    record['sequence'] = int(record['sequence']) + 1
+
+
+def test_next_result_returns_when_the_worker_died_mid_write():
+    process = InferenceProcess({})
+    try:
+        process.results.write(STATE_READY, timestamp=1.0, frame_w=640, frame_h=480)
+        die_mid_write(process.results)
+        process.result_ready.set()
+
+        started = time.monotonic()
+        assert process.next_result(0.1) is None
+        assert time.monotonic() - started < 1.0
+
+        # The restarted worker's next result is read normally
+        process.results.write(STATE_READY, timestamp=2.0, hands=[make_hand()], frame_w=640, frame_h=480)
+        process.result_ready.set()
+        result = process.next_result(0.1)
+        assert result is not None
+        assert result['timestamp'] == 2.0 and result['count'] == 1
+    finally:
+        process.stop()
+
+
+def test_recover_makes_the_record_readable():
+    results = SharedResults()
+    try:
+        results.write(STATE_READY, timestamp=1.0, frame_w=640, frame_h=480)
+        die_mid_write(results)
+        assert results.read() is None
+
+        results.recover()
+        record = results.read()
+        assert record is not None
+        assert int(record['sequence']) % 2 == 0
+        assert int(record['state']) == STATE_LOADING
+    finally:
+        results.close(unlink=True)
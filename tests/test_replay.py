@@ -0,0 +1,65 @@
+import os
+import numpy as np
+from conftest import DATA
+from hands import gesture_session, write_recording
+from replay import create_replay_processor, format_event_log, iter_frames, load_recording, replay
+
+RECORDING = os.path.join(DATA, "gestures.nmrec")
+EVENT_LOG = os.path.join(DATA, "gestures.log")
+
+
+def button_and_scroll_events(events):
+    """
+    Drop cursor moves from a FakeMouse event log.
+    """
+    return [event[1:] for event in events if event[1] != 'move']
+
+
+def test_recording_matches_event_log():
+    events = replay(load_recording(RECORDING), create_replay_processor())
+    with open(EVENT_LOG) as expected:
+        assert format_event_log(events) + "\n" == expected.read()
+
+
+def test_recording_gestures():
+    events = replay(load_recording(RECORDING), create_replay_processor())
+    actions = button_and_scroll_events(events)
+
+    scrolls = [action for action in actions if action[0] == 'scroll']
+    assert scrolls and all(action == ('scroll', 0, 1) for action in scrolls)
+    assert [action for action in actions if action[0] != 'scroll'] == [
+        ('press', 'left'), ('release', 'left'),
+        ('press', 'right'), ('release', 'right'),
+    ]
+    # The left click releases when the pinch opens, the right click when the hand is lost
+    release_right = next(event for event in events if event[1:] == ('release', 'right'))
+    assert release_right[0] == events[-1][0]
+
+
+def test_cursor_is_still_while_scrolling():
+    events = replay(load_recording(RECORDING), create_replay_processor())
+    scroll_times = [event[0] for event in events if event[1] == 'scroll']
+    moves = [event for event in events if event[1] == 'move']
+    assert not [move for move in moves if scroll_times[0] <= move[0] <= scroll_times[-1]]
+
+
+def test_recorder_round_trip(workdir):
+    frames = gesture_session()
+    write_recording("session.nmrec", frames)
+    replayed = list(iter_frames(load_recording("session.nmrec")))
+
+    assert len(replayed) == len(frames)
+    for (timestamp, hand), (replayed_timestamp, replayed_hand) in zip(frames, replayed):
+        assert replayed_timestamp == timestamp
+        if hand is None:
+            assert replayed_hand is None
+        else:
+            assert replayed_hand.handedness == hand.handedness
+            np.testing.assert_array_equal(replayed_hand.points, hand.points)
+
+
+def test_checked_in_recording_matches_script(workdir):
+    # Regenerate with python tests/hands.py if gesture_session changes
+    write_recording("session.nmrec", gesture_session())
+    with open("session.nmrec", 'rb') as generated, open(RECORDING, 'rb') as checked_in:
+        assert generated.read() == checked_in.read()
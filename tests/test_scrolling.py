@@ -0,0 +1,67 @@
+import random
+from hands import make_hand, scroll_session, replay_frames
+from scrolling import ScrollEngine
+
+
+def scrolled(events):
+    """
+    Total vertical scroll steps in a FakeMouse log.
+    """
+    return sum(event[3] for event in events if event[1] == 'scroll')
+
+
+def test_scroll_steps_do_not_depend_on_frame_rate():
+    totals = {fps: scrolled(replay_frames(scroll_session(fps))) for fps in (15, 30, 60)}
+    assert totals[30] > 5
+    assert max(totals.values()) - min(totals.values()) <= 1
+
+
+def test_scroll_direction_follows_hand():
+    assert scrolled(replay_frames(scroll_session(30, speed=240))) > 0
+    assert scrolled(replay_frames(scroll_session(30, speed=-240))) < 0
+
+
+def test_engine_steps_do_not_depend_on_frame_rate():
+    totals = []
+    for fps in (15, 30, 60, 120):
+        engine = ScrollEngine()
+        engine.reset(1000.0, 0.0)
+        frames = 2 * fps
+        totals.append(sum(engine.update(1000.0 - 800.0 * index / fps, index / fps) for index in range(1, frames + 1)))
+    assert max(totals) - min(totals) <= 1
+
+
+def test_engine_deadzone():
+    engine = ScrollEngine(deadzone=60.0)
+    engine.reset(500.0, 0.0)
+    assert sum(engine.update(500.0 - 50.0 * index / 30, index / 30) for index in range(1, 61)) == 0
+
+
+def jittering_hand(fps, amplitude, duration=2.0):
+    """
+    Frames of the scroll gesture held still with random tracking noise.
+    """
+    rng = random.Random(fps)
+    frames = []
+    for index in range(int(round(duration * fps))):
+        timestamp = 100.0 + index / fps
+        x = 345 + rng.uniform(-amplitude, amplitude)
+        y = 380 + rng.uniform(-amplitude, amplitude)
+        frames.append((timestamp, make_hand("scroll", x, y, timestamp)))
+    return frames
+
+
+def test_still_hand_with_jitter_does_not_scroll():
+    # Scrolling follows the raw, unsmoothed hand position, so tracking noise must not scroll
+    for fps in (15, 30, 60):
+        events = replay_frames(jittering_hand(fps, amplitude=5))
+        assert not [event for event in events if event[1] == 'scroll']
+
+
+def test_engine_ignores_jitter_without_deadzone():
+    for fps in (15, 30, 60):
+        rng = random.Random(fps)
+        engine = ScrollEngine(deadzone=0.0)
+        engine.reset(700.0, 0.0)
+        steps = [engine.update(700.0 + rng.uniform(-20.0, 20.0), index / fps) for index in range(1, 2 * fps + 1)]
+        assert not any(steps)
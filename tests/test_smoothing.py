@@ -0,0 +1,50 @@
+import numpy as np
+from hands import gesture_session, replay_frames
+from replay import create_replay_processor
+from smoothing import MovingAverageSmoother
+
+
+class ListAverager:
+    """
+    The list-based smoothing GestureProcessor used before smoothing.py, kept as the reference.
+    """
+
+    def __init__(self, x, y, history_size=5, smoothing_factor=0.3):
+        self.history_size = history_size
+        self.smoothing_factor = smoothing_factor
+        self.previous_x, self.previous_y = x, y
+        self.position_history = [(x, y)] * history_size
+
+    def smooth_position(self, x, y):
+        self.position_history.append((x, y))
+        if len(self.position_history) > self.history_size:
+            self.position_history.pop(0)
+
+        avg_x = sum(pos[0] for pos in self.position_history) / len(self.position_history)
+        avg_y = sum(pos[1] for pos in self.position_history) / len(self.position_history)
+
+        smoothed_x = int(self.previous_x * self.smoothing_factor + avg_x * (1 - self.smoothing_factor))
+        smoothed_y = int(self.previous_y * self.smoothing_factor + avg_y * (1 - self.smoothing_factor))
+        self.previous_x, self.previous_y = smoothed_x, smoothed_y
+        return smoothed_x, smoothed_y
+
+
+def test_moving_average_matches_list_averager():
+    rng = np.random.default_rng(12)
+    path = rng.integers(0, 3840, size=(500, 2))
+    for history_size, smoothing_factor in ((5, 0.3), (1, 0.0), (8, 0.7)):
+        smoother = MovingAverageSmoother(history_size, smoothing_factor)
+        smoother.reset(960, 540)
+        reference = ListAverager(960, 540, history_size, smoothing_factor)
+        for x, y in path:
+            assert smoother.filter(int(x), int(y)) == reference.smooth_position(int(x), int(y))
+
+
+def test_replayed_cursor_matches_list_averager():
+    frames = [(timestamp, hand) for timestamp, hand in gesture_session() if hand is not None][:20]
+    events = replay_frames(frames)
+
+    processor = create_replay_processor()
+    reference = ListAverager(*processor.monitors.layout.center)
+    expected = [reference.smooth_position(*processor.raw_cursor_position(hand)) for _, hand in frames]
+    assert [event[2:] for event in events if event[1] == 'move'] == expected